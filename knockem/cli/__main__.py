@@ -4,6 +4,7 @@ import logging
 from ._cleanup_genome import cleanup_genome
 from ._fetch_genome import fetch_genome
 from ._forward_to_slurm import forward_to_slurm
+from ._reconcile_counters import reconcile_counters
 from ._report_competition import report_competition
 
 if __name__ == "__main__":
@@ -47,6 +48,13 @@ if __name__ == "__main__":
     )
     parser_forward_to_slurm.set_defaults(func=forward_to_slurm)
 
+    # Subparser for the "reconcile-counters" command
+    parser_reconcile_counters = subparsers.add_parser(
+        "reconcile-counters",
+        help="Rebuild orchestration submission counters from scratch",
+    )
+    parser_reconcile_counters.set_defaults(func=reconcile_counters)
+
     # Subparser for the "report-competition" command
     parser_report_competition = subparsers.add_parser(
         "report-competition", help="Upload competition results to database"
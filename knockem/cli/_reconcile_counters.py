@@ -0,0 +1,10 @@
+import argparse
+import logging
+
+from ..service import orchestration as orch
+
+
+def reconcile_counters(args: argparse.Namespace) -> None:
+    logging.info("Rebuilding submission counters from competitions.")
+    orch.reconcile_submission_counters()
+    logging.info("Submission counters rebuilt successfully.")
@@ -36,6 +36,7 @@ def mongodb_data_api_request(
     action: str,
     collection: str,
     document: typing.Optional[dict] = None,
+    documents: typing.Optional[typing.List[dict]] = None,
     filter: typing.Optional[dict] = None,
     update: typing.Optional[dict] = None,
     projection: typing.Optional[dict] = None,
@@ -60,6 +61,8 @@ def mongodb_data_api_request(
     }
     if document is not None:
         payload["document"] = document
+    if documents is not None:
+        payload["documents"] = documents
     if filter is not None:
         payload["filter"] = filter
     if update is not None:
@@ -327,15 +330,12 @@ def add_competition(
     submissionId: str,
     userEmail: str,
 ) -> str:
-    row = with_common_columns(
-        "competitionId",
-        "_id",
+    row = _make_competition_row(
         assayId=assayId,
         competitionDesignation=competitionDesignation,
         genomeIdAlpha=genomeIdAlpha,
         genomeIdBeta=genomeIdBeta,
         knockoutSites=knockoutSites,
-        numKnockoutSites=len(knockoutSites.split()),
         submissionId=submissionId,
         userEmail=userEmail,
     )
@@ -346,6 +346,46 @@ def add_competition(
     return row["_id"]
 
 
+def add_competitions_bulk(competitions: typing.List[dict]) -> typing.List[str]:
+    """Add several competitions in one insert, returning their ids.
+
+    Each entry holds keyword arguments for `add_competition`.
+    """
+    rows = [
+        _make_competition_row(**competition) for competition in competitions
+    ]
+    if not rows:
+        return []
+    elif get_db() is None:
+        mongodb_data_api_request("insertMany", "competitions", documents=rows)
+    else:
+        get_db().competitions.insert_many(rows)
+    return [row["_id"] for row in rows]
+
+
+def _make_competition_row(
+    assayId: str,
+    competitionDesignation: dict,
+    genomeIdAlpha: str,
+    genomeIdBeta: str,
+    knockoutSites: str,
+    submissionId: str,
+    userEmail: str,
+) -> dict:
+    return with_common_columns(
+        "competitionId",
+        "_id",
+        assayId=assayId,
+        competitionDesignation=competitionDesignation,
+        genomeIdAlpha=genomeIdAlpha,
+        genomeIdBeta=genomeIdBeta,
+        knockoutSites=knockoutSites,
+        numKnockoutSites=len(knockoutSites.split()),
+        submissionId=submissionId,
+        userEmail=userEmail,
+    )
+
+
 def add_competition_result(
     assayId: str,
     competitionId: str,
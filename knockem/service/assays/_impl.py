@@ -1,4 +1,5 @@
 import json
+import typing
 
 from .. import orchestration as orch
 from ...common import records as rec
@@ -12,29 +13,64 @@ def add_competition(
     knockoutSites: str,
     competitionDesignation: dict,
 ) -> None:
-    competitionId = rec.add_competition(
-        assayId=assayDocument["assayId"],
-        competitionDesignation=competitionDesignation,
-        genomeIdAlpha=genomeIdAlpha,
-        genomeIdBeta=genomeIdBeta,
-        knockoutSites=knockoutSites,
-        submissionId=assayDocument["submissionId"],
-        userEmail=assayDocument["userEmail"],
+    add_competitions_bulk(
+        assayDocument,
+        [
+            dict(
+                genomeIdAlpha=genomeIdAlpha,
+                genomeIdBeta=genomeIdBeta,
+                knockoutSites=knockoutSites,
+                competitionDesignation=competitionDesignation,
+            ),
+        ],
     )
-    orch.enqueue_competition(
-        assayId=assayDocument["assayId"],
-        competitionDesignation=json.dumps(competitionDesignation),
-        competitionId=competitionId,
-        competitionTimeoutSeconds=assayDocument["competitionTimeoutSeconds"],
-        containerEnv=assayDocument["containerEnv"],
-        containerImage=assayDocument["containerImage"],
-        genomeIdAlpha=genomeIdAlpha,
-        genomeIdBeta=genomeIdBeta,
-        knockoutSites=knockoutSites,
-        maxCompetitionsActive=assayDocument["maxCompetitionsActive"],
-        maxCompetitionRetries=assayDocument["maxCompetitionRetries"],
-        submissionId=assayDocument["submissionId"],
-        userEmail=assayDocument["userEmail"],
+
+
+def add_competitions_bulk(
+    assayDocument: dict, competitions: typing.List[dict]
+) -> None:
+    """Add several competitions for an assay, with one records insert and
+    one orchestration transaction.
+
+    Each entry holds keyword arguments for `add_competition`, besides
+    `assayDocument`.
+    """
+    competitionIds = rec.add_competitions_bulk(
+        [
+            dict(
+                assayId=assayDocument["assayId"],
+                submissionId=assayDocument["submissionId"],
+                userEmail=assayDocument["userEmail"],
+                **competition,
+            )
+            for competition in competitions
+        ],
+    )
+    orch.enqueue_competitions_bulk(
+        [
+            dict(
+                assayId=assayDocument["assayId"],
+                competitionDesignation=json.dumps(
+                    competition["competitionDesignation"],
+                ),
+                competitionId=competitionId,
+                competitionTimeoutSeconds=assayDocument[
+                    "competitionTimeoutSeconds"
+                ],
+                containerEnv=assayDocument["containerEnv"],
+                containerImage=assayDocument["containerImage"],
+                genomeIdAlpha=competition["genomeIdAlpha"],
+                genomeIdBeta=competition["genomeIdBeta"],
+                knockoutSites=competition["knockoutSites"],
+                maxCompetitionsActive=assayDocument["maxCompetitionsActive"],
+                maxCompetitionRetries=assayDocument["maxCompetitionRetries"],
+                submissionId=assayDocument["submissionId"],
+                userEmail=assayDocument["userEmail"],
+            )
+            for competition, competitionId in zip(
+                competitions, competitionIds, strict=True
+            )
+        ],
     )
 
 
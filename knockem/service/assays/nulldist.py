@@ -5,7 +5,7 @@ from scipy import stats as scipy_stats
 from .. import orchestration as orch
 from ...analysis import score_competition
 from ...common import records as rec
-from ._impl import add_competition
+from ._impl import add_competitions_bulk
 
 
 def dispatch_depended_assays(assayDocument: dict) -> int:
@@ -18,18 +18,18 @@ def dispatch_depended_competitions(assayDocument: dict) -> int:
     else:
         logging.info("Dispatching competitions for nulldist assay.")
 
-    num_dispatched = 0
-    for replicate in range(100):
-        add_competition(
-            assayDocument=assayDocument,
+    competitions = [
+        dict(
             genomeIdAlpha=assayDocument["genomeIdAlpha"],
             genomeIdBeta=assayDocument["genomeIdAlpha"],
             knockoutSites="",
             competitionDesignation={"replicate": replicate},
         )
-        num_dispatched += 1
+        for replicate in range(100)
+    ]
+    add_competitions_bulk(assayDocument, competitions)
 
-    return num_dispatched
+    return len(competitions)
 
 
 def finalize_result(assayDocument: dict) -> dict:
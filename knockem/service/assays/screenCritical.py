@@ -3,7 +3,7 @@ import logging
 from .. import orchestration as orch
 from ...analysis import score_competition
 from ...common import records as rec
-from ._impl import add_competition, make_knockout_genome_id
+from ._impl import add_competitions_bulk, make_knockout_genome_id
 
 
 def dispatch_depended_assays(assayDocument: dict) -> int:
@@ -82,7 +82,7 @@ def dispatch_depended_competitions(assayDocument: dict) -> int:
     else:
         logging.info("Dispatching competitions for screenCritical assay.")
 
-    num_dispatched = 0
+    competitions = []
     genomeDocument = rec.get_genome_document(assayDocument["genomeIdAlpha"])
     for genomeSite in range(genomeDocument["genomeNumSites"]):
         knockoutSites = str(genomeSite)
@@ -91,16 +91,17 @@ def dispatch_depended_competitions(assayDocument: dict) -> int:
             genomeDocument=genomeDocument,
             knockoutSites=knockoutSites,
         )
-        add_competition(
-            assayDocument=assayDocument,
-            genomeIdAlpha=assayDocument["genomeIdAlpha"],
-            genomeIdBeta=genomeIdBeta,
-            knockoutSites=knockoutSites,
-            competitionDesignation={"genomeSite": genomeSite},
+        competitions.append(
+            dict(
+                genomeIdAlpha=assayDocument["genomeIdAlpha"],
+                genomeIdBeta=genomeIdBeta,
+                knockoutSites=knockoutSites,
+                competitionDesignation={"genomeSite": genomeSite},
+            ),
         )
-        num_dispatched += 1
+    add_competitions_bulk(assayDocument, competitions)
 
-    return num_dispatched
+    return len(competitions)
 
 
 def finalize_result(assayDocument: dict) -> dict:
@@ -5,14 +5,17 @@ from ...common import records as rec
 
 
 def competition_completion() -> int:
-    num_completed = 0
-    for competitionId in orch.iter_active_competitionIds():
-        if not rec.has_competition_result(competitionId):
-            continue
-
-        orch.complete_competition(competitionId)
-        num_completed += 1
+    # check records before writing, to not hold database write lock meanwhile
+    completedIds = [
+        competitionId
+        for competitionId in orch.iter_active_competitionIds()
+        if rec.has_competition_result(competitionId)
+    ]
+    with orch.unit_of_work():
+        for competitionId in completedIds:
+            orch.complete_competition(competitionId)
 
+    num_completed = len(completedIds)
     if num_completed > 0:
         logging.info(f"Completed {num_completed} competitions.")
     return num_completed
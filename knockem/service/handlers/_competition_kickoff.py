@@ -47,7 +47,8 @@ def _run_competition(document: dict) -> None:
 
 def competition_kickoff() -> int:
     num_launched = 0
-    for competitionId in orch.iter_pending_competitionIds():
+    # exhaust iterator first, so its transaction doesn't enclose activations
+    for competitionId in list(orch.iter_pending_competitionIds()):
         document = orch.get_competition_document(competitionId)
         if (
             orch.get_num_active_competitions(document["submissionId"])
@@ -61,9 +62,10 @@ def competition_kickoff() -> int:
                 document["containerEnv"],
             ]
         )
-        compete_two(document["containerImage"], envArgs)
-
+        # commit activation first, as container launch can't be rolled back
+        # if launch fails, competition times out and is requeued
         orch.activate_competition(competitionId)
+        compete_two(document["containerImage"], envArgs)
         num_launched += 1
 
     if num_launched > 0:
@@ -5,23 +5,32 @@ from .. import orchestration as orch
 
 def competition_timeout() -> int:
     num_requeued = 0
-    for competitionId in orch.iter_active_competitionIds():
-        document = orch.get_competition_document(competitionId)
-
-        cur_time = orch._get_time()
-        if (
-            cur_time - document["activationTimestamp"]
-            < document["competitionTimeoutSeconds"]
-        ):
-            continue
-
-        try_count = document["competitionRetryCount"]
-        if try_count >= document["maxCompetitionRetries"]:
-            orch.fail_competition(competitionId)
-            continue
+    failedIds = []
+    with orch.unit_of_work():
+        for competitionId in orch.iter_active_competitionIds():
+            document = orch.get_competition_document(competitionId)
+
+            cur_time = orch._get_time()
+            if (
+                cur_time - document["activationTimestamp"]
+                < document["competitionTimeoutSeconds"]
+            ):
+                continue
+
+            try_count = document["competitionRetryCount"]
+            if try_count >= document["maxCompetitionRetries"]:
+                failedIds.append(competitionId)
+                continue
 
-        orch.requeue_competition(competitionId, retry=try_count + 1)
-        num_requeued += 1
+            orch.requeue_competition(competitionId, retry=try_count + 1)
+            num_requeued += 1
+
+    # fail outside batch, as fail_competition raises after committing
+    for competitionId in failedIds:
+        try:
+            orch.fail_competition(competitionId)
+        except RuntimeError as e:
+            logging.error(e)
 
     if num_requeued > 0:
         logging.info(f"Requeued {num_requeued} competitions.")
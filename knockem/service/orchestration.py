@@ -1,4 +1,6 @@
-import functools
+import collections
+import contextlib
+import os
 import time
 import typing
 import warnings
@@ -12,12 +14,214 @@ def _get_time() -> int:
     return time.time_ns() // 1000000000
 
 
-@functools.lru_cache
+# per-process connections, as forked processes must not share SQLite handles
+_dbs: typing.Dict[int, dataset.Database] = {}
+
+
 def get_db() -> dataset.Database:
+    pid = os.getpid()
+    if pid not in _dbs:
+        for inherited in _dbs.values():  # from parent process, if forked
+            # leave parent's connections open, but unreachable from here
+            inherited.engine.dispose(close=False)
+        _dbs.clear()
+        _dbs[pid] = _connect_db()
+    return _dbs[pid]
+
+
+def _connect_db() -> dataset.Database:
     if get_runmode() == "testing":
-        return dataset.connect("sqlite:///knockem-testing.db")
+        url = "sqlite:///knockem-testing.db"
     else:
-        return dataset.connect("sqlite:///knockem-production.db")
+        url = "sqlite:///knockem-production.db"
+
+    db = dataset.connect(
+        url,
+        sqlite_wal_mode=True,  # readers proceed concurrently with writer
+        on_connect_statements=["PRAGMA busy_timeout = 5000"],
+    )
+    migrate_db(db)
+    return db
+
+
+@contextlib.contextmanager
+def unit_of_work() -> typing.Iterator[dataset.Database]:
+    """Batch orchestration calls into a single transaction.
+
+    Orchestration functions called within join this transaction, instead of
+    committing individually, so all writes commit together on exit, or roll
+    back together if an exception is raised.
+
+    Holds the database write lock from first write until exit, so keep units
+    short. Side effects outside the database, e.g., launching containers or
+    writing records, are not undone by rollback, so perform them outside any
+    unit of work.
+    """
+    with get_db() as tx:
+        yield tx
+
+
+# schema ======================================================================
+# common columns, added by with_common_columns
+_common_columns = """
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    datetime TEXT,
+    knockemRunmode TEXT,
+    knockemRevision TEXT,
+    knockemVersion TEXT,
+"""
+
+# rebuilds competition counts for each submission and assay from scratch
+_rebuild_submission_counters = [
+    "DELETE FROM submission_counters",
+    """INSERT INTO submission_counters (
+            counterId, submissionId, numPending, numActive, numCompleted,
+            numFailed
+        )
+        SELECT submissionId, submissionId,
+            SUM(status = 'pending'), SUM(status = 'active'),
+            SUM(status = 'completed'), SUM(status = 'failed')
+        FROM competitions GROUP BY submissionId
+        UNION ALL
+        SELECT assayId, MIN(submissionId),
+            SUM(status = 'pending'), SUM(status = 'active'),
+            SUM(status = 'completed'), SUM(status = 'failed')
+        FROM competitions GROUP BY assayId""",
+]
+
+# each entry migrates schema from version i to i + 1
+# note: only append new migrations, never edit applied migrations
+_schema_migrations = [
+    [
+        f"""CREATE TABLE IF NOT EXISTS submissions ({_common_columns}
+            activationTimestamp INTEGER,
+            competitionTimeoutSeconds INTEGER,
+            containerEnv TEXT,
+            containerImage TEXT,
+            genomeIdAlpha TEXT,
+            hasAssayDoseCalibration BOOLEAN,
+            hasAssayDoseTitration BOOLEAN,
+            hasAssayNulldist BOOLEAN,
+            hasAssayScreenCritical BOOLEAN,
+            hasAssaySkeletonization BOOLEAN,
+            maxCompetitionsActive INTEGER,
+            maxCompetitionRetries INTEGER,
+            status TEXT,
+            submissionId TEXT,
+            userEmail TEXT
+        )""",
+        f"""CREATE TABLE IF NOT EXISTS assays ({_common_columns}
+            assayDesignation JSON,
+            assayId TEXT,
+            assayType TEXT,
+            competitionTimeoutSeconds INTEGER,
+            containerEnv TEXT,
+            containerImage TEXT,
+            genomeIdAlpha TEXT,
+            maxCompetitionsActive INTEGER,
+            maxCompetitionRetries INTEGER,
+            status TEXT,
+            submissionId TEXT,
+            userEmail TEXT
+        )""",
+        f"""CREATE TABLE IF NOT EXISTS competitions ({_common_columns}
+            activationTimestamp INTEGER,
+            assayId TEXT,
+            competitionDesignation TEXT,
+            competitionId TEXT,
+            competitionRetryCount INTEGER,
+            competitionTimeoutSeconds INTEGER,
+            containerEnv TEXT,
+            containerImage TEXT,
+            genomeIdAlpha TEXT,
+            genomeIdBeta TEXT,
+            knockoutSites TEXT,
+            maxCompetitionsActive INTEGER,
+            maxCompetitionRetries INTEGER,
+            status TEXT,
+            submissionId TEXT,
+            userEmail TEXT
+        )""",
+        f"""CREATE TABLE IF NOT EXISTS dependencies ({_common_columns}
+            dependedById TEXT,
+            dependencyId TEXT,
+            dependsOnId TEXT,
+            submissionId TEXT,
+            userEmail TEXT
+        )""",
+        f"""CREATE TABLE IF NOT EXISTS users ({_common_columns}
+            apiToken TEXT,
+            userEmail TEXT
+        )""",
+        "CREATE INDEX IF NOT EXISTS submissions_submissionId "
+        "ON submissions (submissionId)",
+        "CREATE INDEX IF NOT EXISTS submissions_status "
+        "ON submissions (status)",
+        "CREATE INDEX IF NOT EXISTS assays_assayId ON assays (assayId)",
+        "CREATE INDEX IF NOT EXISTS assays_status ON assays (status)",
+        "CREATE INDEX IF NOT EXISTS assays_submissionId_status "
+        "ON assays (submissionId, status)",
+        "CREATE INDEX IF NOT EXISTS assays_submissionId_assayType "
+        "ON assays (submissionId, assayType)",
+        "CREATE INDEX IF NOT EXISTS competitions_competitionId "
+        "ON competitions (competitionId)",
+        "CREATE INDEX IF NOT EXISTS competitions_status "
+        "ON competitions (status)",
+        "CREATE INDEX IF NOT EXISTS competitions_submissionId_status "
+        "ON competitions (submissionId, status)",
+        "CREATE INDEX IF NOT EXISTS competitions_assayId "
+        "ON competitions (assayId)",
+        "CREATE INDEX IF NOT EXISTS dependencies_dependedById "
+        "ON dependencies (dependedById)",
+        "CREATE INDEX IF NOT EXISTS dependencies_dependsOnId "
+        "ON dependencies (dependsOnId)",
+        "CREATE INDEX IF NOT EXISTS dependencies_submissionId "
+        "ON dependencies (submissionId)",
+        "CREATE INDEX IF NOT EXISTS users_apiToken ON users (apiToken)",
+    ],
+    [
+        # competition counts by status, keyed by submissionId or assayId
+        """CREATE TABLE IF NOT EXISTS submission_counters (
+            counterId TEXT PRIMARY KEY,
+            submissionId TEXT NOT NULL,
+            numPending INTEGER NOT NULL DEFAULT 0,
+            numActive INTEGER NOT NULL DEFAULT 0,
+            numCompleted INTEGER NOT NULL DEFAULT 0,
+            numFailed INTEGER NOT NULL DEFAULT 0
+        )""",
+        "CREATE INDEX IF NOT EXISTS submission_counters_submissionId "
+        "ON submission_counters (submissionId)",
+        *_rebuild_submission_counters,
+    ],
+]
+
+# submission_counters column for each competition status
+_counter_columns = {
+    "active": "numActive",
+    "completed": "numCompleted",
+    "failed": "numFailed",
+    "pending": "numPending",
+}
+
+
+def get_schema_version(db: dataset.Database) -> int:
+    (row,) = db.query("PRAGMA user_version")
+    return row["user_version"]
+
+
+def migrate_db(db: dataset.Database) -> None:
+    """Bring database schema up to date, applying any pending migrations.
+
+    Schema version is recorded in SQLite's `user_version` header field.
+    Tables auto-created by earlier schemaless versions are kept as-is, but
+    gain indexes.
+    """
+    for version in range(get_schema_version(db), len(_schema_migrations)):
+        with db as tx:
+            for statement in _schema_migrations[version]:
+                tx.query(statement)
+            # note: PRAGMA does not support bound parameters
+            tx.query(f"PRAGMA user_version = {version + 1:d}")
 
 
 # tables ======================================================================
@@ -41,6 +245,10 @@ def get_api_tokens_table() -> str:
     return "users"
 
 
+def get_submission_counters_table() -> str:
+    return "submission_counters"
+
+
 # submissions =================================================================
 def activate_submission(submissionId: str) -> None:
     table = get_submissions_table()
@@ -102,6 +310,7 @@ def complete_submission(submissionId: str) -> None:
         tx[get_submissions_table()].delete(submissionId=submissionId)
         tx[get_assays_table()].delete(submissionId=submissionId)
         tx[get_competitions_table()].delete(submissionId=submissionId)
+        tx[get_submission_counters_table()].delete(submissionId=submissionId)
 
 
 def get_submission_document(submissionId: str) -> dict:
@@ -236,32 +445,120 @@ def iter_submission_assayIds_of_type(
 
 # competitions ================================================================
 def activate_competition(competitionId: str) -> None:
-    table = get_competitions_table()
     with get_db() as tx:
-        tx[table].update(
-            dict(
-                activationTimestamp=_get_time(),
-                competitionId=competitionId,
-                status="active",
-            ),
-            ["competitionId"],
+        _transition_competition(
+            tx, competitionId, "active", activationTimestamp=_get_time()
         )
 
 
 def requeue_competition(competitionId: str, retry: int) -> None:
-    table = get_competitions_table()
     with get_db() as tx:
-        tx[table].update(
+        _transition_competition(
+            tx, competitionId, "pending", competitionRetryCount=retry
+        )
+
+
+def _transition_competition(
+    tx: dataset.Database, competitionId: str, status: str, **columns: dict
+) -> None:
+    """Update competition status, shifting submission and assay counters
+    within the enclosing transaction."""
+    table = tx[get_competitions_table()]
+    row = table.find_one(competitionId=competitionId)
+    table.update(
+        dict(competitionId=competitionId, status=status, **columns),
+        ["competitionId"],
+    )
+    if row is None or row["status"] == status:
+        return
+
+    source = _counter_columns[row["status"]]
+    dest = _counter_columns[status]
+    tx.query(
+        f"""UPDATE {get_submission_counters_table()}
+        SET {source} = {source} - 1, {dest} = {dest} + 1
+        WHERE counterId IN (:submissionId, :assayId)""",
+        submissionId=row["submissionId"],
+        assayId=row["assayId"],
+    )
+
+
+def enqueue_competition(
+    assayId: str,
+    competitionDesignation: str,
+    competitionId: str,
+    competitionTimeoutSeconds: int,
+    containerEnv: str,
+    containerImage: str,
+    genomeIdAlpha: str,
+    genomeIdBeta: str,
+    knockoutSites: str,
+    maxCompetitionsActive: int,
+    maxCompetitionRetries: int,
+    submissionId: str,
+    userEmail: str,
+) -> None:
+    enqueue_competitions_bulk(
+        [
             dict(
+                assayId=assayId,
+                competitionDesignation=competitionDesignation,
                 competitionId=competitionId,
-                competitionRetryCount=retry,
-                status="pending",
+                competitionTimeoutSeconds=competitionTimeoutSeconds,
+                containerEnv=containerEnv,
+                containerImage=containerImage,
+                genomeIdAlpha=genomeIdAlpha,
+                genomeIdBeta=genomeIdBeta,
+                knockoutSites=knockoutSites,
+                maxCompetitionsActive=maxCompetitionsActive,
+                maxCompetitionRetries=maxCompetitionRetries,
+                submissionId=submissionId,
+                userEmail=userEmail,
             ),
-            ["competitionId"],
+        ],
+    )
+
+
+def enqueue_competitions_bulk(competitions: typing.List[dict]) -> None:
+    """Enqueue several competitions, and their assays' dependencies on them,
+    in one transaction.
+
+    Each entry holds keyword arguments for `enqueue_competition`.
+    """
+    rows = [
+        _make_competition_row(**competition) for competition in competitions
+    ]
+    dependency_rows = [
+        _make_dependency_row(
+            dependedById=row["assayId"],
+            dependsOnId=row["competitionId"],
+            submissionId=row["submissionId"],
+            userEmail=row["userEmail"],
         )
+        for row in rows
+    ]
+    num_enqueued = collections.Counter(
+        (counterId, row["submissionId"])
+        for row in rows
+        for counterId in (row["submissionId"], row["assayId"])
+    )
+    with get_db() as tx:
+        tx[get_competitions_table()].insert_many(rows)
+        tx[get_dependencies_table()].insert_many(dependency_rows)
+        for (counterId, submissionId), num in num_enqueued.items():
+            tx.query(
+                f"""INSERT INTO {get_submission_counters_table()}
+                (counterId, submissionId, numPending)
+                VALUES (:counterId, :submissionId, :num)
+                ON CONFLICT (counterId)
+                DO UPDATE SET numPending = numPending + excluded.numPending""",
+                counterId=counterId,
+                submissionId=submissionId,
+                num=num,
+            )
 
 
-def enqueue_competition(
+def _make_competition_row(
     assayId: str,
     competitionDesignation: str,
     competitionId: str,
@@ -275,8 +572,8 @@ def enqueue_competition(
     maxCompetitionRetries: int,
     submissionId: str,
     userEmail: str,
-) -> None:
-    row = with_common_columns(
+) -> dict:
+    return with_common_columns(
         activationTimestamp=0,
         assayId=assayId,
         competitionDesignation=competitionDesignation,
@@ -294,33 +591,17 @@ def enqueue_competition(
         submissionId=submissionId,
         userEmail=userEmail,
     )
-    with get_db() as tx:
-        tx[get_competitions_table()].insert(row)
-        add_dependency(
-            dependedById=assayId,
-            dependsOnId=row["competitionId"],
-            submissionId=submissionId,
-            userEmail=userEmail,
-        )
 
 
 def complete_competition(competitionId: str) -> None:
-    table = get_competitions_table()
     with get_db() as tx:
-        tx[table].update(
-            dict(competitionId=competitionId, status="completed"),
-            ["competitionId"],
-        )
+        _transition_competition(tx, competitionId, "completed")
         resolve_dependencies_on(dependsOnId=competitionId)
 
 
 def fail_competition(competitionId: str) -> None:
-    table = get_competitions_table()
     with get_db() as tx:
-        tx[table].update(
-            dict(competitionId=competitionId, status="failed"),
-            ["competitionId"],
-        )
+        _transition_competition(tx, competitionId, "failed")
     raise RuntimeError(f"Competition {competitionId} has failed.")
 
 
@@ -359,8 +640,7 @@ def iter_assay_competitionIds(assayId: str) -> typing.Iterator[str]:
 def add_dependency(
     dependedById: str, dependsOnId: str, submissionId: str, userEmail: str
 ) -> str:
-    row = with_common_columns(
-        "dependencyId",
+    row = _make_dependency_row(
         dependedById=dependedById,
         dependsOnId=dependsOnId,
         submissionId=submissionId,
@@ -372,6 +652,18 @@ def add_dependency(
     return row["dependencyId"]
 
 
+def _make_dependency_row(
+    dependedById: str, dependsOnId: str, submissionId: str, userEmail: str
+) -> dict:
+    return with_common_columns(
+        "dependencyId",
+        dependedById=dependedById,
+        dependsOnId=dependsOnId,
+        submissionId=submissionId,
+        userEmail=userEmail,
+    )
+
+
 def depends_on_unresolved(dependedById: str) -> bool:
     table = get_dependencies_table()
     with get_db() as tx:
@@ -385,6 +677,45 @@ def resolve_dependencies_on(dependsOnId: str) -> None:
 
 
 # counters ====================================================================
+def get_submission_counts(submissionId: str) -> typing.Optional[dict]:
+    """Count submission's dependencies, and its assays and competitions by
+    status, in one query.
+
+    Returns None if submission is not enqueued. Otherwise, returns dict
+    with keys "numDependencies", and "num{Status}Assays" and
+    "num{Status}Competitions" for each of statuses "Active", "Completed",
+    "Failed", and "Pending".
+    """
+    query = f"""
+        SELECT 'submissions' AS tbl, NULL AS status, COUNT(*) AS num
+        FROM {get_submissions_table()} WHERE submissionId = :submissionId
+        UNION ALL
+        SELECT 'dependencies', NULL, COUNT(*)
+        FROM {get_dependencies_table()} WHERE submissionId = :submissionId
+        UNION ALL
+        SELECT 'assays', status, COUNT(*)
+        FROM {get_assays_table()} WHERE submissionId = :submissionId
+        GROUP BY status
+        UNION ALL
+        SELECT 'competitions', status, COUNT(*)
+        FROM {get_competitions_table()} WHERE submissionId = :submissionId
+        GROUP BY status
+    """
+    with get_db() as tx:
+        rows = [*tx.query(query, submissionId=submissionId)]
+
+    counts = {(row["tbl"], row["status"]): row["num"] for row in rows}
+    if not counts[("submissions", None)]:
+        return None
+
+    res = {"numDependencies": counts[("dependencies", None)]}
+    for status in "active", "completed", "failed", "pending":
+        for table in "assays", "competitions":
+            key = f"num{status.capitalize()}{table.capitalize()}"
+            res[key] = counts.get((table, status), 0)
+    return res
+
+
 def get_num_dependencies(submissionId: str) -> int:
     table = get_dependencies_table()
     with get_db() as tx:
@@ -415,28 +746,32 @@ def get_num_pending_assays(submissionId: str) -> int:
         return tx[table].count(submissionId=submissionId, status="pending")
 
 
-def get_num_active_competitions(submissionId: str) -> int:
-    table = get_competitions_table()
+def get_competition_counts(counterId: str) -> dict:
+    """Look up maintained competition counts by status, for a submissionId
+    or assayId."""
+    table = get_submission_counters_table()
     with get_db() as tx:
-        return tx[table].count(submissionId=submissionId, status="active")
+        row = tx[table].find_one(counterId=counterId)
+    return {
+        status: 0 if row is None else row[column]
+        for status, column in _counter_columns.items()
+    }
+
+
+def get_num_active_competitions(submissionId: str) -> int:
+    return get_competition_counts(submissionId)["active"]
 
 
 def get_num_completed_competitions(submissionId: str) -> int:
-    table = get_competitions_table()
-    with get_db() as tx:
-        return tx[table].count(submissionId=submissionId, status="completed")
+    return get_competition_counts(submissionId)["completed"]
 
 
 def get_num_failed_competitions(submissionId: str) -> int:
-    table = get_competitions_table()
-    with get_db() as tx:
-        return tx[table].count(submissionId=submissionId, status="failed")
+    return get_competition_counts(submissionId)["failed"]
 
 
 def get_num_pending_competitions(submissionId: str) -> int:
-    table = get_competitions_table()
-    with get_db() as tx:
-        return tx[table].count(submissionId=submissionId, status="pending")
+    return get_competition_counts(submissionId)["pending"]
 
 
 def get_num_assay_competitions(assayId: str) -> int:
@@ -445,6 +780,14 @@ def get_num_assay_competitions(assayId: str) -> int:
         return tx[table].count(assayId=assayId)
 
 
+def reconcile_submission_counters() -> None:
+    """Rebuild maintained competition counts from competitions table, e.g.,
+    to repair counters after manual edits."""
+    with get_db() as tx:
+        for statement in _rebuild_submission_counters:
+            tx.query(statement)
+
+
 # cleanup =====================================================================
 def purge_submission(submissionId: str) -> None:
     with get_db() as tx:
@@ -456,6 +799,7 @@ def purge_testing() -> None:
     with get_db() as tx:
         for table in tx.tables:
             tx[table].delete(knockemRunmode="testing")
+        reconcile_submission_counters()  # counters lack runmode column
 
 
 def purge_work() -> None:
@@ -464,6 +808,7 @@ def purge_work() -> None:
             get_assays_table(),
             get_competitions_table(),
             get_dependencies_table(),
+            get_submission_counters_table(),
             get_submissions_table(),
         ]:
             tx[table].delete()
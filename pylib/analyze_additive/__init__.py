@@ -1,10 +1,14 @@
+from ._assay_additive_adaptive import assay_additive_adaptive
 from ._assay_additive_naive import assay_additive_naive
+from ._bootstrap_negbinom_fits import bootstrap_negbinom_fits
 from ._fit_negbinom_quantiles import fit_negbinom_quantiles
 from ._pick_doses_extrema import pick_doses_extrema
 from ._sample_knockout import sample_knockout
 
 __all__ = [
+    "assay_additive_adaptive",
     "assay_additive_naive",
+    "bootstrap_negbinom_fits",
     "fit_negbinom_quantiles",
     "pick_doses_extrema",
     "sample_knockout",
@@ -0,0 +1,225 @@
+from numbers import Number
+import typing
+import warnings
+
+import numpy as np
+
+from ..auxlib._nbinom_cdf_grid import nbinom_cdf_grid
+from ._fit_negbinom_quantiles import fit_negbinom_quantiles
+from ._sample_knockout import sample_knockout
+
+
+def assay_additive_adaptive(
+    test_knockout: typing.Callable,
+    num_sites: int,
+    knockout_doses: typing.List[int],
+    target_relative_error: float = 0.1,
+    max_replications: typing.Optional[int] = None,
+    num_pilot_replications: int = 20,
+    batch_size: int = 10,
+    rng: typing.Optional[np.random.Generator] = None,
+) -> dict:
+    """Use knockout tests to estimate the prevalence of additive small-effect
+    sites in genome and the average effect size of small-effect sites,
+    allocating replicate knockout trials adaptively among doses.
+
+    After pilot replicates at every dose, batches of replicates are allocated
+    one at a time to the dose expected to most reduce uncertainty in the
+    negative binomial fit. Allocation stops once the relative standard error
+    of both fit parameters reaches `target_relative_error`, or the replicate
+    budget `max_replications` is exhausted.
+
+    Parameters
+    ----------
+    test_knockout : typing.Callable
+        A function that tests the effect of a knockout, returning True if a
+        knockout effect was detected and False otherwise.
+
+        It should take boolean mask, e.g., produced by `sample_knockout`.
+    num_sites : int
+        Number of sites in genome
+    knockout_doses : typing.List[int]
+        A list of knockout doses (i.e., numbers of sites knocked out) to test.
+
+        Can be generated by `pick_doses_extrema`.
+    target_relative_error : float, default 0.1
+        Stop once the asymptotic standard error of fit parameters r and p
+        relative to their estimates is at most this value.
+    max_replications : int, optional
+        Total budget of replicate knockout trials, summed over doses. If None,
+        defaults to 100 replicates per dose, i.e., the default total for
+        `assay_additive_naive`.
+    num_pilot_replications : int, default 20
+        Number of replicate knockout trials to perform at each dose before
+        allocating adaptively.
+    batch_size : int, default 10
+        Number of replicate knockout trials allocated per adaptive step.
+    rng : np.random.Generator, optional
+        Source of randomness for sampling knockouts. If None, numpy's global
+        random state is used.
+
+    Returns
+    -------
+    dict
+        A dictionary containing entries as described for
+        `assay_additive_naive`, except that "dose outcomes" is a list of
+        per-dose outcome arrays, which may differ in length. Additionally
+        contains:
+        - "dose replications": Number of replicate knockout trials performed
+          for each dose.
+        - "relative standard errors": Asymptotic standard errors of fit
+          parameters r and p relative to their estimates, at stopping.
+
+    Notes
+    -----
+    Fits refine p by continuous optimization, but hold r to integers (see
+    `fit_negbinom_quantiles`).
+
+    Each replicate at dose d observes a Bernoulli outcome with probability
+    F_d, the fit negative binomial CDF at d. Its Fisher information for
+    (r, p) is j_d j_d^T / (F_d (1 - F_d)), where j_d is the gradient of F_d
+    with respect to (r, p). Batches are allocated to the dose maximizing
+    j_d^T Sigma j_d / (F_d (1 - F_d)), with Sigma the current parameter
+    covariance, which greedily maximizes the determinant of total Fisher
+    information (i.e., D-optimal design).
+
+    F_d is evaluated with the same CDF as the fit, `nbinom_cdf_grid`. As r
+    is fit over integers, its gradient component is a difference over unit
+    steps in r.
+
+    See Also
+    --------
+    assay_additive_naive : Performs a fixed number of replicates per dose.
+    """
+    if max_replications is None:
+        max_replications = 100 * len(knockout_doses)
+
+    def check_effect(effect: Number) -> Number:
+        if effect < 0:
+            raise NotImplementedError(
+                f"Adaptive knockout effect {effect} ocurred; "
+                "adaptive additive assay only accounts for "
+                "neutral or deleterious knockout effects",
+            )
+
+        return effect
+
+    dose_outcomes = [[] for __ in knockout_doses]
+
+    def replicate(dose_index: int, num_replications: int) -> None:
+        dose = knockout_doses[dose_index]
+        dose_outcomes[dose_index].extend(
+            np.sign(
+                check_effect(
+                    test_knockout(sample_knockout(dose, num_sites, rng))
+                ),
+            )
+            for __ in range(num_replications)
+        )
+
+    def fit() -> dict:
+        sensitivities = [np.mean(outcomes) for outcomes in dose_outcomes]
+        return fit_negbinom_quantiles(
+            knockout_doses, sensitivities, refine=True
+        )
+
+    for dose_index in range(len(knockout_doses)):
+        replicate(dose_index, num_pilot_replications)
+
+    while True:
+        with warnings.catch_warnings():  # only warn for final fit
+            warnings.simplefilter("ignore")
+            current_fit = fit()
+        informations, covariance = _calc_fisher_information(
+            knockout_doses,
+            [*map(len, dose_outcomes)],
+            current_fit["r"],
+            current_fit["p"],
+        )
+        relative_errors = np.sqrt(np.diag(covariance)) / [
+            current_fit["r"],
+            current_fit["p"],
+        ]
+        num_performed = sum(map(len, dose_outcomes))
+        if (
+            np.all(relative_errors <= target_relative_error)
+            or num_performed >= max_replications
+        ):
+            break
+
+        if np.isfinite(covariance).all():
+            gains = np.einsum(
+                "dij,ij->d", informations, covariance
+            )  # == j_d^T Sigma j_d / (F_d (1 - F_d))
+        else:  # no precision estimate yet, prefer most informative dose
+            gains = np.trace(informations, axis1=1, axis2=2)
+        replicate(
+            int(np.argmax(gains)),
+            min(batch_size, max_replications - num_performed),
+        )
+
+    final_fit = fit()
+    sensitivities = [np.mean(outcomes) for outcomes in dose_outcomes]
+    return {
+        "num additive sites": final_fit["p"] * num_sites,
+        "per-site effect size": 1 / final_fit["r"],
+        "negative binomial fit": final_fit,
+        "knockout doses": knockout_doses,
+        "dose sensitivies": sensitivities,
+        "dose outcomes": [
+            np.array(outcomes, dtype=float) for outcomes in dose_outcomes
+        ],
+        "dose replications": [*map(len, dose_outcomes)],
+        "relative standard errors": tuple(relative_errors),
+    }
+
+
+def _calc_fisher_information(
+    knockout_doses: typing.List[int],
+    dose_replications: typing.List[int],
+    r: float,
+    p: float,
+) -> typing.Tuple[np.array, np.array]:
+    """Implementation detail for `assay_additive_adaptive` that computes
+    per-replicate Fisher information for (r, p) at each dose, with shape
+    (len(knockout_doses), 2, 2), and the parameter covariance given
+    `dose_replications`, with shape (2, 2).
+
+    Covariance is infinite if total information is singular.
+    """
+    doses = np.asarray(knockout_doses)
+
+    def cdf(r: float, p: float) -> np.array:
+        # same model as fit_negbinom_quantiles, which floors failure count
+        return nbinom_cdf_grid(doses, r, p)
+
+    eps = np.sqrt(np.finfo(float).eps)
+    # r is fit over integers, so difference over unit steps, staying >= 1
+    # central finite difference for p, shrinking step to stay within (0, 1]
+    h_p = eps * min(p, 1.0 - p) if p < 1.0 else eps * p
+    gradients = np.stack(
+        [
+            (cdf(r + 1, p) - cdf(r - 1, p)) / 2
+            if r >= 2
+            else cdf(r + 1, p) - cdf(r, p),
+            (cdf(r, p + h_p) - cdf(r, p - h_p)) / (2 * h_p)
+            if p < 1.0
+            else (cdf(r, p) - cdf(r, p - h_p)) / h_p,
+        ],
+        axis=-1,
+    )
+    sensitivities = np.clip(cdf(r, p), eps, 1 - eps)
+    informations = (
+        gradients[:, :, None]
+        * gradients[:, None, :]
+        / (sensitivities * (1 - sensitivities))[:, None, None]
+    )
+
+    total_information = np.tensordot(
+        np.asarray(dose_replications, dtype=float), informations, axes=1
+    )
+    if np.linalg.cond(total_information) > 1 / eps:
+        covariance = np.full((2, 2), np.inf)
+    else:
+        covariance = np.linalg.inv(total_information)
+    return informations, covariance
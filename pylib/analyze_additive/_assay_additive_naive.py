@@ -3,6 +3,7 @@ import typing
 
 import numpy as np
 
+from ._bootstrap_negbinom_fits import bootstrap_negbinom_fits
 from ._fit_negbinom_quantiles import fit_negbinom_quantiles
 from ._sample_knockout import sample_knockout
 
@@ -12,6 +13,10 @@ def assay_additive_naive(
     num_sites: int,
     knockout_doses: typing.List[int],
     num_replications: int = 100,
+    rng: typing.Optional[np.random.Generator] = None,
+    num_bootstraps: int = 0,
+    confidence_level: float = 0.95,
+    workers: typing.Optional[int] = None,
 ) -> dict:
     """Use knockout tests to estimate the prevalence of additive small-effect
     sites in genome and the average effect size of small-effect sites.
@@ -31,6 +36,17 @@ def assay_additive_naive(
         Can be generated by `pick_doses_extrema`.
     num_replications : int, default 100
         The number of replicate knockout trials to perform at each dose level.
+    rng : np.random.Generator, optional
+        Source of randomness for sampling knockouts. If None, numpy's global
+        random state is used.
+    num_bootstraps : int, default 0
+        Number of bootstrap resamples of replicate outcomes to refit for
+        confidence intervals. If 0, no confidence intervals are computed.
+    confidence_level : float, default 0.95
+        Coverage of bootstrap percentile confidence intervals.
+    workers : int, optional
+        Number of worker processes for bootstrap refits, as described for
+        `bootstrap_negbinom_fits`.
 
     Returns
     -------
@@ -43,6 +59,16 @@ def assay_additive_naive(
         - "knockout doses": List of knockout doses used.
         - "dose sensitivities": List of sensitivity values (fraction knockout
           trials with a detectable effect) for each dose.
+        - "dose outcomes": Array of replicate knockout outcomes, with shape
+          (len(knockout_doses), num_replications).
+
+        If `num_bootstraps` is positive, also contains:
+        - "num additive sites ci": Bootstrap percentile confidence interval
+          (lower, upper) for number of additive sites.
+        - "per-site effect size ci": Bootstrap percentile confidence interval
+          (lower, upper) for effect size per site.
+        - "bootstrap fits": Array of negative binomial fit parameters r and p
+          for each bootstrap resample, with shape (num_bootstraps, 2).
 
     Notes
     -----
@@ -72,27 +98,48 @@ def assay_additive_naive(
 
         return effect
 
-    sensitivities = [
-        np.mean(
+    dose_outcomes = np.array(
+        [
             [
                 np.sign(
                     check_effect(
-                        test_knockout(sample_knockout(dose, num_sites))
+                        test_knockout(sample_knockout(dose, num_sites, rng))
                     ),
                 )
                 for __ in range(num_replications)
-            ],
-        )
-        for dose in knockout_doses
-    ]
+            ]
+            for dose in knockout_doses
+        ],
+        dtype=float,
+    ).reshape(len(knockout_doses), num_replications)
+    sensitivities = [*dose_outcomes.mean(axis=1)]
     fit = fit_negbinom_quantiles(
         knockout_doses,
         sensitivities,
     )
-    return {
+    result = {
         "num additive sites": fit["p"] * num_sites,
         "per-site effect size": 1 / fit["r"],
         "negative binomial fit": fit,
         "knockout doses": knockout_doses,
         "dose sensitivies": sensitivities,
+        "dose outcomes": dose_outcomes,
     }
+
+    if num_bootstraps:
+        bootstrap_fits = bootstrap_negbinom_fits(
+            knockout_doses,
+            dose_outcomes,
+            num_bootstraps,
+            workers=workers,
+            rng=rng,
+        )
+        r, p = bootstrap_fits.T
+        quantiles = [(1 - confidence_level) / 2, (1 + confidence_level) / 2]
+        result["num additive sites ci"] = (
+            *np.quantile(p * num_sites, quantiles),
+        )
+        result["per-site effect size ci"] = (*np.quantile(1 / r, quantiles),)
+        result["bootstrap fits"] = bootstrap_fits
+
+    return result
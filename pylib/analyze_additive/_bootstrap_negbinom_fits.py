@@ -0,0 +1,137 @@
+from concurrent import futures as concurrent_futures
+import functools
+from multiprocessing import shared_memory
+import typing
+import warnings
+
+import numpy as np
+
+from ..auxlib._or_global_rng import or_global_rng
+from ._fit_negbinom_quantiles import fit_negbinom_quantiles
+
+# worker-process view of outcome matrix, set up by _attach_outcomes
+_shared_outcomes: typing.Optional[np.array] = None
+_shared_memory: typing.Optional[shared_memory.SharedMemory] = None
+
+
+def bootstrap_negbinom_fits(
+    knockout_doses: typing.List[int],
+    dose_outcomes: np.array,
+    num_bootstraps: int,
+    workers: typing.Optional[int] = None,
+    rng: typing.Optional[np.random.Generator] = None,
+) -> np.array:
+    """Refit negative binomial distribution to bootstrap resamples of
+    replicate knockout outcomes.
+
+    Replicate outcomes are resampled with replacement independently within
+    each dose, and the negative binomial distribution is refit to resampled
+    dose sensitivities as in `assay_additive_naive`.
+
+    Parameters
+    ----------
+    knockout_doses : typing.List[int]
+        Knockout doses (i.e., numbers of sites knocked out) tested.
+    dose_outcomes : np.array
+        Replicate knockout outcomes, with shape (len(knockout_doses),
+        num_replications). Entries are 1 where a knockout effect was detected
+        and 0 otherwise.
+    num_bootstraps : int
+        Number of bootstrap resamples to fit.
+    workers : int, optional
+        Number of worker processes. If None, uses the number of processors on
+        the machine. If 1, fits run serially in the calling process.
+
+        Worker processes share `dose_outcomes` through shared memory.
+    rng : np.random.Generator, optional
+        Source of randomness for bootstrap resampling. If None, numpy's global
+        random state is used.
+
+    Returns
+    -------
+    np.array
+        Fit parameters r and p for each resample, with shape
+        (num_bootstraps, 2).
+
+    Notes
+    -----
+    Fit warnings (e.g., parameters at the edge of the search range) are
+    suppressed for resamples.
+    """
+    dose_outcomes = np.asarray(dose_outcomes, dtype=float)
+    if dose_outcomes.shape[:1] != (len(knockout_doses),):
+        raise ValueError(
+            f"dose_outcomes shape {dose_outcomes.shape} does not match "
+            f"{len(knockout_doses)} knockout doses.",
+        )
+
+    # derive independent resampling streams from rng
+    entropy = or_global_rng(rng).choice(np.iinfo(np.int32).max, size=4)
+    seed_sequences = np.random.SeedSequence(entropy).spawn(num_bootstraps)
+    do_bootstrap = functools.partial(_fit_bootstrap, list(knockout_doses))
+
+    if workers == 1 or num_bootstraps == 0:
+        global _shared_outcomes
+        _shared_outcomes = dose_outcomes
+        try:
+            fits = [*map(do_bootstrap, seed_sequences)]
+        finally:
+            _shared_outcomes = None
+        return np.array(fits, dtype=float).reshape(num_bootstraps, 2)
+
+    shm = shared_memory.SharedMemory(
+        create=True, size=max(dose_outcomes.nbytes, 1)
+    )
+    try:
+        np.ndarray(
+            dose_outcomes.shape, dtype=dose_outcomes.dtype, buffer=shm.buf
+        )[...] = dose_outcomes
+        with concurrent_futures.ProcessPoolExecutor(
+            workers,
+            initializer=_attach_outcomes,
+            initargs=(shm.name, dose_outcomes.shape, dose_outcomes.dtype),
+        ) as executor:
+            fits = [
+                *executor.map(
+                    do_bootstrap,
+                    seed_sequences,
+                    chunksize=max(num_bootstraps // (4 * (workers or 8)), 1),
+                ),
+            ]
+    finally:
+        shm.close()
+        shm.unlink()
+
+    return np.array(fits, dtype=float).reshape(num_bootstraps, 2)
+
+
+def _attach_outcomes(
+    name: str, shape: typing.Tuple[int, ...], dtype: np.dtype
+) -> None:
+    """Implementation detail for `bootstrap_negbinom_fits` that maps shared
+    outcome matrix into a worker process."""
+    global _shared_memory, _shared_outcomes
+    _shared_memory = shared_memory.SharedMemory(name=name)
+    _shared_outcomes = np.ndarray(
+        shape, dtype=dtype, buffer=_shared_memory.buf
+    )
+
+
+def _fit_bootstrap(
+    knockout_doses: typing.List[int],
+    seed_sequence: np.random.SeedSequence,
+) -> typing.Tuple[float, float]:
+    """Implementation detail for `bootstrap_negbinom_fits` that fits one
+    bootstrap resample of the outcome matrix."""
+    rng = np.random.default_rng(seed_sequence)
+    num_doses, num_replications = _shared_outcomes.shape
+    resample = rng.integers(
+        num_replications, size=(num_doses, num_replications)
+    )
+    sensitivities = np.take_along_axis(
+        _shared_outcomes, resample, axis=1
+    ).mean(axis=1)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        fit = fit_negbinom_quantiles(knockout_doses, sensitivities.tolist())
+    return fit["r"], fit["p"]
@@ -2,9 +2,9 @@ import typing
 import warnings
 
 import numpy as np
-from scipy.optimize import brute as scipy_brute  # grid search
+from scipy.optimize import minimize_scalar as scipy_minimize_scalar
 
-from ..auxlib._nbinom_cdf import nbinom_cdf
+from ..auxlib._nbinom_cdf_grid import nbinom_cdf_grid
 
 
 def fit_negbinom_quantiles(
@@ -12,6 +12,7 @@ def fit_negbinom_quantiles(
     cumulative_probabilities: typing.Sequence[float],
     r_upper_bound: int = 100,
     p_upper_bound: float = 1.0,
+    refine: bool = False,
 ) -> dict:
     """Fit a negative binomial distribution to a set of cumulative distribution
     distribution_values.
@@ -22,6 +23,15 @@ def fit_negbinom_quantiles(
         A sequence of distribution values, i.e., counts.
     cumulative_probabilities : typing.Sequence[float]
         Cumulative probabilities corresponding to counts, i.e., quantiles..
+    r_upper_bound : int, default 100
+        Largest number of successes r considered in grid search.
+    p_upper_bound : float, default 1.0
+        Largest success probability p considered in grid search.
+    refine : bool, default False
+        If True, polish the best grid search p by bounded scalar optimization
+        within one grid step, holding r at its best grid value. Refining r is
+        not attempted, as the CDF floors the number of failures, so error is
+        discontinuous in r.
 
     Returns
     -------
@@ -51,31 +61,36 @@ def fit_negbinom_quantiles(
     pgranule = 100
     pnorm = pgranule / p_upper_bound
 
-    def error_function(params) -> float:
-        r, p = params
-        assert r > 0 and p > 0
-        error = sum(
-            (nbinom_cdf(v, int(r), p / pnorm) - q) ** 2
-            for v, q in zip(
-                distribution_values, cumulative_probabilities, strict=True
-            )
-        )
-        assert not np.isnan(error)
-        return error
-
     # Range for r and p
     r_search = slice(1, r_upper_bound + 1, 1)
     p_search = slice(1, pgranule + 1, 1)
+    r_grid = np.arange(r_search.start, r_search.stop, r_search.step)
+    p_grid = np.arange(p_search.start, p_search.stop, p_search.step)
 
-    # Using brute to find the optimal parameters --- minimize error
-    result = scipy_brute(error_function, (r_search, p_search), finish=None)
+    def error_function(
+        r: typing.Union[float, np.array], p: typing.Union[float, np.array]
+    ) -> typing.Union[float, np.array]:
+        # r, p broadcast against each other; values along trailing axis
+        fit = nbinom_cdf_grid(
+            np.asarray(distribution_values),
+            np.expand_dims(r, -1),
+            np.expand_dims(p, -1) / pnorm,
+        )
+        error = ((fit - np.asarray(cumulative_probabilities)) ** 2).sum(
+            axis=-1,
+        )
+        assert not np.isnan(error).any()
+        return error
 
-    best_r, best_p = int(result[0]), result[1]
+    # grid search, evaluating all (r, p) pairs at once --- minimize error
+    # note: argmin takes first minimum in C order, consistent with brute
+    grid_errors = error_function(r_grid[:, None], p_grid[None, :])
+    r_index, p_index = np.unravel_index(
+        grid_errors.argmin(), grid_errors.shape
+    )
+    best_r, best_p = int(r_grid[r_index]), p_grid[p_index]
     assert best_r > 0
     assert 0 <= best_p / pnorm <= 1.0
-    fit_quantiles = [
-        nbinom_cdf(q, best_r, best_p / pnorm) for q in distribution_values
-    ]
 
     # warn if the best parameters are at the edge of the search range
     if best_p >= p_search.stop - p_search.step:
@@ -99,9 +114,27 @@ def fit_negbinom_quantiles(
             "Consider decreasing the upper bound."
         )
 
+    if refine:
+        result = scipy_minimize_scalar(
+            lambda p: error_function(best_r, p),
+            bounds=(
+                max(best_p - p_search.step, 1e-6),
+                min(best_p + p_search.step, pgranule),
+            ),
+            method="bounded",
+            options=dict(xatol=1e-9 * pgranule),
+        )
+        # only accept refinement if it improves on grid search
+        if result.fun < error_function(best_r, best_p):
+            best_p = float(result.x)
+
+    fit_quantiles = [
+        *nbinom_cdf_grid(distribution_values, best_r, best_p / pnorm),
+    ]
+
     return {
         "r": best_r,
         "p": best_p / pnorm,
         "fit quantiles": fit_quantiles,
-        "error": error_function([best_r, best_p]),
+        "error": float(error_function(best_r, best_p)),
     }
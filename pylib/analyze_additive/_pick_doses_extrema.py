@@ -11,6 +11,9 @@ def pick_doses_extrema(
     num_sites: int,
     max_doses: int,
     smear_count: int = 100,
+    rng: typing.Optional[np.random.Generator] = None,
+    method: typing.Literal["smear", "bisect"] = "smear",
+    num_votes: int = 1,
 ) -> np.array:
     """Pick dose levels spanning a genome's sensitivity to knockouts, from the
     smallest dose with a fitness effect through the largest dose without a
@@ -26,35 +29,143 @@ def pick_doses_extrema(
         Number of doses to pick, given sufficient sties available.
     smear_count : int, optional
         The number of doses to be considered in the discrete geometric space,
-        default is 100.
+        default is 100. Used only for "smear" method.
+    rng : np.random.Generator, optional
+        Source of randomness for sampling knockouts. If None, numpy's global
+        random state is used.
+    method : {"smear", "bisect"}, default "smear"
+        How to locate the smallest affected and largest unaffected doses.
+
+        If "smear", test each of `smear_count` doses spaced geometrically.
+        If "bisect", search for each dose by bisection on a log-dose axis,
+        making O(log num_sites) knockout tests per dose. Bisection assumes
+        knockout effects become more detectable with increasing dose.
+    num_votes : int, default 1
+        Number of replicate knockout tests per dose for "bisect" method. A
+        dose counts as affected when searching for the smallest affected dose
+        if any replicate detects an effect, and as unaffected when searching
+        for the largest unaffected dose if any replicate detects no effect.
 
     Returns
     -------
     np.array
         An array of unique knockout counts, in ascending order.
     """
+    if method == "smear":
+        bracket = _bracket_doses_smear(
+            test_knockout, num_sites, smear_count, rng
+        )
+    elif method == "bisect":
+        bracket = _bracket_doses_bisect(
+            test_knockout, num_sites, num_votes, rng
+        )
+    else:
+        raise ValueError(f"Unknown method {method}.")
+
+    if bracket is None:
+        return np.unique(np.linspace(1, num_sites, max_doses, dtype=int))
+
+    first_affected, last_unaffected = _expand_dose_window(
+        *bracket, num_sites, max_doses
+    )
+    return np.unique(
+        np.linspace(first_affected, last_unaffected, max_doses, dtype=int),
+    )
+
+
+def _bracket_doses_smear(
+    test_knockout: typing.Callable,
+    num_sites: int,
+    smear_count: int,
+    rng: typing.Optional[np.random.Generator],
+) -> typing.Optional[typing.Tuple[int, int]]:
+    """Implementation detail for `pick_doses_extrema` that finds smallest
+    affected and largest unaffected doses among geometrically-spaced doses.
+
+    Returns None if all or no doses are affected.
+    """
     smear_doses = discrete_geomspace(1, num_sites, smear_count, dtype=int)
     smear_results = np.array(
         [
-            test_knockout(sample_knockout(dose, num_sites))
+            test_knockout(sample_knockout(dose, num_sites, rng))
             for dose in smear_doses
         ],
     ).astype(bool)
     if np.all(smear_results) or not np.any(smear_results):
-        return np.unique(np.linspace(1, num_sites, max_doses, dtype=int))
+        return None
 
     first_affected = smear_doses[np.flatnonzero(smear_results)[0]]
     last_unaffected = smear_doses[np.flatnonzero(~smear_results)[-1]]
+    return first_affected, last_unaffected
 
-    # expand to available space
-    while last_unaffected - first_affected < max_doses and (
-        last_unaffected < num_sites or first_affected > 0
-    ):
-        last_unaffected += last_unaffected < num_sites
-        first_affected -= (
-            first_affected > 0 and last_unaffected - first_affected < max_doses
-        )
 
-    return np.unique(
-        np.linspace(first_affected, last_unaffected, max_doses, dtype=int),
+def _bracket_doses_bisect(
+    test_knockout: typing.Callable,
+    num_sites: int,
+    num_votes: int,
+    rng: typing.Optional[np.random.Generator],
+) -> typing.Optional[typing.Tuple[int, int]]:
+    """Implementation detail for `pick_doses_extrema` that finds smallest
+    affected and largest unaffected doses by bisection on a log-dose axis.
+
+    Returns None if all or no doses are affected.
+    """
+
+    def test_votes(dose: int) -> np.array:
+        return np.array(
+            [
+                test_knockout(sample_knockout(dose, num_sites, rng))
+                for __ in range(num_votes)
+            ],
+        ).astype(bool)
+
+    def bisect(predicate: typing.Callable, lo: int, hi: int) -> int:
+        """Find smallest dose in (lo, hi] satisfying `predicate`, given
+        `predicate(hi)`."""
+        while hi - lo > 1:
+            mid = int(round(np.sqrt(max(lo, 1) * hi)))  # geometric midpoint
+            mid = min(max(mid, lo + 1), hi - 1)
+            if predicate(mid):
+                hi = mid
+            else:
+                lo = mid
+        return hi
+
+    def is_affected(dose: int) -> bool:
+        return test_votes(dose).any()
+
+    def is_unaffected(dose: int) -> bool:
+        return not test_votes(dose).all()
+
+    if not is_affected(num_sites) or not is_unaffected(1):
+        return None
+
+    first_affected = bisect(is_affected, 0, num_sites)
+    # smallest dose with no unaffected vote, less one
+    last_unaffected = (
+        bisect(lambda dose: not is_unaffected(dose), 1, num_sites + 1) - 1
     )
+    return first_affected, last_unaffected
+
+
+def _expand_dose_window(
+    first_affected: int,
+    last_unaffected: int,
+    num_sites: int,
+    max_doses: int,
+) -> typing.Tuple[int, int]:
+    """Implementation detail for `pick_doses_extrema` that widens dose window
+    to span at least `max_doses` sites, as available.
+
+    Extends window alternately upward and downward, one site at a time,
+    starting upward, within dose range [0, num_sites].
+    """
+    shortfall = max_doses - (last_unaffected - first_affected)
+    if shortfall <= 0:
+        return first_affected, last_unaffected
+
+    up_space = max(num_sites - last_unaffected, 0)
+    down_space = max(first_affected, 0)
+    up = min(up_space, max(-(-shortfall // 2), shortfall - down_space))
+    down = min(down_space, shortfall - up)
+    return first_affected - down, last_unaffected + up
@@ -1,18 +1,43 @@
+import typing
+
 import numpy as np
 
+from ..auxlib._KnockoutMask import KnockoutMask
+from ..auxlib._or_global_rng import or_global_rng
+
 
-def sample_knockout(dose: int, num_sites: int) -> np.array:
+def sample_knockout(
+    dose: int,
+    num_sites: int,
+    rng: typing.Optional[np.random.Generator] = None,
+    packed: bool = False,
+) -> typing.Union[np.array, KnockoutMask]:
     """Sample a knockout configuration with `dose` sites sampled uniformly over
     `num_sites` genome positions.
 
+    Parameters
+    ----------
+    dose : int
+        Number of sites to knock out.
+    num_sites : int
+        Number of sites in genome.
+    rng : np.random.Generator, optional
+        Source of randomness. If None, numpy's global random state is used.
+    packed : bool, default False
+        If True, return knockout as a bit-packed `KnockoutMask`.
+
     Returns
     -------
-    np.array
+    np.array or KnockoutMask
         A binary mask where 1 represents a knockout at a site and 0 represents
         no knockout.
 
         The length of the array is equal to `num_sites`.
     """
+    sites = or_global_rng(rng).choice(num_sites, dose, replace=False)
+    if packed:
+        return KnockoutMask.from_sites(num_sites, sites)
+
     res = np.zeros(num_sites, dtype=bool)
-    res[np.random.choice(num_sites, dose, replace=False)] = 1
+    res[sites] = 1
     return res
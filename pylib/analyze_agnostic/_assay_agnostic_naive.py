@@ -11,6 +11,7 @@ from ..auxlib._jackknife_mark_recapture_estimate import (
 
 def assay_agnostic_naive(
     skeletons_description_df: typing.Sequence[np.array],
+    selection: typing.Literal["first", "interpolated"] = "first",
 ) -> dict:
     """Apply capture/release estimation over sites included within replicate
     skeletonizations to estimate the prevalence of functional sites (i.e.,
@@ -26,6 +27,9 @@ def assay_agnostic_naive(
         `describe_skeletons`.
 
         At least five skeletons should be provided for good-quality estimation.
+    selection : {"first", "interpolated"}, default "first"
+        How to select among jackknife estimators of different order, as
+        described for `jackknife_mark_recapture_estimate`.
 
     Returns
     -------
@@ -65,7 +69,7 @@ def assay_agnostic_naive(
         ),
     )[1:].copy()
     f.resize(num_skeletons)
-    estimate, ci = jackknife_mark_recapture_estimate(f)
+    estimate, ci = jackknife_mark_recapture_estimate(f, selection=selection)
 
     return {
         "num sites estimate": estimate,
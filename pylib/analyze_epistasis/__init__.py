@@ -1,11 +1,17 @@
 from ._assay_epistasis_naive import assay_epistasis_naive
 from ._describe_skeletons import describe_skeletons
 from ._jackknife_skeleton import jackknife_skeleton
+from ._jackknife_skeletons import jackknife_skeletons
+from ._skeletonize_bisect import skeletonize_bisect
 from ._skeletonize_naive import skeletonize_naive
+from ._skeletonize_replicates import skeletonize_replicates
 
 __all__ = [
     "assay_epistasis_naive",
     "describe_skeletons",
     "jackknife_skeleton",
+    "jackknife_skeletons",
+    "skeletonize_bisect",
     "skeletonize_naive",
+    "skeletonize_replicates",
 ]
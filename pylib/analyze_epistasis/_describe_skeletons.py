@@ -4,16 +4,19 @@ import typing
 import numpy as np
 import pandas as pd
 
-from ._jackknife_skeleton import jackknife_skeleton
+from ._jackknife_skeletons import jackknife_skeletons
 
 
 def describe_skeletons(
     skeletons: typing.List[np.array],
     test_knockout: typing.Callable,
+    test_knockouts: typing.Optional[typing.Callable] = None,
+    workers: typing.Optional[int] = 1,
 ) -> pd.DataFrame:
-    skeletons_df = _make_skeletons_df(skeletons)
-    skeletonization_df = _make_skeletonization_df(skeletons_df)
-    jackknifes_df = _make_jackknifes_df(skeletons, test_knockout)
+    skeletonization_df = _make_skeletonization_df(skeletons)
+    jackknifes_df = _make_jackknifes_df(
+        skeletons, test_knockout, test_knockouts, workers
+    )
 
     res = pd.DataFrame.merge(
         skeletonization_df,
@@ -29,12 +32,19 @@ def describe_skeletons(
 
 
 def _make_jackknifes_df(
-    skeletons: typing.List[np.array], test_knockout: typing.Callable
+    skeletons: typing.List[np.array],
+    test_knockout: typing.Callable,
+    test_knockouts: typing.Optional[typing.Callable] = None,
+    workers: typing.Optional[int] = 1,
 ) -> np.array:
     jackknife_results = (
         pd.concat(
-            jackknife_skeleton(skeleton, test_knockout)
-            for skeleton in skeletons
+            jackknife_skeletons(
+                skeletons,
+                test_knockout,
+                test_knockouts=test_knockouts,
+                workers=workers,
+            ),
         )
         if len(skeletons)  # make robust to numpy types
         else pd.DataFrame(
@@ -68,62 +78,106 @@ def _make_jackknifes_df(
     return agg_df.reset_index()
 
 
-def _make_skeletons_df(skeletons: typing.List[np.array]) -> np.array:
-    records = []
-    for i, skeleton in enumerate(skeletons):
-        for j, skeleton_value in enumerate(skeleton):
-            records.append(
-                {
-                    "skeleton": i,
-                    "skeleton dose": skeleton.astype(bool).sum(),
-                    "skeleton exclusion order": skeleton_value or np.nan,
-                    "skeleton outcome": bool(skeleton_value),
-                    "site": j,
-                },
+def _make_skeleton_outcomes_df(
+    skeletons: typing.List[np.array],
+) -> pd.DataFrame:
+    """Aggregate skeleton dose and exclusion order over skeletons for each
+    site and skeleton outcome (i.e., site excluded or included) observed.
+
+    Rows are ordered by site, then outcome. Reductions are taken directly over
+    the stacked skeletons array, rather than grouping per-site records.
+    """
+    num_skeletons = len(skeletons)
+    stacked = (
+        np.vstack(skeletons).astype(int)
+        if num_skeletons  # make robust to numpy types
+        else np.empty((0, 0), dtype=int)
+    )
+    excluded = stacked.astype(bool)
+    doses = excluded.sum(axis=1)
+    num_sites = stacked.shape[1]
+
+    columns = {
+        "site": [],
+        "skeleton outcome": [],
+        "skeleton dose": [],
+        "skeleton dose std": [],
+        "skeleton dose ptp": [],
+        "skeleton exclusion order": [],
+        "skeleton exclusion order std": [],
+        "skeleton exclusion order ptp": [],
+        "skeleton outcome count": [],
+    }
+    for outcome in False, True:  # ordered as by groupby
+        mask = excluded == outcome
+        count = mask.sum(axis=0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            dose, dose_std, dose_ptp = _masked_stats(
+                np.broadcast_to(doses[:, None], mask.shape), mask, count
             )
+            if outcome:
+                order, order_std, order_ptp = _masked_stats(
+                    stacked, mask, count
+                )
+            else:  # included sites have no exclusion order
+                order = order_std = order_ptp = np.full(num_sites, np.nan)
+
+        columns["site"].append(np.arange(num_sites))
+        columns["skeleton outcome"].append(np.full(num_sites, outcome))
+        columns["skeleton dose"].append(dose)
+        columns["skeleton dose std"].append(dose_std)
+        columns["skeleton dose ptp"].append(dose_ptp)
+        columns["skeleton exclusion order"].append(order)
+        columns["skeleton exclusion order std"].append(order_std)
+        columns["skeleton exclusion order ptp"].append(order_ptp)
+        columns["skeleton outcome count"].append(count)
 
-    res = pd.DataFrame.from_records(
-        records
-        or {
-            "skeleton": [],
-            "skeleton dose": [],
-            "skeleton exclusion order": [],
-            "skeleton outcome": [],
-            "site": [],
+    # interleave outcomes within site, keeping only observed outcomes
+    observed = np.stack(columns["skeleton outcome count"], axis=1).ravel() > 0
+    res = pd.DataFrame(
+        {
+            column: np.stack(values, axis=1).ravel()[observed]
+            for column, values in columns.items()
         },
     )
-    assert len(res) == sum(map(len, skeletons))
-    return res
+    if not num_skeletons:  # without skeletons, dtypes can't be inferred
+        return res.astype(float)
+    elif excluded.all():  # no NaN exclusion orders, so ptp stays integral
+        return res.astype({"skeleton exclusion order ptp": int})
+    else:
+        return res
 
 
-def _make_skeletonization_df(skeletons_df: pd.DataFrame) -> pd.DataFrame:
-    skeletons_df["skeleton outcome count"] = 1
-    skeletons_df["skeleton outcome frequency"] = 1
-    for col, ext in it.product(
-        ["skeleton dose", "skeleton exclusion order"],
-        ["std", "ptp"],
-    ):
-        skeletons_df[f"{col} {ext}"] = skeletons_df[col]
-    agg_df = (
-        skeletons_df.groupby(
-            ["site", "skeleton outcome"],
-        )
-        .agg(
-            {
-                "skeleton dose": "mean",
-                "skeleton dose std": "std",
-                "skeleton dose ptp": np.ptp,
-                "skeleton exclusion order": "mean",
-                "skeleton exclusion order std": "std",
-                "skeleton exclusion order ptp": np.ptp,
-                "skeleton outcome count": "sum",
-                "skeleton outcome frequency": "sum",
-            },
-        )
-        .reset_index()
-    )
-    agg_df["skeleton outcome frequency"] /= skeletons_df["skeleton"].nunique()
-    assert len(agg_df) >= skeletons_df["site"].nunique()
+def _masked_stats(
+    values: np.array, mask: np.array, count: np.array
+) -> typing.Tuple[np.array, np.array, np.array]:
+    """Compute mean, sample standard deviation, and peak-to-peak range of
+    `values` along axis 0, considering only entries where `mask` is set.
+
+    `count` is the number of set entries in each column of `mask`. Means are
+    NaN where `count` is zero, and standard deviations where `count` is less
+    than two. Peak-to-peak ranges retain the dtype of `values`, and are
+    meaningful only where `count` is nonzero.
+    """
+    mean = np.where(mask, values, 0).sum(axis=0) / count
+    sum_squares = np.where(mask, (values - mean) ** 2, 0).sum(axis=0)
+    std = np.where(count > 1, np.sqrt(sum_squares / (count - 1)), np.nan)
+    if len(values):
+        info = np.iinfo(values.dtype)
+        ptp = np.where(mask, values, info.min).max(axis=0) - np.where(
+            mask, values, info.max
+        ).min(axis=0)
+    else:
+        ptp = np.zeros(values.shape[1:], dtype=values.dtype)
+    return mean, std, ptp
+
+
+def _make_skeletonization_df(skeletons: typing.List[np.array]) -> pd.DataFrame:
+    agg_df = _make_skeleton_outcomes_df(skeletons)
+    agg_df["skeleton outcome frequency"] = agg_df["skeleton outcome count"]
+    agg_df["skeleton outcome frequency"] /= len(skeletons)
+    num_sites = agg_df["site"].nunique()
+    assert len(agg_df) >= num_sites
 
     skeleton_excluded_df = (  # cover empty case
         agg_df[agg_df["skeleton outcome"]] if len(agg_df) else agg_df
@@ -139,7 +193,7 @@ def _make_skeletonization_df(skeletons_df: pd.DataFrame) -> pd.DataFrame:
         on=["site"],
         suffixes=[", excluded", ", included"],
     )
-    assert len(res) == skeletons_df["site"].nunique()
+    assert len(res) == num_sites
     res.fillna(
         {
             "skeleton outcome count, excluded": 0,
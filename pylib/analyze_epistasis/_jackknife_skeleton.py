@@ -7,6 +7,7 @@ import pandas as pd
 def jackknife_skeleton(
     skeleton: np.array,
     test_knockout: typing.Callable[[np.array], bool],
+    make_evaluator: typing.Optional[typing.Callable] = None,
 ) -> pd.DataFrame:
     """Perform a jackknife analysis on a given knockout skeleton to assess the
     fitness result of removing each non-knocked out site.
@@ -24,11 +25,22 @@ def jackknife_skeleton(
 
         Each element corresponds to a genome site, where 0 indicates no knockout, and a positive integer indicates that the site was knocked out.
 
+        May also be a packed `KnockoutMask`, in which case knockout order is
+        not available. Packed masks are unpacked once, on entry.
+
     test_knockout : typing.Callable[[np.array], bool]
         A function that tests the effect of a knockout. It takes a boolean mask
         as input (with True representing a knockout) and returns True if a
         knockout effect was detected, and False otherwise.
 
+    make_evaluator : typing.Callable, optional
+        Factory taking a base knockout mask and returning a stateful evaluator
+        of single-site knockout extensions, e.g.,
+        `GenomeExplicit.make_incremental_evaluator`.
+
+        If provided, jackknife knockouts are tested through the evaluator
+        instead of `test_knockout`.
+
     Returns
     -------
     pd.DataFrame
@@ -44,15 +56,39 @@ def jackknife_skeleton(
       results that did not detect a fitness effect, under the assumption that
       the knockout result is on the threshold of sensitivity.
     """
+    skeleton = np.asarray(skeleton)
+    if make_evaluator is not None:
+        evaluator = make_evaluator(skeleton.astype(bool))
+        test_jackknife = evaluator.test_extension
+    else:
+
+        def test_jackknife(site: int) -> float:
+            knockout = skeleton.astype(bool)
+            knockout[site] = 1
+            return test_knockout(knockout)
 
+    jackknife_sites = np.flatnonzero(~skeleton.astype(bool))
+    return _make_jackknife_df(
+        skeleton, jackknife_sites, map(test_jackknife, jackknife_sites)
+    )
+
+
+def _make_jackknife_df(
+    skeleton: np.array,
+    jackknife_sites: np.array,
+    knockout_results: typing.Iterable[float],
+) -> pd.DataFrame:
+    """Implementation detail for `jackknife_skeleton` and
+    `jackknife_skeletons` that assembles jackknife records from knockout
+    results for each retained site."""
+    jackknife_dose = skeleton.astype(bool).sum() + 1
     records = []
-    for site in np.flatnonzero(~skeleton.astype(bool)):
-        knockout = skeleton.copy()
-        knockout[site] = 1
-        knockout_result = test_knockout(knockout.astype(bool))
+    for site, knockout_result in zip(
+        jackknife_sites, knockout_results, strict=True
+    ):
         records.append(
             {
-                "jackknife dose": knockout.astype(bool).sum(),
+                "jackknife dose": jackknife_dose,
                 # if knockout is not sensitive,
                 # then assume on threshold of sensitivity
                 "raw jackknife result": knockout_result,
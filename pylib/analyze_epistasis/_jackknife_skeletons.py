@@ -0,0 +1,153 @@
+from concurrent import futures as concurrent_futures
+import functools
+import typing
+
+import numpy as np
+import pandas as pd
+
+from ._jackknife_skeleton import _make_jackknife_df
+
+
+def jackknife_skeletons(
+    skeletons: typing.List[np.array],
+    test_knockout: typing.Callable[[np.array], bool],
+    test_knockouts: typing.Optional[typing.Callable] = None,
+    workers: typing.Optional[int] = 1,
+    batch_size: int = 1024,
+) -> typing.List[pd.DataFrame]:
+    """Perform jackknife analysis, as described for `jackknife_skeleton`, on
+    each of several knockout skeletons, testing each distinct jackknife
+    knockout only once.
+
+    Jackknife knockouts are gathered across all skeletons and deduplicated by
+    hashing bit-packed knockout masks. Replicate skeletons often retain
+    identical site sets, so share many jackknife knockouts.
+
+    Parameters
+    ----------
+    skeletons : typing.List[np.array]
+        Knockout skeletons from, e.g., `skeletonize_naive`. All skeletons must
+        have the same number of sites.
+    test_knockout : typing.Callable[[np.array], bool]
+        A function that tests the effect of a knockout, as described for
+        `jackknife_skeleton`.
+    test_knockouts : typing.Callable, optional
+        A function that tests the effects of a batch of knockouts, taking a
+        2-D boolean array with one knockout mask per row and returning one
+        result per row, e.g., `GenomeExplicit.test_knockouts`.
+
+        If provided, distinct knockouts are tested in batches of `batch_size`
+        through `test_knockouts` instead of `test_knockout`.
+    workers : int, optional, default 1
+        Number of worker processes to test distinct knockouts through
+        `test_knockout`. If None, uses the number of processors on the
+        machine. If 1, knockouts are tested serially in the calling process.
+
+        To run over a process pool, `test_knockout` must be picklable (i.e.,
+        not a lambda or locally-defined function).
+    batch_size : int, default 1024
+        Number of knockouts per `test_knockouts` call.
+
+    Returns
+    -------
+    typing.List[pd.DataFrame]
+        Jackknife results for each skeleton, as described for
+        `jackknife_skeleton`.
+    """
+    if not len(skeletons):  # make robust to numpy types
+        return []
+    num_sites = len(skeletons[0])
+    if any(len(skeleton) != num_sites for skeleton in skeletons):
+        raise ValueError("Skeletons must have the same number of sites.")
+
+    # gather distinct jackknife knockouts, as packed bit masks
+    unique_indices = dict()  # packed mask bytes -> index among distinct
+    unique_packed = []
+    scatter_indices = []  # per skeleton, index of distinct mask for each site
+    jackknife_sites = []
+    for skeleton in skeletons:
+        base_mask = skeleton.astype(bool)
+        sites = np.flatnonzero(~base_mask)
+        packed = np.repeat(np.packbits(base_mask)[None, :], len(sites), axis=0)
+        packed[np.arange(len(sites)), sites // 8] |= np.uint8(0x80) >> (
+            sites % 8  # packbits is big-endian within each byte
+        ).astype(np.uint8)
+
+        indices = np.empty(len(sites), dtype=int)
+        for i, row in enumerate(packed):
+            key = row.tobytes()
+            if key not in unique_indices:
+                unique_indices[key] = len(unique_packed)
+                unique_packed.append(row)
+            indices[i] = unique_indices[key]
+
+        scatter_indices.append(indices)
+        jackknife_sites.append(sites)
+
+    unique_results = _test_packed_knockouts(
+        unique_packed,
+        num_sites,
+        test_knockout,
+        test_knockouts,
+        workers,
+        batch_size,
+    )
+    return [
+        _make_jackknife_df(
+            skeleton, sites, (unique_results[i] for i in indices)
+        )
+        for skeleton, sites, indices in zip(
+            skeletons, jackknife_sites, scatter_indices, strict=True
+        )
+    ]
+
+
+def _test_packed_knockouts(
+    packed_masks: typing.List[np.array],
+    num_sites: int,
+    test_knockout: typing.Callable,
+    test_knockouts: typing.Optional[typing.Callable],
+    workers: typing.Optional[int],
+    batch_size: int,
+) -> typing.List[float]:
+    """Implementation detail for `jackknife_skeletons` that tests bit-packed
+    knockout masks."""
+    if test_knockouts is not None:
+        return [
+            result
+            for begin in range(0, len(packed_masks), batch_size)
+            for result in test_knockouts(
+                np.unpackbits(
+                    np.vstack(packed_masks[begin : begin + batch_size]),
+                    axis=1,
+                    count=num_sites,
+                ).astype(bool),
+            )
+        ]
+
+    do_test = functools.partial(
+        _test_packed_knockout, test_knockout, num_sites
+    )
+    if workers == 1:
+        return [*map(do_test, packed_masks)]
+
+    with concurrent_futures.ProcessPoolExecutor(workers) as executor:
+        return [
+            *executor.map(
+                do_test,
+                packed_masks,
+                chunksize=max(len(packed_masks) // (4 * (workers or 8)), 1),
+            ),
+        ]
+
+
+def _test_packed_knockout(
+    test_knockout: typing.Callable,
+    num_sites: int,
+    packed_mask: np.array,
+) -> float:
+    """Implementation detail for `jackknife_skeletons` that tests one
+    bit-packed knockout mask."""
+    return test_knockout(
+        np.unpackbits(packed_mask, count=num_sites).astype(bool),
+    )
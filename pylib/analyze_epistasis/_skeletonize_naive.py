@@ -3,6 +3,8 @@ import typing
 
 import numpy as np
 
+from ..auxlib._or_global_rng import or_global_rng
+
 
 # extension ideas
 # ---------------
@@ -20,6 +22,8 @@ import numpy as np
 def skeletonize_naive(
     num_sites: int,
     test_knockout: typing.Callable,
+    make_evaluator: typing.Optional[typing.Callable] = None,
+    rng: typing.Optional[np.random.Generator] = None,
 ) -> np.array:
     """Sample a knockout set where all remaining sites are detectably critical,
     i.e., cannot be removed without detectable fitness effects.
@@ -33,6 +37,16 @@ def skeletonize_naive(
         knockout effect was detected and False otherwise.
 
         It should take boolean mask, e.g., produced by `sample_knockout`.
+    make_evaluator : typing.Callable, optional
+        Factory taking a base knockout mask and returning a stateful evaluator
+        of single-site knockout extensions, e.g.,
+        `GenomeExplicit.make_incremental_evaluator`.
+
+        If provided, candidate sites are tested through the evaluator instead
+        of `test_knockout`, avoiding a full knockout test per candidate.
+    rng : np.random.Generator, optional
+        Source of randomness for candidate site order. If None, numpy's global
+        random state is used.
 
     Returns
     -------
@@ -43,10 +57,14 @@ def skeletonize_naive(
         The length of the array is equal to `num_sites`.
     """
     knocked_order = np.zeros(num_sites, dtype=int)
+    if make_evaluator is not None:
+        return _skeletonize_incremental(
+            make_evaluator(knocked_order.astype(bool)), knocked_order, rng
+        )
 
     for order in it.count():
         extended_knockout = _try_extend_knockout(
-            test_knockout, knocked_order.astype(bool)
+            test_knockout, knocked_order.astype(bool), rng
         )
         assert extended_knockout.sum() >= knocked_order.astype(bool).sum()
         if np.array_equal(extended_knockout, knocked_order.astype(bool)):
@@ -65,6 +83,7 @@ def skeletonize_naive(
 def _try_extend_knockout(
     test_knockout: typing.Callable,
     base_knockout: np.array,
+    rng: typing.Optional[np.random.Generator] = None,
 ) -> np.array:
     """Implementation detail for `skeletonize_naive` that performs an exhaustive
     search for a site that can be knocked out without detectable fitness effects.
@@ -75,9 +94,10 @@ def _try_extend_knockout(
     """
 
     candidate_sites = np.flatnonzero(~base_knockout)
-    np.random.shuffle(candidate_sites)
+    or_global_rng(rng).shuffle(candidate_sites)
     assert candidate_sites.size == (~base_knockout).sum()
     for site in candidate_sites:
+        # fresh copy per test, as test_knockout may retain a reference
         knockout = base_knockout.copy()
         assert not knockout[site]
         knockout[site] = 1
@@ -92,3 +112,32 @@ def _try_extend_knockout(
             return knockout
     else:
         return base_knockout
+
+
+def _skeletonize_incremental(
+    evaluator: "IncrementalKnockoutEvaluator",  # noqa: F821
+    knocked_order: np.array,
+    rng: typing.Optional[np.random.Generator] = None,
+) -> np.array:
+    """Implementation detail for `skeletonize_naive` that extends knockouts
+    through a stateful evaluator, e.g., `IncrementalKnockoutEvaluator`."""
+    rng = or_global_rng(rng)
+    for order in it.count():
+        candidate_sites = np.flatnonzero(~evaluator.knockout)
+        rng.shuffle(candidate_sites)
+        for site in candidate_sites:
+            knockout_result = evaluator.test_extension(site)
+            if knockout_result < 0:
+                raise NotImplementedError(
+                    f"Adaptive knockout result {knockout_result} ocurred for "
+                    f"site {site}; naive skeletonization only accounts for "
+                    "deleterious or neutral knockout outcomes.",
+                )
+            if knockout_result == 0:
+                evaluator.extend(site)
+                evaluator.commit()
+                # 0 is reserved for no knockout
+                knocked_order[site] = order + 1
+                break
+        else:
+            return knocked_order
@@ -0,0 +1,112 @@
+from concurrent import futures as concurrent_futures
+import functools
+import typing
+
+import numpy as np
+
+from ._skeletonize_naive import skeletonize_naive
+
+
+def skeletonize_replicates(
+    num_sites: int,
+    test_knockout: typing.Callable,
+    n: int,
+    workers: typing.Optional[int] = None,
+    seed: typing.Optional[int] = None,
+    skeletonize: typing.Callable = skeletonize_naive,
+    ordered: bool = True,
+    **kwargs: dict,
+) -> typing.Iterator[np.array]:
+    """Sample replicate skeletons in parallel over a process pool.
+
+    Each replicate draws from an independent `np.random.Generator` spawned
+    from `seed`. Global `np.random` state is also seeded per replicate from an
+    independent child stream, for `test_knockout` implementations that draw
+    from it (e.g., `GenomeExplicit` with noisy assay artifacts). So, results
+    are reproducible regardless of worker count or completion order.
+
+    Parameters
+    ----------
+    num_sites : int
+        Number of sites in genome.
+    test_knockout : typing.Callable
+        A function that tests the effect of a knockout, e.g.,
+        `GenomeExplicit.test_knockout`.
+
+        Must be picklable to run over a process pool (i.e., not a lambda or
+        locally-defined function).
+    n : int
+        Number of replicate skeletons to sample.
+    workers : int, optional
+        Number of worker processes. If None, uses the number of processors on
+        the machine. If 1, replicates run serially in the calling process.
+    seed : int, optional
+        Entropy for per-replicate random streams. If None, fresh entropy is
+        drawn from the operating system.
+    skeletonize : typing.Callable, default skeletonize_naive
+        Skeletonization procedure to apply, e.g., `skeletonize_naive` or
+        `skeletonize_bisect`. Must accept an `rng` keyword argument.
+    ordered : bool, default True
+        If True, yield skeletons in replicate order, each as soon as it and
+        all preceding replicates are complete. If False, yield skeletons in
+        order of completion.
+    **kwargs : dict
+        Additional keyword arguments forwarded to `skeletonize`.
+
+    Returns
+    -------
+    typing.Iterator[np.array]
+        Skeletons as described for `skeletonize_naive`, yielded as replicates
+        complete.
+
+    Examples
+    --------
+    >>> skeletons = np.vstack(
+    ...     [*skeletonize_replicates(num_sites, genome.test_knockout, 20)],
+    ... )
+    """
+    do_replicate = functools.partial(
+        _skeletonize_replicate,
+        skeletonize,
+        num_sites,
+        test_knockout,
+        **kwargs,
+    )
+    seed_sequences = np.random.SeedSequence(seed).spawn(n)
+
+    if workers == 1:
+        for seed_sequence in seed_sequences:
+            # preserve caller's global random state between replicates
+            random_state = np.random.get_state()
+            skeleton = do_replicate(seed_sequence)
+            np.random.set_state(random_state)
+            yield skeleton
+        return
+
+    executor = concurrent_futures.ProcessPoolExecutor(workers)
+    try:
+        futures = [
+            executor.submit(do_replicate, seed_sequence)
+            for seed_sequence in seed_sequences
+        ]
+        for future in (
+            futures if ordered else concurrent_futures.as_completed(futures)
+        ):
+            yield future.result()
+    finally:  # don't wait on outstanding work if consumer stops early
+        executor.shutdown(cancel_futures=True)
+
+
+def _skeletonize_replicate(
+    skeletonize: typing.Callable,
+    num_sites: int,
+    test_knockout: typing.Callable,
+    seed_sequence: np.random.SeedSequence,
+    **kwargs: dict,
+) -> np.array:
+    """Implementation detail for `skeletonize_replicates` that samples one
+    skeleton from seeded random streams."""
+    global_sequence, rng_sequence = seed_sequence.spawn(2)
+    np.random.seed(global_sequence.generate_state(4))
+    rng = np.random.default_rng(rng_sequence)
+    return skeletonize(num_sites, test_knockout, rng=rng, **kwargs)
@@ -0,0 +1,262 @@
+import collections
+import hashlib
+import sqlite3
+import typing
+
+import numpy as np
+
+
+class CachedKnockoutTester:
+    """Memoizing wrapper for a knockout test callable, e.g.,
+    `GenomeExplicit.test_knockout`.
+
+    Results are keyed on a digest of the bit-packed knockout mask. Recently
+    used results are held in memory, with least-recently-used eviction beyond
+    `max_size` entries. Optionally, results are also persisted to an SQLite
+    database, so that they survive between sessions. Persisted results are
+    keyed also on a caller-provided namespace identifying the genome and
+    test, so that several testers may share a database file.
+
+    Caching is only appropriate for deterministic knockout tests.
+    """
+
+    _cache: "collections.OrderedDict[bytes, float]"
+    _max_size: typing.Optional[int]
+    _namespace: typing.Optional[str]
+    _store: typing.Optional[sqlite3.Connection]
+    _test_knockout: typing.Callable
+    _test_knockouts: typing.Optional[typing.Callable]
+
+    hits: int  # lookups answered from memory or persisted store
+    misses: int  # lookups requiring a knockout test
+
+    def __init__(
+        self: "CachedKnockoutTester",
+        test_knockout: typing.Callable,
+        max_size: typing.Optional[int] = None,
+        path: typing.Optional[str] = None,
+        test_knockouts: typing.Optional[typing.Callable] = None,
+        namespace: typing.Optional[str] = None,
+    ) -> None:
+        """Initialize.
+
+        Parameters
+        ----------
+        test_knockout : typing.Callable
+            A function that tests the effect of a knockout, taking a boolean
+            mask with True representing a knockout.
+        max_size : int, optional
+            Maximum number of results to hold in memory. If None, memory
+            cache is unbounded.
+        path : str, optional
+            Path to SQLite database file to persist results to, created if
+            needed. If None, results are not persisted.
+        test_knockouts : typing.Callable, optional
+            A function that tests the effects of a batch of knockouts, taking
+            a 2-D boolean array with one knockout mask per row, e.g.,
+            `GenomeExplicit.test_knockouts`. Used to test cache misses in
+            `test_knockouts`, if provided.
+        namespace : str, optional
+            Identifier for genome and knockout test, distinguishing persisted
+            results from those of other testers using the same database file.
+            Required if `path` is provided.
+
+            Results persisted under the same namespace are assumed to come
+            from the same deterministic test, so identifiers must change
+            whenever the genome or test changes.
+        """
+        self._test_knockout = test_knockout
+        self._test_knockouts = test_knockouts
+        self._max_size = max_size
+        self._cache = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+        self._namespace = namespace
+        self._store = None
+        if path is not None:
+            if namespace is None:
+                raise ValueError(
+                    "A namespace is required to persist results, to keep "
+                    "them apart from other testers' results in the store.",
+                )
+            self._store = sqlite3.connect(path)
+            with self._store:
+                self._store.execute(
+                    "CREATE TABLE IF NOT EXISTS knockout_results "
+                    "(namespace TEXT NOT NULL, key BLOB NOT NULL, "
+                    "result REAL NOT NULL, PRIMARY KEY (namespace, key))",
+                )
+            columns = [
+                row[1]
+                for row in self._store.execute(
+                    "PRAGMA table_info(knockout_results)"
+                )
+            ]
+            if "namespace" not in columns:
+                self.close()
+                raise ValueError(
+                    f"Store at {path} predates namespaced results, so its "
+                    "results can't be attributed to a tester.",
+                )
+
+    def __call__(self: "CachedKnockoutTester", knockout: np.array) -> float:
+        """Test knockout, using cached result if available.
+
+        Parameters
+        ----------
+        knockout : np.array
+            A binary array representing knockout sites, where 1 indicates
+            site knockout.
+
+        Returns
+        -------
+        float
+            Result of `test_knockout`.
+        """
+        key = self._make_key(knockout)
+        found, result = self._lookup(key)
+        if not found:
+            result = self._test_knockout(knockout)
+            self._insert([key], [result])
+        return result
+
+    def test_knockouts(
+        self: "CachedKnockoutTester", knockouts: np.array
+    ) -> np.array:
+        """Test a batch of knockouts, using cached results where available.
+
+        Parameters
+        ----------
+        knockouts : np.array
+            A 2-D boolean array with one knockout mask per row.
+
+        Returns
+        -------
+        np.array
+            Test result for each knockout, as a 1-D array of floats.
+        """
+        knockouts = np.asarray(knockouts)
+        if knockouts.ndim != 2:
+            raise ValueError(
+                f"Expected 2-D knockouts array, got shape {knockouts.shape}.",
+            )
+
+        keys = [*map(self._make_key, knockouts)]
+        results = np.empty(len(knockouts), dtype=float)
+        missing = dict()  # key -> rows, deduplicating within batch
+        for row, key in enumerate(keys):
+            if key in missing:
+                missing[key].append(row)
+                self.hits += 1
+                continue
+            found, result = self._lookup(key)
+            if found:
+                results[row] = result
+            else:
+                missing[key] = [row]
+
+        first_rows = [rows[0] for rows in missing.values()]
+        if self._test_knockouts is not None and first_rows:
+            missing_results = self._test_knockouts(knockouts[first_rows])
+        else:
+            missing_results = [
+                self._test_knockout(knockouts[row]) for row in first_rows
+            ]
+        for rows, result in zip(
+            missing.values(), missing_results, strict=True
+        ):
+            results[rows] = result
+        self._insert([*missing], missing_results)
+
+        return results
+
+    def clear(self: "CachedKnockoutTester") -> None:
+        """Remove cached results from memory and persisted store, and reset
+        hit and miss counts.
+
+        Only this tester's namespace is removed from persisted store.
+        """
+        self._cache.clear()
+        if self._store is not None:
+            with self._store:
+                self._store.execute(
+                    "DELETE FROM knockout_results WHERE namespace = ?",
+                    (self._namespace,),
+                )
+        self.hits = 0
+        self.misses = 0
+
+    def close(self: "CachedKnockoutTester") -> None:
+        """Close persisted store, if any."""
+        if self._store is not None:
+            self._store.close()
+            self._store = None
+
+    def __len__(self: "CachedKnockoutTester") -> int:
+        """Number of results held in memory."""
+        return len(self._cache)
+
+    @staticmethod
+    def _make_key(knockout: np.array) -> bytes:
+        """Digest knockout mask, including its length to distinguish masks
+        differing only in trailing zero padding."""
+        knockout = np.asarray(knockout).astype(bool, copy=False)
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(len(knockout).to_bytes(8, "little"))
+        digest.update(np.packbits(knockout).tobytes())
+        return digest.digest()
+
+    def _lookup(
+        self: "CachedKnockoutTester", key: bytes
+    ) -> typing.Tuple[bool, typing.Optional[float]]:
+        """Find result for `key` in memory or persisted store, updating hit and
+        miss counts."""
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return True, self._cache[key]
+
+        if self._store is not None:
+            row = self._store.execute(
+                "SELECT result FROM knockout_results "
+                "WHERE namespace = ? AND key = ?",
+                (self._namespace, key),
+            ).fetchone()
+            if row is not None:
+                self._remember(key, row[0])
+                self.hits += 1
+                return True, row[0]
+
+        self.misses += 1
+        return False, None
+
+    def _insert(
+        self: "CachedKnockoutTester",
+        keys: typing.List[bytes],
+        results: typing.Iterable[float],
+    ) -> None:
+        """Cache newly tested results in memory and persisted store."""
+        results = [*results]
+        for key, result in zip(keys, results, strict=True):
+            self._remember(key, result)
+        if self._store is not None and keys:
+            with self._store:
+                self._store.executemany(
+                    "INSERT OR REPLACE INTO knockout_results "
+                    "(namespace, key, result) VALUES (?, ?, ?)",
+                    (
+                        (self._namespace, key, float(result))
+                        for key, result in zip(keys, results)
+                    ),
+                )
+
+    def _remember(
+        self: "CachedKnockoutTester", key: bytes, result: float
+    ) -> None:
+        """Hold result in memory, evicting least-recently-used results beyond
+        `max_size`."""
+        self._cache[key] = result
+        self._cache.move_to_end(key)
+        while self._max_size is not None and len(self._cache) > self._max_size:
+            self._cache.popitem(last=False)
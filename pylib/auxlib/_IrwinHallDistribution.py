@@ -1,19 +1,22 @@
 import typing
 
-from UniformSumDistribution import UniformSumDistribution
 import numpy as np
 
+from ._irwin_hall_cdf import irwin_hall_cdf
+
 
 class IrwinHallDistribution:
     """Implementation of Irwin-Hall distribution (sum of `n` iid uniform random
     variables).
 
     Provides capability to parametrize bounds of underlying uniform distributions, i.e., to replace unit 0 to 1 bounds.
+
+    To evaluate the CDF over many `n` at once, use `irwin_hall_cdf`.
     """
 
+    _n: int  # number of uniform random variables summed
     _ptp: float  # peak-to-peak (maximum - minimum) of a & b
     _lb: float  # smaller of a & b
-    _distn: UniformSumDistribution  # underlying implementation
 
     def __init__(
         self: "IrwinHallDistribution",
@@ -32,15 +35,15 @@ class IrwinHallDistribution:
         b : float
             The upper bound of underlying uniform distribution.
         """
+        self._n = n
         self._ptp = np.ptp([a, b])
         self._lb = min(a, b) * n
-        self._distn = UniformSumDistribution(n)
 
     def cdf(
         self: "IrwinHallDistribution",
         x: typing.Union[float, np.array],
-        *args,
-        **kwargs
+        loc: float = 0.0,
+        scale: float = 1.0,
     ) -> float:
         """Compute the cumulative distribution function of the Irwin-Hall
         distribution.
@@ -49,15 +52,19 @@ class IrwinHallDistribution:
         ----------
         x : float or np.ndarray
             The value(s) at which to evaluate the CDF.
+        loc : float, default 0.0
+            Location shift, in units of underlying uniform distribution's
+            width, applied as for `scipy.stats.rv_continuous.cdf`.
+        scale : float, default 1.0
+            Scale factor, applied as for `scipy.stats.rv_continuous.cdf`.
 
         Returns
         -------
         float or np.ndarray
             The CDF evaluated at `x`.
         """
-        x = (x - self._lb) / self._ptp
-        res = self._distn.cdf(x, *args, **kwargs)
-        try:  # correct for numerical instability at extreme values
-            return np.maximum.accumulate(np.clip(res, 0, 1))
-        except TypeError:
-            return np.clip(res, 0, 1)
+        x = (np.asarray(x) - self._lb) / self._ptp
+        res = irwin_hall_cdf(self._n, (x - loc) / scale)
+        if np.ndim(res):  # correct for numerical instability at extreme values
+            return np.maximum.accumulate(res)
+        return res
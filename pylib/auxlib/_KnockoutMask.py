@@ -0,0 +1,200 @@
+import typing
+
+import numpy as np
+
+# number of set bits in each possible byte value
+_byte_popcounts = np.unpackbits(
+    np.arange(256, dtype=np.uint8)[:, None], axis=1
+).sum(axis=1)
+
+
+class KnockoutMask:
+    """Knockout mask over genome sites, stored as a packed bitset of unsigned
+    64-bit words.
+
+    Takes one bit per site, rather than one byte per site for a boolean
+    array. Converts to a boolean array with `np.asarray`, so can be passed
+    wherever a boolean knockout mask is expected.
+
+    Site `i` is stored in bit `i % 64` of word `i // 64`. Padding bits past
+    `num_sites` are always zero.
+    """
+
+    _num_sites: int
+    _words: np.array  # little-endian uint64
+
+    def __init__(
+        self: "KnockoutMask",
+        num_sites: int,
+        words: typing.Optional[np.array] = None,
+    ) -> None:
+        """Initialize.
+
+        Parameters
+        ----------
+        num_sites : int
+            Number of sites in genome.
+        words : np.array, optional
+            Packed bitset words, used without copying. If None, no sites are
+            knocked out.
+
+            Prefer `KnockoutMask.from_array` to convert from a boolean mask.
+        """
+        num_words = -(-num_sites // 64)
+        if words is None:
+            words = np.zeros(num_words, dtype="<u8")
+        elif words.shape != (num_words,) or words.dtype != np.dtype("<u8"):
+            raise ValueError(
+                f"Expected {num_words} little-endian uint64 words for "
+                f"{num_sites} sites, but got {words.dtype} array of shape "
+                f"{words.shape}.",
+            )
+        self._num_sites = num_sites
+        self._words = words
+
+    @classmethod
+    def from_array(cls: type, knockout: np.array) -> "KnockoutMask":
+        """Pack a binary array representing knockout sites, where 1 indicates
+        site knockout."""
+        knockout = np.asarray(knockout).astype(bool, copy=False)
+        if knockout.ndim != 1:
+            raise ValueError(
+                f"Expected 1-D knockout array, got shape {knockout.shape}.",
+            )
+        num_sites = len(knockout)
+        packed = np.zeros(-(-num_sites // 64) * 8, dtype=np.uint8)
+        packed[: -(-num_sites // 8)] = np.packbits(knockout, bitorder="little")
+        return cls(num_sites, packed.view("<u8"))
+
+    @classmethod
+    def from_sites(
+        cls: type, num_sites: int, sites: typing.Iterable[int]
+    ) -> "KnockoutMask":
+        """Create mask with `sites` knocked out."""
+        sites = np.fromiter(sites, dtype=np.uint64)
+        if sites.size and sites.max() >= num_sites:
+            raise IndexError(
+                f"Site {sites.max()} out of range for {num_sites} sites.",
+            )
+        res = cls(num_sites)
+        np.bitwise_or.at(
+            res._words,
+            (sites // np.uint64(64)).astype(np.intp),
+            np.uint64(1) << (sites % np.uint64(64)),
+        )
+        return res
+
+    @property
+    def num_sites(self: "KnockoutMask") -> int:
+        """Number of sites in genome."""
+        return self._num_sites
+
+    @property
+    def words(self: "KnockoutMask") -> np.array:
+        """Read-only view of packed bitset words."""
+        view = self._words.view()
+        view.flags.writeable = False
+        return view
+
+    def __array__(
+        self: "KnockoutMask", dtype: typing.Optional[np.dtype] = None
+    ) -> np.array:
+        """Unpack to a boolean array, where True indicates site knockout.
+
+        Individual bits are not addressable in memory, so this copies.
+        """
+        res = np.unpackbits(
+            self._words.view(np.uint8),
+            count=self._num_sites,
+            bitorder="little",
+        ).view(bool)
+        return res if dtype is None else res.astype(dtype)
+
+    def __getitem__(self: "KnockoutMask", site: int) -> bool:
+        """Test whether `site` is knocked out."""
+        word, bit = self._locate(site)
+        return bool(self._words[word] >> bit & np.uint64(1))
+
+    def set(self: "KnockoutMask", site: int) -> None:
+        """Knock out `site`, in place."""
+        word, bit = self._locate(site)
+        self._words[word] |= np.uint64(1) << bit
+
+    def clear(self: "KnockoutMask", site: int) -> None:
+        """Restore `site`, in place."""
+        word, bit = self._locate(site)
+        self._words[word] &= ~(np.uint64(1) << bit)
+
+    def popcount(self: "KnockoutMask") -> int:
+        """Count knocked out sites."""
+        return int(_byte_popcounts[self._words.view(np.uint8)].sum())
+
+    def sites(self: "KnockoutMask") -> np.array:
+        """Indices of knocked out sites, in ascending order.
+
+        Only nonzero words are unpacked, so sparse masks are decoded without
+        materializing a full-length boolean array.
+        """
+        word_indices = np.flatnonzero(self._words)
+        bits = np.unpackbits(
+            self._words[word_indices].view(np.uint8).reshape(-1, 8),
+            axis=1,
+            bitorder="little",
+        )
+        rows, offsets = np.nonzero(bits)
+        return word_indices[rows] * 64 + offsets
+
+    def __iter__(self: "KnockoutMask") -> typing.Iterator[int]:
+        """Iterate over knocked out sites, in ascending order."""
+        return iter(self.sites().tolist())
+
+    def __xor__(self: "KnockoutMask", other: "KnockoutMask") -> "KnockoutMask":
+        """Sites knocked out in exactly one of two masks."""
+        self._check_compatible(other)
+        return KnockoutMask(self._num_sites, self._words ^ other._words)
+
+    def __or__(self: "KnockoutMask", other: "KnockoutMask") -> "KnockoutMask":
+        """Sites knocked out in either of two masks."""
+        self._check_compatible(other)
+        return KnockoutMask(self._num_sites, self._words | other._words)
+
+    def __and__(self: "KnockoutMask", other: "KnockoutMask") -> "KnockoutMask":
+        """Sites knocked out in both of two masks."""
+        self._check_compatible(other)
+        return KnockoutMask(self._num_sites, self._words & other._words)
+
+    def __eq__(self: "KnockoutMask", other: object) -> bool:
+        if not isinstance(other, KnockoutMask):
+            return NotImplemented
+        return self._num_sites == other._num_sites and np.array_equal(
+            self._words, other._words
+        )
+
+    __hash__ = None  # mutable
+
+    def copy(self: "KnockoutMask") -> "KnockoutMask":
+        """Copy mask, such that modifications are not shared."""
+        return KnockoutMask(self._num_sites, self._words.copy())
+
+    def __repr__(self: "KnockoutMask") -> str:
+        return (
+            f"KnockoutMask(num_sites={self._num_sites}, "
+            f"popcount={self.popcount()})"
+        )
+
+    def _locate(
+        self: "KnockoutMask", site: int
+    ) -> typing.Tuple[int, np.uint64]:
+        """Find word index and bit offset for `site`."""
+        if not 0 <= site < self._num_sites:
+            raise IndexError(
+                f"Site {site} out of range for {self._num_sites} sites.",
+            )
+        return site // 64, np.uint64(site % 64)
+
+    def _check_compatible(self: "KnockoutMask", other: "KnockoutMask") -> None:
+        if self._num_sites != other._num_sites:
+            raise ValueError(
+                f"Masks differ in number of sites, {self._num_sites} and "
+                f"{other._num_sites}.",
+            )
@@ -0,0 +1,123 @@
+import functools
+import typing
+
+import numpy as np
+from scipy import special as scipy_special
+from scipy import stats as scipy_stats
+
+# most alternating sum terms to evaluate before normal approximation
+_max_terms = 26
+
+# largest acceptable rounding error bound for alternating sum
+_max_rounding_error = 1e-10
+
+
+def irwin_hall_cdf(
+    n: typing.Union[int, np.array],
+    x: typing.Union[float, np.array],
+    a: float = 0.0,
+    b: float = 1.0,
+) -> typing.Union[float, np.array]:
+    """Compute the cumulative distribution function of the sum of `n` iid
+    uniform random variables on [a, b], vectorized over `n` and `x`.
+
+    Parameters
+    ----------
+    n : int or np.array
+        The number of uniform random variables to sum.
+    x : float or np.array
+        The value(s) at which to evaluate the CDF. Broadcasts against `n`.
+    a : float, default 0.0
+        The lower bound of underlying uniform distribution.
+    b : float, default 1.0
+        The upper bound of underlying uniform distribution.
+
+    Returns
+    -------
+    float or np.array
+        The CDF evaluated at each `n` and `x`, clipped to [0, 1]. Where `n`
+        is zero, the sum is identically zero, so the CDF is a step at zero.
+
+    Notes
+    -----
+    Evaluates the alternating sum
+
+        F(z) = sum_{k=0}^{floor(z)} (-1)^k C(n, k) (z - k)^n / n!
+
+    for standardized value z on the nearer side of the distribution's
+    symmetry about n / 2, with terms computed in log space. Where the sum
+    would require more than 26 terms or is prone to cancellation error
+    (typically for n larger than about 40), falls back to a normal
+    approximation with second-order Edgeworth correction, which is accurate
+    to within about 1e-7.
+    """
+    n, x = np.broadcast_arrays(np.asarray(n, dtype=int), np.asarray(x))
+    z = (x - min(a, b) * n) / np.ptp([a, b])
+    empty_sum_cdf = (z >= 0).astype(float)  # n == 0, step at zero
+
+    flip = z > n / 2  # use symmetry to keep z small, reducing cancellation
+    z = np.clip(np.where(flip, n - z, z), 0, None)
+
+    unique_ns, inverse = np.unique(n, return_inverse=True)
+    coefficients = np.vstack(
+        [np.empty((0, _max_terms))]
+        + [*map(_get_log_coefficients, unique_ns.tolist())],
+    )[inverse.reshape(n.shape)]
+
+    k = np.arange(_max_terms)
+    num_terms = np.floor(z)[..., None]
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        log_magnitudes = coefficients + n[..., None] * np.log(
+            np.maximum(z[..., None] - k, 0),
+        )
+        magnitudes = np.where(k <= num_terms, np.exp(log_magnitudes), 0.0)
+    alternating_sum = np.sum(magnitudes * (-1.0) ** k, axis=-1)
+    rounding_error = np.finfo(float).eps * _max_terms * magnitudes.sum(-1)
+
+    is_exact = (num_terms[..., 0] < _max_terms) & (
+        rounding_error <= _max_rounding_error
+    )
+    res = np.where(is_exact, alternating_sum, _approximate_cdf(n, z))
+    res = np.clip(np.where(flip, 1 - res, res), 0, 1)
+    res = np.where(n == 0, empty_sum_cdf, res)
+    return res if res.ndim else res.item()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_log_coefficients(n: int) -> np.array:
+    """Implementation detail for `irwin_hall_cdf` that tabulates log
+    C(n, k) / n! for the leading alternating sum terms.
+
+    Result is read-only, as it is shared between calls.
+    """
+    k = np.arange(_max_terms)
+    with np.errstate(invalid="ignore"):
+        res = np.where(
+            k <= n,
+            -scipy_special.gammaln(k + 1) - scipy_special.gammaln(n - k + 1),
+            -np.inf,
+        )
+    res.flags.writeable = False
+    return res
+
+
+def _approximate_cdf(n: np.array, z: np.array) -> np.array:
+    """Implementation detail for `irwin_hall_cdf` that approximates the
+    standard Irwin-Hall CDF by Edgeworth expansion, to order 1 / n**2.
+
+    Skewness is zero, so the expansion has only even cumulant terms.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        u = (z - n / 2) / np.sqrt(n / 12)
+        # standardized 4th and 6th cumulants, from uniform's B_r / r
+        lambda4 = -6 / (5 * n)
+        lambda6 = 48 / (7 * n**2)
+        hermite3 = u**3 - 3 * u
+        hermite5 = u**5 - 10 * u**3 + 15 * u
+        hermite7 = u**7 - 21 * u**5 + 105 * u**3 - 105 * u
+        correction = (
+            lambda4 / 24 * hermite3
+            + lambda6 / 720 * hermite5
+            + lambda4**2 / 1152 * hermite7
+        )
+        return scipy_stats.norm.cdf(u) - scipy_stats.norm.pdf(u) * correction
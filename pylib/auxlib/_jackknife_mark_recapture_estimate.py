@@ -1,4 +1,4 @@
-import itertools as it
+import functools
 import math
 import typing
 
@@ -197,11 +197,68 @@ def reject_h0(f: typing.Sequence[int], k: int) -> bool:
     return test_standard_normal(test_statistic)
 
 
-# TODO
-# - implement "improved selection procedure" at end of reference
+@functools.lru_cache
+def _aik_table(t: int) -> np.array:
+    """Tabulate jackknife coefficients a_ik for orders k = 0 through 5 and
+    capture counts i + 1 = 1 through t, with shape (6, t).
+
+    Result is read-only, as it is shared between calls.
+    """
+    res = np.array(
+        [[_aik(i, k)(t) for i in range(t)] for k in range(6)], dtype=float
+    )
+    res.flags.writeable = False
+    return res
+
+
+def _jackknife_statistics(
+    f: np.array,
+) -> typing.Tuple[np.array, np.array, np.array]:
+    """Evaluate jackknife estimates for every order k together.
+
+    Parameters
+    ----------
+    f : np.array
+        Capture frequencies, as described for
+        `jackknife_mark_recapture_estimate`, or a 2-D array with one frequency
+        sequence per row.
+
+    Returns
+    -------
+    np.array, np.array, np.array
+        Estimates and their standard errors for orders k = 0 through 5, with
+        shape (..., 6), and test statistics for orders k = 0 through 4, with
+        shape (..., 5).
+    """
+    f = np.asarray(f, dtype=float)
+    a = _aik_table(f.shape[-1])
+    b = np.diff(a, axis=0)  # b_ik, comparing orders k and k + 1
+
+    estimates = f @ a.T
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # variance is nonnegative, but may round below zero
+        standard_errors = np.sqrt(np.maximum(f @ (a**2).T - estimates, 0))
+
+        S = f.sum(axis=-1, keepdims=True)
+        diffs = np.diff(estimates, axis=-1)
+        sum_squares = f @ (b**2).T
+        deviations = sum_squares - diffs**2 / S
+        # if all individuals share a capture count, variance is zero up to
+        # rounding and no test is possible; nan test statistic never rejects
+        degenerate = deviations <= 64 * np.finfo(float).eps * sum_squares
+        diff_variances = S / (S - 1) * np.where(degenerate, np.nan, deviations)
+        test_statistics = diffs / np.sqrt(diff_variances)
+
+    return estimates, standard_errors, test_statistics
+
+
 def jackknife_mark_recapture_estimate(
-    f: typing.Sequence[int],
-) -> typing.Tuple[float, typing.Tuple[float, float]]:
+    f: typing.Union[typing.Sequence[int], np.array],
+    selection: typing.Literal["first", "interpolated"] = "first",
+) -> typing.Union[
+    typing.Tuple[float, typing.Tuple[float, float]],
+    typing.Tuple[np.array, np.array],
+]:
     """Estimate the population size in mark-recapture studies with multiple
     recapture events using a nonparametric method based on the generalized
     jackknife approach that is robust to variability between population
@@ -218,6 +275,16 @@ def jackknife_mark_recapture_estimate(
         captured over the course of the study. The length of the sequence should
         correspond to the number of recapture events performed.
 
+        Alternately, a 2-D array with one such sequence per row, to estimate
+        many replicate studies at once.
+    selection : {"first", "interpolated"}, default "first"
+        How to select among jackknife estimators of different order.
+
+        If "first", use the first order k for which the test of whether
+        orders k and k + 1 differ fails to reject. If "interpolated", use the
+        improved selection procedure of Burnham and Overton, interpolating
+        between that order and the order below it.
+
     Returns
     -------
     float, Tuple[float, float]
@@ -227,12 +294,25 @@ def jackknife_mark_recapture_estimate(
         confidence interval cannot be computed so returned confidence interval
         is `(nan, nan)`.
 
+        If `f` is 2-D, instead returns an array of estimates with shape (n,)
+        and an array of confidence intervals with shape (n, 2).
+
     Notes
     -----
     The estimation procedure is designed for closed population mark-recapture
     studies where individual capture probabilities are assumed to be constant
     over time but may vary among individuals.
 
+    Estimator order m is selected as the first order for which the test of
+    whether orders m and m + 1 differ fails to reject at the 0.05 level, or
+    the highest order m = 5 if all tests reject.
+
+    The interpolated estimator is N = (1 - c) N_{m-1} + c N_m, with weight
+    c = 1.96 / |T_{m-1}| chosen such that the test of whether N differs from
+    N_{m-1} lies exactly at the 0.05 significance boundary. As orders m - 1
+    and m differ significantly, c < 1. Its standard error is computed from
+    the correspondingly interpolated jackknife coefficients.
+
     References
     ----------
     Amstrup, Steven C., Trent L. McDonald, and Bryan FJ Manly, eds. Handbook of
@@ -248,8 +328,57 @@ def jackknife_mark_recapture_estimate(
     >>> jackknife_mark_recapture_estimate(capture_frequencies)
     158.6
     """
-    for k in it.count():
-        if reject_h0(f, k):
-            continue
-        else:
-            return _NJk(k)(f), _95CIk(k)(f)
+    if selection not in ("first", "interpolated"):
+        raise ValueError(f"Unknown selection {selection}.")
+
+    estimates, standard_errors, test_statistics = _jackknife_statistics(f)
+    p_values = 2 * scipy_stats.norm.sf(np.abs(test_statistics))
+    rejects = p_values <= 0.05  # as test_standard_normal, nan fails to reject
+
+    # first order failing to reject, falling back to highest order
+    padding = np.zeros((*rejects.shape[:-1], 1), dtype=bool)
+    orders = np.argmin(np.concatenate([rejects, padding], axis=-1), axis=-1)
+
+    if selection == "first":
+        estimate = np.take_along_axis(
+            estimates, orders[..., None], axis=-1
+        ).squeeze(-1)
+        err = 1.96 * np.take_along_axis(
+            standard_errors, orders[..., None], axis=-1
+        ).squeeze(-1)
+    else:
+        estimate, err = _interpolate_estimate(f, orders, test_statistics)
+    err = np.where(orders == 0, np.nan, err)
+    ci = np.stack([estimate - err, estimate + err], axis=-1)
+
+    if np.ndim(f) == 1:
+        return float(estimate), tuple(map(float, ci))
+    return estimate, ci
+
+
+def _interpolate_estimate(
+    f: typing.Union[typing.Sequence[int], np.array],
+    orders: np.array,
+    test_statistics: np.array,
+) -> typing.Tuple[np.array, np.array]:
+    """Implementation detail for `jackknife_mark_recapture_estimate` that
+    evaluates the interpolated estimator and its 95% confidence interval
+    half-width."""
+    f = np.asarray(f, dtype=float)
+    a = _aik_table(f.shape[-1])
+
+    lower_orders = np.maximum(orders - 1, 0)
+    lower_statistics = np.take_along_axis(
+        test_statistics, lower_orders[..., None], axis=-1
+    )
+    with np.errstate(divide="ignore"):
+        weights = np.where(
+            orders[..., None] == 0,
+            0.0,
+            np.minimum(1.96 / np.abs(lower_statistics), 1.0),
+        )
+    coefficients = (1 - weights) * a[lower_orders] + weights * a[orders]
+
+    estimate = np.sum(coefficients * f, axis=-1)
+    variance = np.sum(coefficients**2 * f, axis=-1) - estimate
+    return estimate, 1.96 * np.sqrt(np.maximum(variance, 0))
@@ -1,8 +1,16 @@
+import typing
+
 import numpy as np
 
+from ._or_global_rng import or_global_rng
+
 
 # adapted from https://stackoverflow.com/a/64554001/17332200
-def jitter(values: np.array, amount: float = 0.05) -> np.array:
+def jitter(
+    values: np.array,
+    amount: float = 0.05,
+    rng: typing.Optional[np.random.Generator] = None,
+) -> np.array:
     """Add random jitter to each element in a numpy array.
 
     Useful to deconflict scatter plots.
@@ -14,6 +22,8 @@ def jitter(values: np.array, amount: float = 0.05) -> np.array:
     amount : float, default 0.05
         The scale of the jitter as a proportion of the peak-to-peak (max - min)
         range of the values.
+    rng : np.random.Generator, optional
+        Source of randomness. If None, numpy's global random state is used.
 
     Returns
     -------
@@ -23,4 +33,4 @@ def jitter(values: np.array, amount: float = 0.05) -> np.array:
     if len(values) == 0:  # handle empty case
         return values
     scale = (np.ptp(values) or 0.1) * amount
-    return np.random.normal(values, scale)
+    return or_global_rng(rng).normal(values, scale)
@@ -0,0 +1,60 @@
+import typing
+
+import numpy as np
+from scipy import special as scipy_special
+
+
+def nbinom_cdf_grid(
+    num_trials: typing.Union[int, np.array],
+    num_successes: typing.Union[float, np.array],
+    success_probability: typing.Union[float, np.array],
+) -> typing.Union[float, np.array]:
+    """Compute the cumulative distribution function (CDF) of the negative
+    binomial distribution, broadcasting over all arguments.
+
+    Fast path for `nbinom_cdf`, for use in hot loops and over large parameter
+    grids. Evaluates the regularized incomplete beta function directly,
+    bypassing per-call argument processing by `scipy.stats.nbinom`.
+
+    Parameters
+    ----------
+    num_trials : int or np.array
+        Total number of trials (successes + failures).
+    num_successes : float or np.array
+        The number of successes to be achieved. May be non-integer.
+    success_probability : float or np.array
+        Probability of success in each trial.
+
+    Returns
+    -------
+    float or np.array
+        The cumulative probability of achieving the specified number of
+        successes in the given number of trials, with shape given by
+        broadcasting arguments.
+
+        As for `scipy.stats.nbinom`, the number of failures is floored and
+        result is nan where `num_successes` is not positive or
+        `success_probability` is not within (0, 1].
+    """
+    num_successes = np.asarray(num_successes, dtype=float)
+    success_probability = np.asarray(success_probability, dtype=float)
+    num_failures = np.floor(num_trials - num_successes)
+
+    with np.errstate(invalid="ignore"):
+        # P(at most k failures before r-th success) == I_p(r, k + 1)
+        res = np.asarray(
+            scipy_special.betainc(
+                num_successes,
+                np.maximum(num_failures, 0) + 1,
+                success_probability,
+            ),
+        )
+    np.copyto(res, 0.0, where=num_failures < 0)
+    np.copyto(
+        res,
+        np.nan,
+        where=(num_successes <= 0)
+        | (success_probability <= 0)
+        | (success_probability > 1),
+    )
+    return res if res.ndim else res.item()
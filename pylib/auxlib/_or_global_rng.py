@@ -0,0 +1,16 @@
+import types
+import typing
+
+import numpy as np
+
+
+def or_global_rng(
+    rng: typing.Optional[np.random.Generator],
+) -> typing.Union[np.random.Generator, types.ModuleType]:
+    """Default to numpy's global random state if no generator is provided.
+
+    The `np.random` module is returned in place of a missing generator. It
+    provides legacy counterparts for `Generator` methods used throughout,
+    e.g., `choice`, `permutation`, `random`, `shuffle`, and `uniform`.
+    """
+    return np.random if rng is None else rng
@@ -1,11 +1,20 @@
+import typing
+
 import numpy as np
 
 
 class CalcKnockoutEffectsAdditive:
     """Functor to model contribution of additive small-effect genome sites.
-    to knockout outcome."""
+    to knockout outcome.
+
+    Only sites with nonzero effect are stored, so knockout effects are
+    calculated in time proportional to the number of effect sites rather than
+    genome size.
+    """
 
-    _additive_array: np.array
+    _effect_sites: np.array  # ascending indices of nonzero-effect sites
+    _effect_sizes: np.array  # effect of each site in _effect_sites
+    _num_sites: int
 
     def __init__(
         self: "CalcKnockoutEffectsAdditive", additive_array: np.array
@@ -23,7 +32,25 @@ class CalcKnockoutEffectsAdditive:
             positive values and maladaptive sites, if any, would have negative
             values. Can be generated e.g., via `create_additive_array`.
         """
-        self._additive_array = additive_array
+        additive_array = np.asarray(additive_array)
+        self._num_sites = len(additive_array)
+        self._effect_sites = np.flatnonzero(additive_array)
+        self._effect_sizes = additive_array[self._effect_sites]
+
+    @property
+    def _additive_array(self: "CalcKnockoutEffectsAdditive") -> np.array:
+        """Dense array of site effects, as passed on initialization."""
+        res = np.zeros(self._num_sites, dtype=self._effect_sizes.dtype)
+        res[self._effect_sites] = self._effect_sizes
+        return res
+
+    def _site_effect(self: "CalcKnockoutEffectsAdditive", site: int) -> float:
+        """Look up effect of knocking out `site`, zero if neutral, by binary
+        search over effect sites."""
+        pos = np.searchsorted(self._effect_sites, site)
+        if pos < len(self._effect_sites) and self._effect_sites[pos] == site:
+            return self._effect_sizes[pos]
+        return self._effect_sizes.dtype.type(0)
 
     def __call__(
         self: "CalcKnockoutEffectsAdditive", knockout: np.array
@@ -48,5 +75,124 @@ class CalcKnockoutEffectsAdditive:
             Positive values indicate a deleterious knockout effect, with 1.0
             taken as the detectability threshold (by convention elsewhere).
         """
-        active = self._additive_array * knockout
-        return np.sum(active)
+        knockout = np.asarray(knockout)
+        active = knockout[self._effect_sites].astype(bool)
+        return np.sum(self._effect_sizes[active])
+
+    def call_batch(
+        self: "CalcKnockoutEffectsAdditive", knockouts: np.array
+    ) -> np.array:
+        """Calculate the fitness effects of a stack of knockouts.
+
+        Parameters
+        ----------
+        knockouts : np.array
+            A two-dimensional binary array, with each row representing a
+            knockout as described for `__call__`.
+
+        Returns
+        -------
+        np.array
+            One-dimensional array of cumulative knockout effects, one per row
+            of `knockouts`.
+        """
+        knockouts = np.atleast_2d(knockouts)
+        return knockouts[:, self._effect_sites] @ self._effect_sizes
+
+    def call_sites(
+        self: "CalcKnockoutEffectsAdditive", knockout_sites: np.array
+    ) -> float:
+        """Calculate the fitness effect of a knockout given as an array of
+        distinct knocked-out site indices, e.g., from `KnockoutMask.sites`.
+
+        See `__call__` for details.
+        """
+        return self.call_batch_sites([knockout_sites])[0]
+
+    def call_batch_sites(
+        self: "CalcKnockoutEffectsAdditive",
+        knockout_sites: typing.Sequence[np.array],
+    ) -> np.array:
+        """Calculate the fitness effects of several knockouts, each given as
+        an array of knocked-out site indices.
+
+        Parameters
+        ----------
+        knockout_sites : typing.Sequence[np.array]
+            For each knockout, an array of distinct knocked-out site indices.
+
+        Returns
+        -------
+        np.array
+            One-dimensional array of cumulative knockout effects, one per
+            knockout.
+        """
+        lengths = [*map(len, knockout_sites)]
+        sites = (
+            np.concatenate(knockout_sites).astype(int)
+            if knockout_sites
+            else np.empty(0, dtype=int)
+        )
+        owners = np.repeat(np.arange(len(lengths)), lengths)
+
+        # match knocked-out sites to effect sites
+        pos = np.searchsorted(self._effect_sites, sites)
+        pos[pos == len(self._effect_sites)] = 0
+        hit = (
+            self._effect_sites[pos] == sites
+            if len(self._effect_sites)
+            else np.zeros_like(sites, dtype=bool)
+        )
+        return np.bincount(
+            owners[hit],
+            weights=self._effect_sizes[pos[hit]],
+            minlength=len(lengths),
+        ).astype(float)
+
+    def make_incremental(
+        self: "CalcKnockoutEffectsAdditive", knockout: np.array
+    ) -> "_CalcKnockoutEffectsAdditiveIncremental":
+        """Create state to incrementally evaluate single-site extensions of
+        `knockout`, in time per site logarithmic in the number of effect
+        sites.
+
+        See Also
+        --------
+        IncrementalKnockoutEvaluator
+        """
+        return _CalcKnockoutEffectsAdditiveIncremental(self, knockout)
+
+
+class _CalcKnockoutEffectsAdditiveIncremental:
+    """Implementation detail for `CalcKnockoutEffectsAdditive` that tracks a
+    running sum of knocked-out site effects."""
+
+    _functor: CalcKnockoutEffectsAdditive
+
+    effect: float  # current net additive effect
+
+    def __init__(
+        self: "_CalcKnockoutEffectsAdditiveIncremental",
+        functor: CalcKnockoutEffectsAdditive,
+        knockout: np.array,
+    ) -> None:
+        self._functor = functor
+        self.effect = functor(knockout)
+
+    def peek(
+        self: "_CalcKnockoutEffectsAdditiveIncremental", site: int
+    ) -> float:
+        """Calculate net effect if `site` were also knocked out."""
+        return self.effect + self._functor._site_effect(site)
+
+    def add(
+        self: "_CalcKnockoutEffectsAdditiveIncremental", site: int
+    ) -> None:
+        """Knock out `site`."""
+        self.effect += self._functor._site_effect(site)
+
+    def remove(
+        self: "_CalcKnockoutEffectsAdditiveIncremental", site: int
+    ) -> None:
+        """Restore `site`."""
+        self.effect -= self._functor._site_effect(site)
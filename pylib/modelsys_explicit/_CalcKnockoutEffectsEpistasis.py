@@ -2,10 +2,12 @@ import typing
 
 import numpy as np
 import opytional as opyt
+from scipy import sparse as scipy_sparse
 from scipy import stats as scipy_stats
 
 from ..auxlib._nonzero import nonzero
 from ..auxlib._nunique import nunique
+from ..auxlib._or_global_rng import or_global_rng
 
 
 class CalcKnockoutEffectsEpistasis:
@@ -14,13 +16,16 @@ class CalcKnockoutEffectsEpistasis:
 
     _effect_thresh: int
     _effect_size: np.array
-    _epistasis_matrix: np.array
+    _epistasis_matrix: typing.Union[np.array, scipy_sparse.spmatrix]
+    _set_incidence: scipy_sparse.csr_matrix  # epistatic sets x genome sites
+    _site_incidence: scipy_sparse.csc_matrix  # same, indexed by site
 
     def __init__(
         self: "CalcKnockoutEffectsEpistasis",
-        epistasis_matrix: np.array,
+        epistasis_matrix: typing.Union[np.array, scipy_sparse.spmatrix],
         effect_thresh: typing.Optional[int] = None,
         effect_size: typing.Union[float, typing.Tuple[float, float]] = 1.0,
+        rng: typing.Optional[np.random.Generator] = None,
     ) -> None:
         """Initialize functor with epistatic interaction information.
 
@@ -34,6 +39,10 @@ class CalcKnockoutEffectsEpistasis:
             Can be generated via `create_epistasis_matrix_overlapping` or
             `create_epistasis_matrix_disjoint`.
 
+            Alternately, a sparse incidence matrix with one row per epistatic
+            set and one column per genome site, as generated by either with
+            `sparse=True`. Empty rows are ignored.
+
         effect_thresh : int, optional
             The threshold number of activations required to consider an effect.
             If None, uses the largest set size in the epistatic matrix.
@@ -44,23 +53,40 @@ class CalcKnockoutEffectsEpistasis:
 
             If a tuple, interpreted as a lower and upper bound for a uniform
             distribution from which to draw effect sizes.
+
+        rng : np.random.Generator, optional
+            Source of randomness for drawing effect sizes. If None, numpy's
+            global random state is used.
         """
-        self._effect_thresh = opyt.or_value(
-            effect_thresh,
-            scipy_stats.mode(
+        if scipy_sparse.issparse(epistasis_matrix):
+            set_incidence = _trim_set_incidence(epistasis_matrix)
+            num_epistasis_sets = set_incidence.shape[0]
+            default_thresh = (
+                set_incidence.sum(axis=1).max() if num_epistasis_sets else 0
+            )
+        else:
+            num_epistasis_sets = nunique(
+                epistasis_matrix[epistasis_matrix != 0]
+            )
+            set_incidence = _make_set_incidence(
+                epistasis_matrix, num_epistasis_sets
+            )
+            default_thresh = scipy_stats.mode(
                 nonzero(epistasis_matrix), axis=None, keepdims=False
-            ).count,
-        )
-        num_epistasis_sets = nunique(epistasis_matrix[epistasis_matrix != 0])
+            ).count
+
+        self._effect_thresh = opyt.or_value(effect_thresh, default_thresh)
         try:
             lb, ub = effect_size
-            self._effect_size = np.random.uniform(
+            self._effect_size = or_global_rng(rng).uniform(
                 lb, ub, size=num_epistasis_sets
             )
         except TypeError:
             self._effect_size = np.full(num_epistasis_sets, effect_size)
 
         self._epistasis_matrix = epistasis_matrix
+        self._set_incidence = set_incidence
+        self._site_incidence = self._set_incidence.tocsc()
 
     def __call__(
         self: "CalcKnockoutEffectsEpistasis",
@@ -83,13 +109,156 @@ class CalcKnockoutEffectsEpistasis:
             If the number of knocked out sites within an epistatic set exceeds
             `effect_thresh`, returns `effect_size`; otherwise, returns 0.0.
         """
-        active_sites = self._epistasis_matrix * knockout
-        values, counts = np.unique(active_sites, return_counts=True)
-        activations = np.zeros_like(self._effect_size)
-        if values.size and values[-1:] > 0:
-            has_leading_zero = not values[0]
-            counts_ = counts[has_leading_zero:]
-            values_ = values[has_leading_zero:] - 1
-            activations[values_] = counts_ >= self._effect_thresh
+        counts = self._set_incidence @ np.asarray(knockout, dtype=bool)
+        activations = counts >= self._effect_thresh
+        return (activations * self._effect_size).sum()
+
+    def call_sites(
+        self: "CalcKnockoutEffectsEpistasis", knockout_sites: np.array
+    ) -> float:
+        """Calculate the fitness effect of a knockout given as an array of
+        distinct knocked-out site indices, e.g., from `KnockoutMask.sites`.
 
+        Reads only the incidence columns of knocked-out sites. See `__call__`
+        for details.
+        """
+        counts = np.asarray(
+            self._site_incidence[:, knockout_sites].sum(axis=1),
+        ).ravel()
+        activations = counts >= self._effect_thresh
         return (activations * self._effect_size).sum()
+
+    def call_batch(
+        self: "CalcKnockoutEffectsEpistasis", knockouts: np.array
+    ) -> np.array:
+        """Calculate the fitness effects of a stack of knockouts considering
+        epistatic interactions.
+
+        Parameters
+        ----------
+        knockouts : np.array
+            A two-dimensional binary array, with each row representing a
+            knockout as described for `__call__`.
+
+        Returns
+        -------
+        np.array
+            One-dimensional array of epistatic knockout effects, one per row
+            of `knockouts`.
+        """
+        knockouts = np.atleast_2d(np.asarray(knockouts, dtype=bool))
+        counts = (self._set_incidence @ knockouts.T).T
+        activations = counts >= self._effect_thresh
+        return activations @ self._effect_size
+
+    def make_incremental(
+        self: "CalcKnockoutEffectsEpistasis", knockout: np.array
+    ) -> "_CalcKnockoutEffectsEpistasisIncremental":
+        """Create state to incrementally evaluate single-site extensions of
+        `knockout`, updating only epistatic sets that touch each site.
+
+        See Also
+        --------
+        IncrementalKnockoutEvaluator
+        """
+        return _CalcKnockoutEffectsEpistasisIncremental(self, knockout)
+
+
+class _CalcKnockoutEffectsEpistasisIncremental:
+    """Implementation detail for `CalcKnockoutEffectsEpistasis` that tracks
+    knocked-out member counts per epistatic set."""
+
+    _counts: np.array  # knocked-out members per epistatic set
+    _effect_size: np.array
+    _effect_thresh: int
+    _site_incidence: scipy_sparse.csc_matrix
+
+    effect: float  # current net epistatic effect
+
+    def __init__(
+        self: "_CalcKnockoutEffectsEpistasisIncremental",
+        functor: CalcKnockoutEffectsEpistasis,
+        knockout: np.array,
+    ) -> None:
+        self._effect_size = functor._effect_size
+        self._effect_thresh = functor._effect_thresh
+        self._site_incidence = functor._site_incidence
+        self._counts = functor._set_incidence @ np.asarray(
+            knockout, dtype=bool
+        )
+        self.effect = functor(knockout)
+
+    def _site_sets(
+        self: "_CalcKnockoutEffectsEpistasisIncremental", site: int
+    ) -> typing.Tuple[np.array, np.array]:
+        """Get epistatic sets including `site` and membership multiplicity."""
+        incidence = self._site_incidence
+        begin, end = incidence.indptr[site], incidence.indptr[site + 1]
+        return incidence.indices[begin:end], incidence.data[begin:end]
+
+    def _delta(
+        self: "_CalcKnockoutEffectsEpistasisIncremental",
+        sets: np.array,
+        before: np.array,
+        after: np.array,
+    ) -> float:
+        """Calculate change in effect from set count transition."""
+        thresh = self._effect_thresh
+        activated = (after >= thresh).astype(int) - (before >= thresh)
+        return activated @ self._effect_size[sets]
+
+    def peek(
+        self: "_CalcKnockoutEffectsEpistasisIncremental", site: int
+    ) -> float:
+        """Calculate net effect if `site` were also knocked out."""
+        sets, multiplicity = self._site_sets(site)
+        before = self._counts[sets]
+        return self.effect + self._delta(sets, before, before + multiplicity)
+
+    def add(
+        self: "_CalcKnockoutEffectsEpistasisIncremental", site: int
+    ) -> None:
+        """Knock out `site`."""
+        sets, multiplicity = self._site_sets(site)
+        before = self._counts[sets]
+        self._counts[sets] += multiplicity
+        self.effect += self._delta(sets, before, self._counts[sets])
+
+    def remove(
+        self: "_CalcKnockoutEffectsEpistasisIncremental", site: int
+    ) -> None:
+        """Restore `site`."""
+        sets, multiplicity = self._site_sets(site)
+        before = self._counts[sets]
+        self._counts[sets] -= multiplicity
+        self.effect += self._delta(sets, before, self._counts[sets])
+
+
+def _make_set_incidence(
+    epistasis_matrix: np.array, num_epistasis_sets: int
+) -> scipy_sparse.csr_matrix:
+    """Implementation detail for `CalcKnockoutEffectsEpistasis` that indexes
+    genome sites belonging to each epistatic set.
+
+    Returns sparse matrix with one row per epistatic set and one column per
+    genome site, with entries counting a site's memberships in a set.
+    Knocked-out member counts for each set can then be calculated as a
+    sparse matrix product with a knockout mask (or stack of masks).
+    """
+    epistasis_matrix = np.atleast_2d(epistasis_matrix).astype(int)
+    __, site_indices = epistasis_matrix.nonzero()
+    set_indices = nonzero(epistasis_matrix) - 1  # set labels are 1-indexed
+    return scipy_sparse.csr_matrix(
+        (np.ones_like(set_indices), (set_indices, site_indices)),
+        shape=(num_epistasis_sets, epistasis_matrix.shape[1]),
+    )
+
+
+def _trim_set_incidence(
+    incidence: scipy_sparse.spmatrix,
+) -> scipy_sparse.csr_matrix:
+    """Implementation detail for `CalcKnockoutEffectsEpistasis` that
+    normalizes a sparse set incidence matrix, dropping empty sets (rows)."""
+    incidence = scipy_sparse.csr_matrix(incidence, dtype=int)
+    incidence.eliminate_zeros()
+    return incidence[np.diff(incidence.indptr) > 0]
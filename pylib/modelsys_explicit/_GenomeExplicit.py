@@ -1,6 +1,10 @@
 import typing
 
 import numpy as np
+import opytional as opyt
+
+from ..auxlib._KnockoutMask import KnockoutMask
+from ._IncrementalKnockoutEvaluator import IncrementalKnockoutEvaluator
 
 
 class GenomeExplicit:
@@ -61,6 +65,10 @@ class GenomeExplicit:
             Length of array corresponds to genome size, i.e., one entry per
             genome site.
 
+            May also be a packed `KnockoutMask`. If all knockout effect
+            functors provide a `call_sites` method, it is evaluated from
+            knocked-out site indices without unpacking.
+
         Returns
         -------
         float
@@ -68,6 +76,17 @@ class GenomeExplicit:
             deleterious, =<-1.0 if cumulative effects of knockouts is detectably
             adaptive, 0 otherwise.
         """
+        if isinstance(knockout, KnockoutMask):
+            call_sites = [
+                getattr(effect, "call_sites", None)
+                for effect in self._knockout_effect_functors
+            ]
+            if None not in call_sites:
+                sites = knockout.sites()
+                result = sum(call(sites) for call in call_sites)
+                return self._apply_assay_artifacts(result)
+
+        knockout = np.asarray(knockout)
         if knockout.size and knockout.dtype != bool:
             raise ValueError(
                 f"Knockout array should be boolean, but was {knockout.dtype}.",
@@ -75,7 +94,91 @@ class GenomeExplicit:
         result = sum(
             effect(knockout) for effect in self._knockout_effect_functors
         )
+        return self._apply_assay_artifacts(result)
+
+    def test_knockouts(
+        self: "GenomeExplicit", knockouts: np.array
+    ) -> np.array:
+        """Test signs of fitness effects for a stack of knockouts, if
+        observable.
+
+        Vectorized counterpart to `test_knockout`. Knockout effect functors
+        providing a `call_batch` method evaluate all knockouts in a single
+        pass; other functors are called once per knockout. Assay artifact
+        functors are called once on the array of all knockout effects, so
+        should operate elementwise (e.g., draw one noise value per element).
+
+        Parameters
+        ----------
+        knockouts : np.array
+            A two-dimensional binary array, with each row representing a
+            knockout where 1 indicates site knockout.
+
+            Number of columns corresponds to genome size, i.e., one entry per
+            genome site.
+
+        Returns
+        -------
+        np.array
+            One-dimensional array with one result per knockout, as described
+            for `test_knockout`.
+        """
+        knockouts = np.asarray(knockouts)
+        if knockouts.ndim != 2:
+            raise ValueError(
+                f"Knockouts array should be two-dimensional, "
+                f"but had {knockouts.ndim} dimensions.",
+            )
+        if knockouts.size and knockouts.dtype != bool:
+            raise ValueError(
+                f"Knockout array should be boolean, but was {knockouts.dtype}.",
+            )
+        result = np.zeros(len(knockouts))
+        for effect in self._knockout_effect_functors:
+            call_batch = getattr(effect, "call_batch", None)
+            if call_batch is not None:
+                result += call_batch(knockouts)
+            else:
+                result += [effect(knockout) for knockout in knockouts]
+        return self._apply_assay_artifacts(result)
+
+    def make_incremental_evaluator(
+        self: "GenomeExplicit",
+        knockout: typing.Optional[np.array] = None,
+        num_sites: typing.Optional[int] = None,
+    ) -> IncrementalKnockoutEvaluator:
+        """Create a stateful tester for single-site extensions of a base
+        knockout.
+
+        Parameters
+        ----------
+        knockout : np.array, optional
+            A binary array representing base knockout sites, where 1 indicates
+            site knockout.
+
+            If None, base knockout is empty and `num_sites` must be provided.
+        num_sites : int, optional
+            Number of sites in genome, used only if `knockout` is None.
+
+        Returns
+        -------
+        IncrementalKnockoutEvaluator
+            Evaluator initialized with a copy of base knockout.
+        """
+        knockout = opyt.or_else(
+            knockout, lambda: np.zeros(num_sites, dtype=bool)
+        )
+        return IncrementalKnockoutEvaluator(self, knockout)
+
+    def _apply_assay_artifacts(
+        self: "GenomeExplicit", result: typing.Union[float, np.array]
+    ) -> typing.Union[float, np.array]:
+        """Sequence raw knockout effect(s) through assay artifact functors and
+        threshold for detectability."""
+        shape = np.shape(result)
         for artifact in self._assay_artifact_functors:
             result = artifact(result)
+        if shape:  # broadcast artifacts that ignore their input
+            result = np.broadcast_to(result, shape).astype(float)
         # TODO refactor: make thresholding an assay artifact instead of hardcode
         return result * (np.abs(result) >= 1.0)
@@ -0,0 +1,154 @@
+import typing
+
+import numpy as np
+
+
+class IncrementalKnockoutEvaluator:
+    """Stateful knockout tester that evaluates single-site extensions of a
+    working knockout without re-evaluating the whole genome.
+
+    Knockout effect functors providing a `make_incremental` method (e.g.,
+    `CalcKnockoutEffectsAdditive`, `CalcKnockoutEffectsEpistasis`) are updated
+    in time proportional to the effects touching each site. Other functors are
+    re-evaluated in full for each extension.
+
+    Extensions made with `extend` are journaled, and can be kept with `commit`
+    or undone with `rollback`.
+
+    Notes
+    -----
+    Effects are accumulated as running sums, so may differ from
+    `GenomeExplicit.test_knockout` by floating point rounding.
+    """
+
+    _apply_assay_artifacts: typing.Callable
+    _effect_states: typing.List[typing.Any]
+    _journal: typing.List[int]  # sites extended since last commit/rollback
+    _knockout: np.array
+
+    def __init__(
+        self: "IncrementalKnockoutEvaluator",
+        genome: "GenomeExplicit",  # noqa: F821
+        knockout: np.array,
+    ) -> None:
+        """Initialize evaluator with a base knockout.
+
+        Parameters
+        ----------
+        genome : GenomeExplicit
+            Genome to evaluate knockouts on.
+        knockout : np.array
+            A binary array representing base knockout sites, where 1
+            indicates site knockout. Copied, not modified.
+
+        See Also
+        --------
+        GenomeExplicit.make_incremental_evaluator
+        """
+        self._knockout = np.array(knockout, dtype=bool)
+        self._apply_assay_artifacts = genome._apply_assay_artifacts
+        self._effect_states = [
+            (
+                effect.make_incremental(self._knockout)
+                if hasattr(effect, "make_incremental")
+                else _IncrementalFallback(effect, self._knockout)
+            )
+            for effect in genome._knockout_effect_functors
+        ]
+        self._journal = []
+
+    @property
+    def knockout(self: "IncrementalKnockoutEvaluator") -> np.array:
+        """Read-only view of working knockout, including uncommitted
+        extensions."""
+        view = self._knockout.view()
+        view.flags.writeable = False
+        return view
+
+    def test(self: "IncrementalKnockoutEvaluator") -> float:
+        """Test sign of working knockout's fitness effect, if observable.
+
+        Returns
+        -------
+        float
+            Result as described for `GenomeExplicit.test_knockout`.
+        """
+        return self._apply_assay_artifacts(
+            sum(state.effect for state in self._effect_states),
+        )
+
+    def test_extension(
+        self: "IncrementalKnockoutEvaluator", site: int
+    ) -> float:
+        """Test sign of fitness effect of working knockout with `site` also
+        knocked out, if observable.
+
+        The working knockout is not modified.
+
+        Returns
+        -------
+        float
+            Result as described for `GenomeExplicit.test_knockout`.
+        """
+        if self._knockout[site]:
+            raise ValueError(f"Site {site} is already knocked out.")
+        return self._apply_assay_artifacts(
+            sum(state.peek(site) for state in self._effect_states),
+        )
+
+    def extend(self: "IncrementalKnockoutEvaluator", site: int) -> None:
+        """Knock out `site` in working knockout, pending commit or
+        rollback."""
+        if self._knockout[site]:
+            raise ValueError(f"Site {site} is already knocked out.")
+        for state in self._effect_states:
+            state.add(site)
+        self._knockout[site] = True
+        self._journal.append(site)
+
+    def commit(self: "IncrementalKnockoutEvaluator") -> None:
+        """Keep extensions made since last commit or rollback."""
+        self._journal.clear()
+
+    def rollback(self: "IncrementalKnockoutEvaluator") -> None:
+        """Undo extensions made since last commit or rollback."""
+        while self._journal:
+            site = self._journal.pop()
+            self._knockout[site] = False
+            for state in self._effect_states:
+                state.remove(site)
+
+
+class _IncrementalFallback:
+    """Implementation detail for `IncrementalKnockoutEvaluator` that adapts
+    knockout effect functors without incremental support by full
+    re-evaluation."""
+
+    _effect: typing.Callable
+    _knockout: np.array  # shared with owning evaluator
+
+    effect: float
+
+    def __init__(
+        self: "_IncrementalFallback",
+        effect: typing.Callable,
+        knockout: np.array,
+    ) -> None:
+        self._effect = effect
+        self._knockout = knockout
+        self.effect = effect(knockout)
+
+    def peek(self: "_IncrementalFallback", site: int) -> float:
+        knockout = self._knockout.copy()
+        knockout[site] = True
+        return self._effect(knockout)
+
+    def add(self: "_IncrementalFallback", site: int) -> None:
+        knockout = self._knockout.copy()
+        knockout[site] = True
+        self.effect = self._effect(knockout)
+
+    def remove(self: "_IncrementalFallback", site: int) -> None:
+        knockout = self._knockout.copy()
+        knockout[site] = False
+        self.effect = self._effect(knockout)
@@ -1,6 +1,7 @@
 from ._CalcKnockoutEffectsAdditive import CalcKnockoutEffectsAdditive
 from ._CalcKnockoutEffectsEpistasis import CalcKnockoutEffectsEpistasis
 from ._GenomeExplicit import GenomeExplicit
+from ._IncrementalKnockoutEvaluator import IncrementalKnockoutEvaluator
 from ._create_additive_array import create_additive_array
 from ._create_epistasis_matrix_disjoint import create_epistasis_matrix_disjoint
 from ._create_epistasis_matrix_overlapping import (  # noqa: isort
@@ -18,4 +19,5 @@ __all__ = [
     "describe_additive_array",
     "describe_epistasis_matrix",
     "GenomeExplicit",
+    "IncrementalKnockoutEvaluator",
 ]
@@ -4,11 +4,14 @@ import warnings
 
 import numpy as np
 
+from ..auxlib._or_global_rng import or_global_rng
+
 
 def create_additive_array(
     num_sites: int,
     effect_prevalence: Number,
-    effect_size_distribution: typing.Callable = np.random.rand,
+    effect_size_distribution: typing.Optional[typing.Callable] = None,
+    rng: typing.Optional[np.random.Generator] = None,
 ) -> np.array:
     """Create an array representing additive genetic effects.
 
@@ -19,11 +22,14 @@ def create_additive_array(
     effect_prevalence : Number
         The fraction of sites to be affected, if between 0 and 1, otherwise the
         absolute number of sites to be affected.
-    effect_size_distribution : typing.Callable, default numpy.rand
+    effect_size_distribution : typing.Callable, optional
         A function to generate random numbers for the magnitude of effects.
 
-        Default np.random.rand, which generates random numbers between 0 and 1.
+        If None, generates uniform random numbers between 0 and 1 from `rng`.
         Pass, e.g., `lambda x: np.random.rand(x) * y` to scale effect size.
+    rng : np.random.Generator, optional
+        Source of randomness for effect site placement and default effect
+        sizes. If None, numpy's global random state is used.
 
     Returns
     -------
@@ -33,14 +39,15 @@ def create_additive_array(
     """
     res = np.zeros(num_sites)
     return _add_additive_effects(
-        res, effect_prevalence, effect_size_distribution
+        res, effect_prevalence, effect_size_distribution, rng
     )
 
 
 def _add_additive_effects(
     array: np.array,
     effect_prevalence: Number,
-    effect_size_distribution: typing.Callable = np.random.rand,
+    effect_size_distribution: typing.Optional[typing.Callable] = None,
+    rng: typing.Optional[np.random.Generator] = None,
 ) -> np.array:
     """Add additional additive effects to an existing additive effects array.
 
@@ -55,11 +62,14 @@ def _add_additive_effects(
     effect_prevalence : Number
         The fraction of sites to be affected, if between 0 and 1, otherwise the
         number of sites to be affected.
-    effect_size_distribution : typing.Callable, default numpy.random.rand
+    effect_size_distribution : typing.Callable, optional
         A function to generate random numbers for the magnitude of effects.
 
-        Default np.random.rand, which generates random numbers between 0 and 1.
+        If None, generates uniform random numbers between 0 and 1 from `rng`.
         Pass, e.g., `lambda x: np.random.rand(x) * y` to scale effect size.
+    rng : np.random.Generator, optional
+        Source of randomness for effect site placement and default effect
+        sizes. If None, numpy's global random state is used.
 
     Returns
     -------
@@ -81,7 +91,11 @@ def _add_additive_effects(
         else int(effect_prevalence)
     )
 
+    rng = or_global_rng(rng)
+    if effect_size_distribution is None:
+        effect_size_distribution = rng.random
+
     effects = effect_size_distribution(num_effects)
-    indices = np.random.choice(num_sites, num_effects, replace=False)
+    indices = rng.choice(num_sites, num_effects, replace=False)
     array[indices] += effects
     return array
@@ -1,10 +1,20 @@
+import typing
+
 import numpy as np
+from scipy import sparse as scipy_sparse
 from scipy import stats as scipy_stats
 
+from ..auxlib._or_global_rng import or_global_rng
+from ._create_epistasis_matrix_overlapping import _make_sparse_epistasis_matrix
+
 
 def create_epistasis_matrix_disjoint(
-    num_sites: int, num_epistatic_sets: int, epistatic_set_size: int
-) -> np.array:
+    num_sites: int,
+    num_epistatic_sets: int,
+    epistatic_set_size: int,
+    rng: typing.Optional[np.random.Generator] = None,
+    sparse: bool = False,
+) -> typing.Union[np.array, scipy_sparse.csr_matrix]:
     """Generate a matrix specifying epistatic interactions between genome
     sites, allowing each site to have at most one epistatic interaction.
 
@@ -19,13 +29,21 @@ def create_epistasis_matrix_disjoint(
         The number of epistatic sets to be created.
     epistatic_set_size : int
         The size of each epistatic set.
+    rng : np.random.Generator, optional
+        Source of randomness. If None, numpy's global random state is used.
+    sparse : bool, default False
+        If True, return a sparse epistatic set incidence matrix instead of a
+        dense label matrix.
 
     Returns
     -------
-    numpy.ndarray
+    numpy.ndarray or scipy.sparse.csr_matrix
         Arrangement of epistatic redundancy labels, where columns correspond to
         genome sites and there is only a single row.
 
+        If `sparse`, instead a sparse incidence matrix as described for
+        `create_epistasis_matrix_overlapping`.
+
     Notes
     -----
     - Epistatic set labels are indexed starting from 1 to distinguish from
@@ -40,8 +58,10 @@ def create_epistasis_matrix_disjoint(
     """
     # assign each set value to a random site...
     # with no two assigned to the same site
-    site_indices = np.empty((num_epistatic_sets, epistatic_set_size), dtype=int)
-    site_indices.flat = np.random.choice(
+    site_indices = np.empty(
+        (num_epistatic_sets, epistatic_set_size), dtype=int
+    )
+    site_indices.flat = or_global_rng(rng).choice(
         num_sites, num_epistatic_sets * epistatic_set_size, replace=False
     )
 
@@ -52,6 +72,9 @@ def create_epistasis_matrix_disjoint(
         0,
     )
 
+    if sparse:
+        return _make_sparse_epistasis_matrix(site_indices, num_sites)
+
     # each epistasis set gets its own column, with identical value
     # corresponding to that set's identity (1-indexed)
     epistasis_values = (
@@ -1,14 +1,21 @@
 from numbers import Integral
+import typing
 
 import numpy as np
+from scipy import sparse as scipy_sparse
 from scipy import stats as scipy_stats
 
 from ..auxlib._cumcount import cumcount
+from ..auxlib._or_global_rng import or_global_rng
 
 
 def create_epistasis_matrix_overlapping(
-    num_sites: int, num_epistatic_sets: int, epistatic_set_size: int
-):
+    num_sites: int,
+    num_epistatic_sets: int,
+    epistatic_set_size: int,
+    rng: typing.Optional[np.random.Generator] = None,
+    sparse: bool = False,
+) -> typing.Union[np.array, scipy_sparse.csr_matrix]:
     """Generate a matrix specifying epistatic interactions between genome
     sites, allowing each site to have more than one epistatic interaction.
 
@@ -23,20 +30,33 @@ def create_epistasis_matrix_overlapping(
         The number of epistatic sets to be created.
     epistatic_set_size : int
         The size of each epistatic set.
+    rng : np.random.Generator, optional
+        Source of randomness. If None, numpy's global random state is used.
+    sparse : bool, default False
+        If True, return a sparse epistatic set incidence matrix instead of a
+        dense label matrix.
 
     Returns
     -------
-    numpy.ndarray
+    numpy.ndarray or scipy.sparse.csr_matrix
         Arrangement of epistatic redundancy labels, where columns correspond to
         genome sites and rows allow each site to contain more than one epistatic
         value.
 
+        If `sparse`, instead a matrix with one row per epistatic set and one
+        column per genome site, with entries set to 1 for sites belonging to
+        each set. Rows index sites belonging to each set; a site-wise index is
+        available via `tocsc`. Sets are identical to the dense case, given
+        identical random state.
+
     Notes
     -----
     - Epistatic set labels are indexed starting from 1 to distinguish from
       empty zeros.
     - The height of the matrix is determined by the site with the most
       epistatic labels.
+    - For large genomes, pass a `np.random.Generator` as `rng`. Sampling from
+      numpy's global random state permutes all sites for each epistatic set.
 
     See Also
     --------
@@ -47,12 +67,18 @@ def create_epistasis_matrix_overlapping(
     """
     # assign each set value to a random site...
     # more than one set value may be assigned per site
-    site_indices = np.empty((num_epistatic_sets, epistatic_set_size), dtype=int)
+    rng = or_global_rng(rng)
+    site_indices = np.empty(
+        (num_epistatic_sets, epistatic_set_size), dtype=int
+    )
     for i in range(num_epistatic_sets):
-        site_indices[i] = np.random.choice(
+        site_indices[i] = rng.choice(
             num_sites, epistatic_set_size, replace=False
         )  # replace=False: no vals from same set at same site
 
+    if sparse:
+        return _make_sparse_epistasis_matrix(site_indices, num_sites)
+
     # how many rows are necessary for the site with most epistatic values?
     nrows = (
         scipy_stats.mode(site_indices, axis=None, keepdims=False).count
@@ -75,3 +101,22 @@ def create_epistasis_matrix_overlapping(
     epistasis_matrix[row_indices, col_indices] = epistasis_values
 
     return epistasis_matrix
+
+
+def _make_sparse_epistasis_matrix(
+    site_indices: np.array, num_sites: int
+) -> scipy_sparse.csr_matrix:
+    """Implementation detail for `create_epistasis_matrix_overlapping` and
+    `create_epistasis_matrix_disjoint` that builds a sparse incidence matrix
+    from member site indices for each epistatic set (one set per row)."""
+    num_epistatic_sets, epistatic_set_size = site_indices.shape
+    return scipy_sparse.csr_matrix(
+        (
+            np.ones(site_indices.size, dtype=int),
+            (
+                np.repeat(np.arange(num_epistatic_sets), epistatic_set_size),
+                site_indices.ravel(),
+            ),
+        ),
+        shape=(num_epistatic_sets, num_sites),
+    )
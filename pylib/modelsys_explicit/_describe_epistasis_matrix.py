@@ -1,9 +1,31 @@
+import typing
+
 import numpy as np
 import pandas as pd
+from scipy import sparse as scipy_sparse
+
+
+def describe_epistasis_matrix(
+    epistasis_matrix: typing.Union[np.array, scipy_sparse.spmatrix],
+) -> pd.DataFrame:
+    """Create a dataframe describing epistatic effects of each genome site.
 
+    Accepts dense label matrices or sparse incidence matrices, as created by
+    `create_epistasis_matrix_overlapping` or
+    `create_epistasis_matrix_disjoint`.
+    """
+    if scipy_sparse.issparse(epistasis_matrix):
+        num_effects = np.asarray(
+            (epistasis_matrix != 0).sum(axis=0), dtype=int
+        ).ravel()
+        return pd.DataFrame(
+            {
+                "site": np.arange(len(num_effects)),
+                "epistasis site": num_effects.astype(bool),
+                "num epistasis effects": num_effects,
+            },
+        )
 
-def describe_epistasis_matrix(epistasis_matrix: np.array) -> pd.DataFrame:
-    """Create a dataframe describing epistatic effects of each genome site."""
     view = np.atleast_2d(epistasis_matrix).T
     return pd.DataFrame(
         {
@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from pylib.analyze_additive import assay_additive_adaptive
+from pylib.modelsys_explicit import (
+    CalcKnockoutEffectsAdditive,
+    GenomeExplicit,
+    create_additive_array,
+)
+
+
+@pytest.fixture
+def genome():
+    num_sites = 1000
+    additive_array = create_additive_array(
+        num_sites, 0.05, rng=np.random.default_rng(1)
+    )  # 50 sites
+    return GenomeExplicit([CalcKnockoutEffectsAdditive(additive_array / 5)])
+
+
+def test_assay_additive_adaptive_smoke(genome: GenomeExplicit):
+    knockout_doses = [110, 130, 150, 170, 190]
+    est = assay_additive_adaptive(
+        genome.test_knockout,
+        1000,
+        knockout_doses,
+        target_relative_error=0.3,
+        rng=np.random.default_rng(2),
+    )
+    assert isinstance(est, dict)
+    assert est["knockout doses"] == knockout_doses
+    assert len(est["dose sensitivies"]) == len(knockout_doses)
+    assert est["dose replications"] == [*map(len, est["dose outcomes"])]
+    assert min(est["dose replications"]) >= 20
+    assert 10 < est["num additive sites"] < 200
+
+
+def test_assay_additive_adaptive_budget(genome: GenomeExplicit):
+    est = assay_additive_adaptive(
+        genome.test_knockout,
+        1000,
+        [110, 130, 150, 170, 190],
+        target_relative_error=0.0,
+        max_replications=205,
+        num_pilot_replications=10,
+        batch_size=20,
+        rng=np.random.default_rng(2),
+    )
+    assert sum(est["dose replications"]) == 205
+
+
+def test_assay_additive_adaptive_target(genome: GenomeExplicit):
+    est = assay_additive_adaptive(
+        genome.test_knockout,
+        1000,
+        [110, 130, 150, 170, 190],
+        target_relative_error=0.2,
+        max_replications=10000,
+        rng=np.random.default_rng(2),
+    )
+    assert sum(est["dose replications"]) < 10000
+    assert max(est["relative standard errors"]) <= 0.2
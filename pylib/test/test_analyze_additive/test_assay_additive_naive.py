@@ -19,3 +19,25 @@ def test_assay_additive_naive_smoke():
         genome.test_knockout, num_sites, knockout_doses, num_replications=1000
     )
     assert isinstance(est, dict)
+
+
+def test_assay_additive_naive_bootstrap():
+    num_sites = 1000
+    additive_array = create_additive_array(num_sites, 0.05)  # 50 sites
+    genome = GenomeExplicit(
+        [CalcKnockoutEffectsAdditive(additive_array)],
+    )
+    knockout_doses = [20, 40, 60, 80]
+    est = assay_additive_naive(
+        genome.test_knockout,
+        num_sites,
+        knockout_doses,
+        num_replications=100,
+        num_bootstraps=20,
+        workers=2,
+    )
+    assert est["dose outcomes"].shape == (4, 100)
+    assert est["bootstrap fits"].shape == (20, 2)
+    for key in "num additive sites ci", "per-site effect size ci":
+        lower, upper = est[key]
+        assert lower <= upper
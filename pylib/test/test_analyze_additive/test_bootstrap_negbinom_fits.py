@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from pylib.analyze_additive import bootstrap_negbinom_fits
+from pylib.auxlib._nbinom_cdf import nbinom_cdf
+
+
+@pytest.fixture
+def dose_outcomes():
+    rng = np.random.default_rng(1)
+    knockout_doses = [20, 30, 35, 40]
+    sensitivities = nbinom_cdf(np.array(knockout_doses), 10, 0.44)
+    outcomes = rng.random((len(knockout_doses), 50)) < sensitivities[:, None]
+    return knockout_doses, outcomes.astype(float)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_bootstrap_negbinom_fits(dose_outcomes, workers: int):
+    knockout_doses, outcomes = dose_outcomes
+    fits = bootstrap_negbinom_fits(
+        knockout_doses, outcomes, 8, workers=workers
+    )
+    assert fits.shape == (8, 2)
+    r, p = fits.T
+    assert (r >= 1).all()
+    assert ((0 < p) & (p <= 1)).all()
+
+
+def test_bootstrap_negbinom_fits_reproducible(dose_outcomes):
+    knockout_doses, outcomes = dose_outcomes
+    serial = bootstrap_negbinom_fits(
+        knockout_doses, outcomes, 8, workers=1, rng=np.random.default_rng(2)
+    )
+    parallel = bootstrap_negbinom_fits(
+        knockout_doses, outcomes, 8, workers=2, rng=np.random.default_rng(2)
+    )
+    assert np.array_equal(serial, parallel)
+
+
+def test_bootstrap_negbinom_fits_empty(dose_outcomes):
+    knockout_doses, outcomes = dose_outcomes
+    fits = bootstrap_negbinom_fits(knockout_doses, outcomes, 0)
+    assert fits.shape == (0, 2)
+
+
+def test_bootstrap_negbinom_fits_shape_mismatch(dose_outcomes):
+    knockout_doses, outcomes = dose_outcomes
+    with pytest.raises(ValueError):
+        bootstrap_negbinom_fits(knockout_doses[:-1], outcomes, 8)
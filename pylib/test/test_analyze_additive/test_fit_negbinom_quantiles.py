@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 
 from pylib.analyze_additive import fit_negbinom_quantiles
 from pylib.auxlib._nbinom_cdf import nbinom_cdf
@@ -29,3 +30,19 @@ def test_fit_negbinom_quantiles_noised():
     assert 2 < result["r"] < 5
     assert 0.01 < result["p"] < 0.1
     assert len(result["fit quantiles"]) == 3
+
+
+def test_fit_negbinom_quantiles_refine():
+    n, p = 10, 0.443
+    counts = np.array([20, 30, 35, 40])
+    cumulative_probabilities = nbinom_cdf(counts, n, p)
+    grid = fit_negbinom_quantiles(counts, cumulative_probabilities)
+    refined = fit_negbinom_quantiles(
+        counts, cumulative_probabilities, refine=True
+    )
+    # p between grid points is recovered, unlike grid search
+    assert grid["p"] == pytest.approx(0.44)
+    assert refined["r"] == n
+    assert refined["p"] == pytest.approx(p, abs=1e-6)
+    assert refined["error"] < 1e-12 < grid["error"]
+    assert np.allclose(refined["fit quantiles"], cumulative_probabilities)
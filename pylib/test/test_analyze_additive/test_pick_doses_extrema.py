@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 
 from pylib.analyze_additive import pick_doses_extrema
 
@@ -53,3 +54,49 @@ def test_knockout_effective_range_spread():
     result = pick_doses_extrema(mock_test_knockout, num_sites, max_doses)
     assert len(result) == max_doses
     assert min(result) >= 6 - 5 and max(result) <= 6 + 5
+
+
+def test_knockout_bisect_all_effective():
+    result = pick_doses_extrema(lambda x: True, 10, 5, method="bisect")
+    assert np.array_equal(result, np.linspace(1, 10, 5, dtype=int))
+
+
+def test_knockout_bisect_all_ineffective():
+    result = pick_doses_extrema(lambda x: False, 10, 5, method="bisect")
+    assert np.array_equal(result, np.linspace(1, 10, 5, dtype=int))
+
+
+def test_knockout_bisect_effective_range():
+    num_tests = 0
+
+    def mock_test_knockout(sample):
+        nonlocal num_tests
+        num_tests += 1
+        return sample.sum() >= 400
+
+    num_sites = 10000
+    max_doses = 5
+    result = pick_doses_extrema(
+        mock_test_knockout, num_sites, max_doses, method="bisect"
+    )
+    assert np.array_equal(result, [397, 398, 399, 400, 402])
+    assert num_tests <= 2 * (np.log2(num_sites) + 2)
+
+
+def test_knockout_bisect_votes():
+    rng = np.random.default_rng(1)
+
+    def mock_test_knockout(sample):  # noisy between 100 and 200 sites
+        return sample.sum() >= rng.integers(100, 200)
+
+    result = pick_doses_extrema(
+        mock_test_knockout, 1000, 5, method="bisect", num_votes=20
+    )
+    assert len(result) == 5
+    assert 95 <= min(result) <= 110 and 190 <= max(result) <= 205
+    assert min(result) <= max(result)
+
+
+def test_knockout_bad_method():
+    with pytest.raises(ValueError):
+        pick_doses_extrema(lambda x: True, 10, 5, method="bogus")
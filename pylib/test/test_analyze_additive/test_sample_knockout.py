@@ -2,6 +2,7 @@ import numpy as np
 import pytest
 
 from pylib.analyze_additive import sample_knockout
+from pylib.auxlib._KnockoutMask import KnockoutMask
 
 
 @pytest.mark.parametrize(
@@ -21,3 +22,19 @@ def test_sample_knockout(num_sites: int, num_knockouts: int):
             sample_knockout(num_knockouts, num_sites), result
         ):
             pass
+
+
+def test_sample_knockout_rng():
+    result1 = sample_knockout(5, 20, rng=np.random.default_rng(1))
+    result2 = sample_knockout(5, 20, rng=np.random.default_rng(1))
+    assert np.array_equal(result1, result2)
+    assert result1.sum() == 5
+
+
+def test_sample_knockout_packed():
+    result = sample_knockout(5, 100, rng=np.random.default_rng(1), packed=True)
+    assert isinstance(result, KnockoutMask)
+    assert result.popcount() == 5
+    assert np.array_equal(
+        result, sample_knockout(5, 100, rng=np.random.default_rng(1))
+    )
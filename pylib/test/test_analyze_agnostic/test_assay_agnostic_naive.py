@@ -55,3 +55,9 @@ def test_assay_agnostic_naive_smoke():
 
     res = assay_agnostic_naive(df_skeletons)
     assert isinstance(res, dict)
+
+    res_interpolated = assay_agnostic_naive(
+        df_skeletons, selection="interpolated"
+    )
+    assert isinstance(res_interpolated, dict)
+    assert res_interpolated.keys() == res.keys()
@@ -1,6 +1,11 @@
+import numpy as np
+import pandas as pd
 import pytest
 
 from pylib.analyze_epistasis import describe_skeletons, skeletonize_naive
+from pylib.analyze_epistasis._describe_skeletons import (
+    _make_skeletonization_df,
+)
 from pylib.modelsys_explicit import (
     CalcKnockoutEffectsAdditive,
     CalcKnockoutEffectsEpistasis,
@@ -30,3 +35,44 @@ def test_describe_skeletons(num_skeletons: int):
 
     if num_skeletons:
         assert set(res["site"]) == set(range(num_sites))
+
+
+def test_make_skeletonization_df():
+    skeletons = [np.array([0, 2, 1, 0]), np.array([1, 3, 0, 2])]
+    res = _make_skeletonization_df(skeletons)
+    assert res["site"].tolist() == [0, 1, 2, 3]
+    assert res["skeleton outcome count, excluded"].tolist() == [1, 2, 1, 1]
+    assert res["skeleton outcome count, included"].tolist() == [1, 0, 1, 1]
+    assert res["skeleton outcome frequency, excluded"].tolist() == [
+        0.5,
+        1.0,
+        0.5,
+        0.5,
+    ]
+    assert res["skeleton dose, excluded"].tolist()[:3] == [3.0, 2.5, 2.0]
+    assert res["skeleton dose ptp, excluded"].tolist()[1] == 1
+    assert res["skeleton exclusion order, excluded"].tolist() == [
+        1.0,
+        2.5,
+        1.0,
+        2.0,
+    ]
+    assert np.isclose(
+        res["skeleton exclusion order std, excluded"][1], np.sqrt(0.5)
+    )
+    assert res["skeleton exclusion order, included"].isna().all()
+
+
+def test_describe_skeletons_batched():
+    num_sites = 100
+    genome = GenomeExplicit(
+        [CalcKnockoutEffectsAdditive(create_additive_array(num_sites, 0.1))],
+    )
+    skeletons = [
+        skeletonize_naive(num_sites, genome.test_knockout) for _ in range(5)
+    ]
+    expected = describe_skeletons(skeletons, genome.test_knockout)
+    res = describe_skeletons(
+        skeletons, genome.test_knockout, test_knockouts=genome.test_knockouts
+    )
+    pd.testing.assert_frame_equal(res, expected)
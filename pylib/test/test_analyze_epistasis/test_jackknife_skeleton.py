@@ -1,7 +1,13 @@
 import numpy as np
 import pandas as pd
 
-from pylib.analyze_epistasis import jackknife_skeleton
+from pylib.analyze_epistasis import jackknife_skeleton, skeletonize_naive
+from pylib.auxlib._KnockoutMask import KnockoutMask
+from pylib.modelsys_explicit import (
+    CalcKnockoutEffectsAdditive,
+    GenomeExplicit,
+    create_additive_array,
+)
 
 
 def mock_test_knockout(knockout_mask: np.array) -> float:
@@ -26,3 +32,28 @@ def test_jackknife_skeleton():
 
     # Asserting that the result is as expected
     pd.testing.assert_frame_equal(result_df, expected_df)
+
+
+def test_jackknife_skeleton_make_evaluator():
+    num_sites = 100
+    genome = GenomeExplicit(
+        [CalcKnockoutEffectsAdditive(create_additive_array(num_sites, 0.1))],
+    )
+    skeleton = skeletonize_naive(num_sites, genome.test_knockout)
+
+    expected_df = jackknife_skeleton(skeleton, genome.test_knockout)
+    result_df = jackknife_skeleton(
+        skeleton,
+        genome.test_knockout,
+        make_evaluator=genome.make_incremental_evaluator,
+    )
+    pd.testing.assert_frame_equal(result_df, expected_df)
+
+
+def test_jackknife_skeleton_packed():
+    mock_skeleton = np.array([0, 1, 0, 0], dtype=bool)
+    expected_df = jackknife_skeleton(mock_skeleton, mock_test_knockout)
+    result_df = jackknife_skeleton(
+        KnockoutMask.from_array(mock_skeleton), mock_test_knockout
+    )
+    pd.testing.assert_frame_equal(result_df, expected_df)
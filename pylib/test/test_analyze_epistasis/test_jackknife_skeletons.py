@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pylib.analyze_epistasis import (
+    jackknife_skeleton,
+    jackknife_skeletons,
+    skeletonize_naive,
+)
+from pylib.modelsys_explicit import (
+    CalcKnockoutEffectsAdditive,
+    CalcKnockoutEffectsEpistasis,
+    GenomeExplicit,
+    create_additive_array,
+    create_epistasis_matrix_overlapping,
+)
+
+
+@pytest.fixture
+def genome():
+    num_sites = 50
+    return GenomeExplicit(
+        [
+            CalcKnockoutEffectsAdditive(create_additive_array(num_sites, 0.2)),
+            CalcKnockoutEffectsEpistasis(
+                create_epistasis_matrix_overlapping(num_sites, 4, 2),
+            ),
+        ],
+    )
+
+
+@pytest.mark.parametrize("batched", [False, True])
+@pytest.mark.parametrize("workers", [1, 2])
+def test_jackknife_skeletons(
+    genome: GenomeExplicit, batched: bool, workers: int
+):
+    skeletons = [
+        skeletonize_naive(50, genome.test_knockout) for __ in range(6)
+    ]
+    skeletons.append(skeletons[0].copy())  # ensure duplicate knockouts
+
+    results = jackknife_skeletons(
+        skeletons,
+        genome.test_knockout,
+        test_knockouts=genome.test_knockouts if batched else None,
+        workers=workers,
+    )
+    assert len(results) == len(skeletons)
+    for skeleton, result_df in zip(skeletons, results):
+        expected_df = jackknife_skeleton(skeleton, genome.test_knockout)
+        pd.testing.assert_frame_equal(result_df, expected_df)
+
+
+def test_jackknife_skeletons_dedup():
+    num_tests = 0
+
+    def mock_test_knockout(knockout_mask: np.array) -> float:
+        nonlocal num_tests
+        num_tests += 1
+        return np.any(knockout_mask[::2]) * 1.25
+
+    skeleton = np.array([0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 2], dtype=int)
+    results = jackknife_skeletons([skeleton, skeleton], mock_test_knockout)
+    assert num_tests == 9
+    pd.testing.assert_frame_equal(results[0], results[1])
+    pd.testing.assert_frame_equal(
+        results[0], jackknife_skeleton(skeleton, mock_test_knockout)
+    )
+
+
+def test_jackknife_skeletons_empty():
+    assert jackknife_skeletons([], lambda x: 0.0) == []
+
+
+def test_jackknife_skeletons_ragged():
+    with pytest.raises(ValueError):
+        jackknife_skeletons(
+            [np.zeros(3, dtype=int), np.zeros(4, dtype=int)], lambda x: 0.0
+        )
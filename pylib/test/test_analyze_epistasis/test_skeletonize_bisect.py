@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+
+from pylib.analyze_epistasis import skeletonize_bisect
+from pylib.modelsys_explicit import (
+    CalcKnockoutEffectsAdditive,
+    CalcKnockoutEffectsEpistasis,
+    GenomeExplicit,
+    create_additive_array,
+    create_epistasis_matrix_overlapping,
+)
+
+
+def test_skeletonize_bisect_knockout_all_sites_sensitive():
+    def mock_test_knockout(knockout: np.array) -> bool:
+        return np.any(knockout)  # sensitive to any knockout
+
+    num_sites = 10
+    skeleton = skeletonize_bisect(num_sites, mock_test_knockout)
+
+    assert len(skeleton) == num_sites  # correct length
+    assert not np.any(skeleton)  # no sites should be knocked out
+
+
+def test_skeletonize_bisect_knockout_effect_no_sites_sensitive():
+    def mock_test_knockout(knockout: np.array) -> bool:
+        return False  # sensitive to no knockouts
+
+    num_sites = 10
+    skeleton = skeletonize_bisect(num_sites, mock_test_knockout)
+
+    assert len(skeleton) == num_sites  # correct length
+    assert np.all(skeleton)  # all sites should be knocked out
+    assert set(skeleton) == set(range(1, num_sites + 1))
+
+
+def test_skeletonize_bisect_single_sensitive_site():
+    def mock_test_knockout(knockout):
+        return knockout[0]  # sensitive to only the first site
+
+    expected = np.array([0, 1, 1])
+    skeleton = skeletonize_bisect(expected.size, mock_test_knockout)
+    assert np.array_equal(skeleton.astype(bool), expected)
+    assert set(skeleton) == set(
+        range(skeleton.astype(bool).sum() + 1)
+    )  # all sites in ordering
+
+
+@pytest.mark.parametrize("initial_block_size", [1, 7, 1000])
+def test_skeletonize_bisect_equivalence(initial_block_size: int):
+    num_sites = 300
+    genome = GenomeExplicit(
+        [
+            CalcKnockoutEffectsAdditive(
+                create_additive_array(num_sites, 0.05)
+            ),
+            CalcKnockoutEffectsEpistasis(
+                create_epistasis_matrix_overlapping(num_sites, 10, 4),
+                effect_size=(0.7, 1.6),
+            ),
+        ],
+    )
+    num_tests = 0
+
+    def test_knockout(knockout: np.array) -> float:
+        nonlocal num_tests
+        num_tests += 1
+        return genome.test_knockout(knockout)
+
+    np.random.seed(1)
+    skeleton = skeletonize_bisect(num_sites, test_knockout, initial_block_size)
+
+    # visiting sites in same order one at a time should give same skeleton
+    np.random.seed(1)
+    expected = np.zeros(num_sites, dtype=int)
+    for site in np.random.permutation(num_sites):
+        knockout = expected.astype(bool)
+        knockout[site] = True
+        if not genome.test_knockout(knockout):
+            expected[site] = expected.max() + 1
+
+    assert np.array_equal(skeleton, expected)
+    assert num_tests < num_sites
@@ -1,6 +1,13 @@
 import numpy as np
 
 from pylib.analyze_epistasis import skeletonize_naive
+from pylib.modelsys_explicit import (
+    CalcKnockoutEffectsAdditive,
+    CalcKnockoutEffectsEpistasis,
+    GenomeExplicit,
+    create_additive_array,
+    create_epistasis_matrix_overlapping,
+)
 
 
 def test_skeletonize_naive_knockout_all_sites_sensitive():
@@ -43,3 +50,52 @@ def test_skeletonize_naive_single_sensitive_site():
     assert set(skeleton) == set(
         range(skeleton.astype(bool).sum() + 1)
     )  # all sites in ordering
+
+
+def test_skeletonize_naive_make_evaluator():
+    num_sites = 100
+    genome = GenomeExplicit(
+        [
+            CalcKnockoutEffectsAdditive(create_additive_array(num_sites, 0.1)),
+            CalcKnockoutEffectsEpistasis(
+                create_epistasis_matrix_overlapping(num_sites, 4, 2),
+            ),
+        ],
+    )
+
+    np.random.seed(1)
+    expected = skeletonize_naive(num_sites, genome.test_knockout)
+    np.random.seed(1)
+    skeleton = skeletonize_naive(
+        num_sites,
+        genome.test_knockout,
+        make_evaluator=genome.make_incremental_evaluator,
+    )
+    assert np.array_equal(skeleton, expected)
+
+
+def test_skeletonize_naive_rng():
+    def mock_test_knockout(knockout):
+        return knockout[:5].sum() > 2
+
+    skeleton1 = skeletonize_naive(
+        20, mock_test_knockout, rng=np.random.default_rng(1)
+    )
+    skeleton2 = skeletonize_naive(
+        20, mock_test_knockout, rng=np.random.default_rng(1)
+    )
+    assert np.array_equal(skeleton1, skeleton2)
+
+
+def test_skeletonize_naive_retained_knockouts_unchanged():
+    num_sites = 20
+    retained = []
+
+    def test_knockout(knockout: np.array) -> float:
+        retained.append((knockout, knockout.copy()))
+        return float(knockout[:5].sum() >= 2)
+
+    skeletonize_naive(num_sites, test_knockout)
+    assert retained
+    for knockout, at_call in retained:
+        assert np.array_equal(knockout, at_call)
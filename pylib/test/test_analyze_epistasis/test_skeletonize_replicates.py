@@ -0,0 +1,129 @@
+import numpy as np
+import pytest
+
+from pylib.analyze_epistasis import (
+    skeletonize_bisect,
+    skeletonize_naive,
+    skeletonize_replicates,
+)
+from pylib.modelsys_explicit import (
+    CalcKnockoutEffectsAdditive,
+    CalcKnockoutEffectsEpistasis,
+    GenomeExplicit,
+    create_additive_array,
+    create_epistasis_matrix_overlapping,
+)
+
+
+def _add_global_noise(result: np.array) -> np.array:
+    # draws from global random state; nonnegative, as adaptive knockout
+    # results are unsupported
+    return result + np.random.uniform(0, 1, size=np.shape(result))
+
+
+@pytest.fixture
+def genome() -> GenomeExplicit:
+    num_sites = 100
+    return GenomeExplicit(
+        [
+            CalcKnockoutEffectsAdditive(create_additive_array(num_sites, 0.1)),
+            CalcKnockoutEffectsEpistasis(
+                create_epistasis_matrix_overlapping(num_sites, 4, 2),
+            ),
+        ],
+    )
+
+
+@pytest.mark.parametrize(
+    "skeletonize", [skeletonize_naive, skeletonize_bisect]
+)
+def test_skeletonize_replicates_reproducible(
+    genome: GenomeExplicit, skeletonize: callable
+):
+    num_sites, n = 100, 6
+    serial = [
+        *skeletonize_replicates(
+            num_sites,
+            genome.test_knockout,
+            n,
+            workers=1,
+            seed=1,
+            skeletonize=skeletonize,
+        ),
+    ]
+    parallel = [
+        *skeletonize_replicates(
+            num_sites,
+            genome.test_knockout,
+            n,
+            workers=2,
+            seed=1,
+            skeletonize=skeletonize,
+        ),
+    ]
+    assert len(serial) == n
+    assert np.array_equal(np.vstack(serial), np.vstack(parallel))
+    assert all(len(skeleton) == num_sites for skeleton in serial)
+    assert len({skeleton.tobytes() for skeleton in serial}) > 1
+
+
+def test_skeletonize_replicates_unordered(genome: GenomeExplicit):
+    num_sites, n = 100, 6
+    ordered = skeletonize_replicates(
+        num_sites, genome.test_knockout, n, workers=2, seed=1
+    )
+    unordered = skeletonize_replicates(
+        num_sites, genome.test_knockout, n, workers=2, seed=1, ordered=False
+    )
+    assert sorted(skeleton.tobytes() for skeleton in ordered) == sorted(
+        skeleton.tobytes() for skeleton in unordered
+    )
+
+
+def test_skeletonize_replicates_kwargs(genome: GenomeExplicit):
+    num_sites, n = 100, 3
+    expected = skeletonize_replicates(
+        num_sites, genome.test_knockout, n, workers=1, seed=1
+    )
+    result = skeletonize_replicates(
+        num_sites,
+        genome.test_knockout,
+        n,
+        workers=2,
+        seed=1,
+        make_evaluator=genome.make_incremental_evaluator,
+    )
+    assert np.array_equal(np.vstack([*expected]), np.vstack([*result]))
+
+
+def test_skeletonize_replicates_global_random_state(genome: GenomeExplicit):
+    num_sites, n = 100, 6
+    noisy_genome = GenomeExplicit(
+        genome._knockout_effect_functors,
+        assay_artifacts=[_add_global_noise],
+    )
+    np.random.seed(1)
+    random_state = np.random.get_state()
+    serial = [
+        *skeletonize_replicates(
+            num_sites, noisy_genome.test_knockout, n, workers=1, seed=1
+        ),
+    ]
+    # caller's global random state is preserved
+    assert np.array_equal(np.random.get_state()[1], random_state[1])
+
+    parallel = [
+        *skeletonize_replicates(
+            num_sites,
+            noisy_genome.test_knockout,
+            n,
+            workers=3,
+            seed=1,
+            ordered=False,
+        ),
+    ]
+    assert sorted(skeleton.tobytes() for skeleton in serial) == sorted(
+        skeleton.tobytes() for skeleton in parallel
+    )
+    # replicates draw from distinct global random streams
+    assert len({skeleton.tobytes() for skeleton in serial}) == n
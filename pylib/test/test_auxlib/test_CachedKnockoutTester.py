@@ -0,0 +1,139 @@
+import sqlite3
+
+import numpy as np
+import pytest
+
+from pylib.auxlib._CachedKnockoutTester import CachedKnockoutTester
+
+
+class MockTestKnockout:
+    def __init__(self):
+        self.num_calls = 0
+
+    def __call__(self, knockout: np.array) -> float:
+        self.num_calls += 1
+        return float(knockout.sum() >= 2)
+
+
+def test_cached_knockout_tester():
+    test_knockout = MockTestKnockout()
+    tester = CachedKnockoutTester(test_knockout)
+    assert tester(np.array([1, 1, 0], dtype=bool)) == 1.0
+    assert tester(np.array([1, 0, 0], dtype=bool)) == 0.0
+    assert tester(np.array([1, 1, 0], dtype=bool)) == 1.0
+    assert test_knockout.num_calls == 2
+    assert tester.hits == 1
+    assert tester.misses == 2
+    assert len(tester) == 2
+
+
+def test_cached_knockout_tester_distinguishes_length():
+    test_knockout = MockTestKnockout()
+    tester = CachedKnockoutTester(test_knockout)
+    tester(np.array([1, 1, 0], dtype=bool))
+    tester(np.array([1, 1, 0, 0], dtype=bool))
+    assert test_knockout.num_calls == 2
+
+
+def test_cached_knockout_tester_lru():
+    test_knockout = MockTestKnockout()
+    tester = CachedKnockoutTester(test_knockout, max_size=2)
+    a, b, c = np.eye(3, dtype=bool)
+    tester(a)
+    tester(b)
+    tester(a)  # b is now least recently used
+    tester(c)  # evicts b
+    assert len(tester) == 2
+    tester(a)
+    assert test_knockout.num_calls == 3
+    tester(b)
+    assert test_knockout.num_calls == 4
+
+
+@pytest.mark.parametrize("batched", [False, True])
+def test_cached_knockout_tester_batch(batched: bool):
+    test_knockout = MockTestKnockout()
+    batch_calls = []
+
+    def test_knockouts(knockouts: np.array) -> np.array:
+        batch_calls.append(len(knockouts))
+        return (knockouts.sum(axis=1) >= 2).astype(float)
+
+    tester = CachedKnockoutTester(
+        test_knockout, test_knockouts=test_knockouts if batched else None
+    )
+    tester(np.array([1, 1, 0], dtype=bool))
+    knockouts = np.array(
+        [[1, 1, 0], [0, 0, 1], [0, 0, 1], [1, 1, 1]], dtype=bool
+    )
+    assert tester.test_knockouts(knockouts).tolist() == [1.0, 0.0, 0.0, 1.0]
+    assert tester.hits == 2
+    assert tester.misses == 3
+    if batched:
+        assert batch_calls == [2]
+        assert test_knockout.num_calls == 1
+    else:
+        assert test_knockout.num_calls == 3
+
+    with pytest.raises(ValueError):
+        tester.test_knockouts(knockouts[0])
+
+
+def test_cached_knockout_tester_persistence(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    test_knockout = MockTestKnockout()
+    tester = CachedKnockoutTester(
+        test_knockout, path=path, namespace="genome-a"
+    )
+    tester(np.array([1, 1, 0], dtype=bool))
+    tester.test_knockouts(np.eye(3, dtype=bool))
+    tester.close()
+    assert test_knockout.num_calls == 4
+
+    tester = CachedKnockoutTester(
+        test_knockout, path=path, namespace="genome-a"
+    )
+    assert tester(np.array([1, 1, 0], dtype=bool)) == 1.0
+    assert tester.test_knockouts(np.eye(3, dtype=bool)).tolist() == [0.0] * 3
+    assert test_knockout.num_calls == 4
+    assert tester.hits == 4 and tester.misses == 0
+
+    tester.clear()
+    assert len(tester) == 0
+    tester(np.array([1, 1, 0], dtype=bool))
+    assert test_knockout.num_calls == 5
+    tester.close()
+
+
+def test_cached_knockout_tester_namespaces(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    knockout = np.array([1, 1, 0], dtype=bool)
+    tester_a = CachedKnockoutTester(lambda k: 1.0, path=path, namespace="a")
+    tester_b = CachedKnockoutTester(lambda k: 2.0, path=path, namespace="b")
+    assert tester_a(knockout) == 1.0
+    assert tester_b(knockout) == 2.0
+    assert tester_a.misses == tester_b.misses == 1
+
+    tester_b.clear()
+    tester_b.close()
+    tester_a.close()
+
+    tester_a = CachedKnockoutTester(lambda k: 3.0, path=path, namespace="a")
+    assert tester_a(knockout) == 1.0  # persisted, and not cleared by b
+    tester_a.close()
+
+
+def test_cached_knockout_tester_requires_namespace(tmp_path):
+    with pytest.raises(ValueError):
+        CachedKnockoutTester(lambda k: 1.0, path=str(tmp_path / "cache.db"))
+
+
+def test_cached_knockout_tester_rejects_unnamespaced_store(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    with sqlite3.connect(path) as store:
+        store.execute(
+            "CREATE TABLE knockout_results (key BLOB PRIMARY KEY, result REAL)"
+        )
+    store.close()
+    with pytest.raises(ValueError):
+        CachedKnockoutTester(lambda k: 1.0, path=path, namespace="a")
@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 
 from pylib.auxlib._IrwinHallDistribution import IrwinHallDistribution
 
@@ -14,3 +15,17 @@ def test_IrwinHallDistribution_cdf():
         assert np.isclose(dist.cdf(1 * n), 0)
         assert 0 < dist.cdf(2 * n) < 1
         assert np.isclose(dist.cdf(3 * n), 1)
+
+
+def test_IrwinHallDistribution_cdf_empty_sum():
+    dist = IrwinHallDistribution(0, 0.5, 0.51)
+    assert dist.cdf(1.0) == 1
+    assert dist.cdf(-1.0) == 0
+
+
+def test_IrwinHallDistribution_cdf_loc_scale():
+    dist = IrwinHallDistribution(2, 1, 3)
+    # loc and scale apply in units of underlying uniform distribution width
+    assert dist.cdf(4.0, 0.5) == pytest.approx(0.125)
+    assert dist.cdf(6.0, loc=0.5, scale=1.5) == pytest.approx(0.5)
+    assert dist.cdf(2.0, loc=-1.0) == pytest.approx(0.5)
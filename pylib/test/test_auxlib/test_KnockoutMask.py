@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from pylib.auxlib._KnockoutMask import KnockoutMask
+
+
+@pytest.mark.parametrize("num_sites", [0, 1, 7, 64, 65, 200])
+def test_knockout_mask_roundtrip(num_sites: int):
+    knockout = np.random.default_rng(1).random(num_sites) < 0.5
+    mask = KnockoutMask.from_array(knockout)
+    assert mask.num_sites == num_sites
+    assert len(mask.words) == -(-num_sites // 64)
+    unpacked = np.asarray(mask)
+    assert unpacked.dtype == bool
+    assert np.array_equal(unpacked, knockout)
+    assert mask.popcount() == knockout.sum()
+    assert [*mask] == np.flatnonzero(knockout).tolist()
+    assert np.array_equal(mask.sites(), np.flatnonzero(knockout))
+    assert mask == KnockoutMask.from_sites(num_sites, np.flatnonzero(knockout))
+
+
+def test_knockout_mask_set_clear():
+    mask = KnockoutMask(100)
+    assert mask.popcount() == 0
+    mask.set(3)
+    mask.set(64)
+    mask.set(99)
+    assert mask[3] and mask[64] and mask[99] and not mask[4]
+    assert [*mask] == [3, 64, 99]
+    mask.clear(64)
+    assert not mask[64]
+    assert mask.popcount() == 2
+    with pytest.raises(IndexError):
+        mask.set(100)
+
+
+def test_knockout_mask_ops():
+    a = KnockoutMask.from_array([1, 1, 0, 0])
+    b = KnockoutMask.from_array([0, 1, 1, 0])
+    assert np.array_equal(a ^ b, [1, 0, 1, 0])
+    assert np.array_equal(a | b, [1, 1, 1, 0])
+    assert np.array_equal(a & b, [0, 1, 0, 0])
+    with pytest.raises(ValueError):
+        a ^ KnockoutMask(5)
+
+
+def test_knockout_mask_copy():
+    a = KnockoutMask(10)
+    b = a.copy()
+    b.set(1)
+    assert a != b
+    assert not a[1]
+    with pytest.raises(ValueError):
+        a.words[0] = 1
@@ -0,0 +1,76 @@
+from fractions import Fraction
+import math
+
+import numpy as np
+import pytest
+
+from pylib.auxlib._irwin_hall_cdf import irwin_hall_cdf
+
+
+def _exact_cdf(n: int, z: Fraction) -> float:
+    if z <= 0:
+        return 0.0
+    if z >= n:
+        return 1.0
+    res = sum(
+        (-1) ** k * math.comb(n, k) * (z - k) ** n
+        for k in range(math.floor(z) + 1)
+    )
+    return float(res / math.factorial(n))
+
+
+@pytest.mark.parametrize("n", [1, 2, 5, 20, 60, 150])
+def test_irwin_hall_cdf_exact(n: int):
+    zs = [Fraction(i * n, 40) for i in range(-2, 43)]
+    expected = [_exact_cdf(n, z) for z in zs]
+    actual = irwin_hall_cdf(n, np.array([*map(float, zs)]))
+    assert np.allclose(actual, expected, rtol=0, atol=1e-5)
+
+
+def test_irwin_hall_cdf_tail():
+    # deep tail, where relative accuracy matters
+    for n, z in (200, 5), (60, 10), (100, 25):
+        expected = _exact_cdf(n, Fraction(z))
+        assert irwin_hall_cdf(n, z) == pytest.approx(expected, rel=1e-9)
+
+
+def test_irwin_hall_cdf_vectorized():
+    ns = np.arange(1, 300)
+    res = irwin_hall_cdf(ns, 1.0, 0.045, 0.055)
+    assert res.shape == ns.shape
+    assert np.all((0 <= res) & (res <= 1))
+    for n in 1, 10, 21, 100, 299:
+        assert res[n - 1] == irwin_hall_cdf(n, 1.0, 0.045, 0.055)
+    assert np.all(np.diff(res) <= 0)  # adding summands shifts mass right
+
+
+def test_irwin_hall_cdf_bounds():
+    for n in 1, 10, 1000:
+        assert irwin_hall_cdf(n, 1 * n, 1, 3) == 0
+        assert irwin_hall_cdf(n, 2 * n, 1, 3) == pytest.approx(0.5)
+        assert irwin_hall_cdf(n, 3 * n, 1, 3) == 1
+        assert irwin_hall_cdf(n, 3 * n, 3, 1) == 1
+
+
+def test_irwin_hall_cdf_broadcast():
+    res = irwin_hall_cdf(np.array([[1], [4]]), np.array([0.25, 0.5, 2.0]))
+    assert res.shape == (2, 3)
+    assert np.allclose(res[0], [0.25, 0.5, 1.0])
+    assert res[1, 2] == pytest.approx(0.5)
+
+
+@pytest.mark.parametrize("n", [41, 45, 52, 80])
+def test_irwin_hall_cdf_approximation(n: int):
+    # includes normal approximation fallback, so check documented accuracy
+    zs = [Fraction(i * n, 160) for i in range(161)]
+    expected = [_exact_cdf(n, z) for z in zs]
+    actual = irwin_hall_cdf(n, np.array([*map(float, zs)]))
+    assert np.allclose(actual, expected, rtol=0, atol=1e-7)
+
+
+def test_irwin_hall_cdf_empty_sum():
+    # sum of zero uniforms is identically zero
+    res = irwin_hall_cdf(0, np.array([-1.0, 0.0, 1.0, 5.0]), 1, 3)
+    assert np.array_equal(res, [0.0, 1.0, 1.0, 1.0])
+    assert irwin_hall_cdf(0, 0.5) == 1.0
+    assert np.allclose(irwin_hall_cdf(np.arange(3), 0.5), [1.0, 0.5, 0.125])
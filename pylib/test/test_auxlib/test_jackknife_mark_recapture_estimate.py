@@ -3,6 +3,7 @@ import pytest
 
 from pylib.auxlib._jackknife_mark_recapture_estimate import (
     _95CIk,
+    _jackknife_statistics,
     _NJk,
     _NJk_v2,
     _seNjk,
@@ -91,3 +92,88 @@ def test_jackknife_mark_recapture_estimate():
     assert abs(est - 158.6) < 1
     assert abs(ci[0] - (158.6 - 21.9 * 1.96)) < 1
     assert abs(ci[1] - (158.6 + 21.9 * 1.96)) < 1
+
+
+def test_jackknife_statistics():
+    f = [43, 16, 8, 6, 0, 2, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
+    estimates, standard_errors, test_statistics = _jackknife_statistics(f)
+
+    assert estimates.shape == standard_errors.shape == (6,)
+    assert test_statistics.shape == (5,)
+    for k in range(6):
+        assert pytest.approx(_NJk(k)(f)) == estimates[k]
+        assert pytest.approx(_seNjk(k)(f)) == standard_errors[k]
+    for k in range(5):
+        assert pytest.approx(_Tk(k)(f)) == test_statistics[k]
+
+
+def test_jackknife_mark_recapture_estimate_batch():
+    fs = np.array(
+        [
+            [43, 16, 8, 6, 0, 2, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+            [20, 10, 6, 4, 2, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+            [5, 8, 10, 9, 7, 4, 2, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+        ],
+    )
+    estimates, cis = jackknife_mark_recapture_estimate(fs)
+    assert estimates.shape == (3,)
+    assert cis.shape == (3, 2)
+
+    for f, estimate, ci in zip(fs, estimates, cis):
+        expected_estimate, expected_ci = jackknife_mark_recapture_estimate(f)
+        assert estimate == pytest.approx(expected_estimate)
+        assert np.allclose(ci, expected_ci, equal_nan=True)
+
+
+def test_jackknife_mark_recapture_estimate_degenerate():
+    # all individuals captured once, so no test between orders is possible
+    f = [10, 0, 0, 0, 0]
+    est, ci = jackknife_mark_recapture_estimate(f)
+    assert est == 10
+    assert np.isnan(ci).all()
+
+
+def test_jackknife_mark_recapture_estimate_interpolated():
+    f = [43, 16, 8, 6, 0, 2, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
+
+    # first non-rejected order is 3, so interpolates between orders 2 and 3
+    est, ci = jackknife_mark_recapture_estimate(f, selection="interpolated")
+    weight = 1.96 / _Tk(2)(f)
+    assert 0 < weight < 1
+    expected = (1 - weight) * _NJk(2)(f) + weight * _NJk(3)(f)
+    assert est == pytest.approx(expected)
+    assert _NJk(2)(f) < est < _NJk(3)(f)
+    assert ci[0] < est < ci[1]
+    assert ci[1] - ci[0] < _95CIk(3)(f)[1] - _95CIk(3)(f)[0]
+
+
+def test_jackknife_mark_recapture_estimate_interpolated_batch():
+    fs = np.array(
+        [
+            [43, 16, 8, 6, 0, 2, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+            [20, 10, 6, 4, 2, 1, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+            [5, 8, 10, 9, 7, 4, 2, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+            [10, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+        ],
+    )
+    estimates, cis = jackknife_mark_recapture_estimate(
+        fs, selection="interpolated"
+    )
+    assert estimates.shape == (4,)
+    assert cis.shape == (4, 2)
+
+    for f, estimate, ci in zip(fs, estimates, cis):
+        expected_estimate, expected_ci = jackknife_mark_recapture_estimate(
+            f, selection="interpolated"
+        )
+        assert estimate == pytest.approx(expected_estimate)
+        assert np.allclose(ci, expected_ci, equal_nan=True)
+
+    # no interpolation below order zero
+    assert estimates[-1] == 10
+    assert np.isnan(cis[-1]).all()
+
+
+def test_jackknife_mark_recapture_estimate_bad_selection():
+    with pytest.raises(ValueError):
+        jackknife_mark_recapture_estimate([5, 2, 1], selection="nope")
@@ -0,0 +1,36 @@
+import numpy as np
+from scipy import stats as scipy_stats
+
+from pylib.auxlib._nbinom_cdf import nbinom_cdf
+from pylib.auxlib._nbinom_cdf_grid import nbinom_cdf_grid
+
+
+def test_nbinom_cdf_grid_scalar():
+    assert np.isclose(nbinom_cdf_grid(10, 3, 0.5), nbinom_cdf(10, 3, 0.5))
+    assert np.isclose(nbinom_cdf_grid(15, 5, 0.3), nbinom_cdf(15, 5, 0.3))
+    assert isinstance(nbinom_cdf_grid(15, 5, 0.3), float)
+
+
+def test_nbinom_cdf_grid_matches_scipy():
+    trials = np.array([0, 1, 5, 50, 100, 400, 1000, 5000])
+    successes = np.concatenate([np.arange(1, 101), [2.5, 17.3, 99.9]])
+    probs = np.concatenate([np.linspace(0.01, 1.0, 100), [1e-6, 0.999]])
+
+    actual = nbinom_cdf_grid(
+        trials[:, None, None], successes[None, :, None], probs[None, None, :]
+    )
+    expected = scipy_stats.nbinom.cdf(
+        trials[:, None, None] - successes[None, :, None],
+        successes[None, :, None],
+        probs[None, None, :],
+    )
+    assert actual.shape == (len(trials), len(successes), len(probs))
+    assert np.allclose(actual, expected, rtol=1e-10, atol=1e-12)
+
+
+def test_nbinom_cdf_grid_invalid():
+    expected = scipy_stats.nbinom.cdf(
+        [3, 3, 3, -1], [0, 2, 2, 2], [0.5, 0.0, 1.5, 0.5]
+    )
+    actual = nbinom_cdf_grid([3, 5, 5, 1], [0, 2, 2, 2], [0.5, 0.0, 1.5, 0.5])
+    assert np.array_equal(actual, expected, equal_nan=True)
@@ -0,0 +1,15 @@
+import numpy as np
+
+from pylib.auxlib._or_global_rng import or_global_rng
+
+
+def test_or_global_rng_default():
+    np.random.seed(1)
+    expected = np.random.permutation(10)
+    np.random.seed(1)
+    assert np.array_equal(or_global_rng(None).permutation(10), expected)
+
+
+def test_or_global_rng_generator():
+    rng = np.random.default_rng(1)
+    assert or_global_rng(rng) is rng
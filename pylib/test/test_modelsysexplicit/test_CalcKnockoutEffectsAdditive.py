@@ -38,3 +38,55 @@ def test_CalcKnockoutEffectsAdditive_empty():
     knockout = np.array([])
     calc = CalcKnockoutEffectsAdditive(additive_array)
     assert calc(knockout) == 0
+
+
+def test_CalcKnockoutEffectsAdditive_call_batch():
+    additive_array = np.array([0.1, -0.2, 0.0, 0.3])
+    knockouts = np.array(
+        [[1, 0, 1, 1], [0, 0, 0, 0], [1, 1, 1, 1]],
+        dtype=bool,
+    )
+    calc = CalcKnockoutEffectsAdditive(additive_array)
+    result = calc.call_batch(knockouts)
+    assert result.shape == (3,)
+    assert np.allclose(result, [calc(knockout) for knockout in knockouts])
+
+
+def test_CalcKnockoutEffectsAdditive_stores_effect_sites():
+    additive_array = np.array([0.1, -0.2, 0.0, 0.3, 0.0])
+    calc = CalcKnockoutEffectsAdditive(additive_array)
+    assert np.array_equal(calc._effect_sites, [0, 1, 3])
+    assert np.array_equal(calc._effect_sizes, [0.1, -0.2, 0.3])
+
+
+def test_CalcKnockoutEffectsAdditive_call_batch_sites():
+    additive_array = np.array([0.1, -0.2, 0.0, 0.3, 0.0])
+    calc = CalcKnockoutEffectsAdditive(additive_array)
+    knockout_sites = [
+        np.array([0, 3]),
+        np.array([], dtype=int),
+        np.array([4, 2]),
+        np.array([1, 4, 0]),
+    ]
+    result = calc.call_batch_sites(knockout_sites)
+    assert np.allclose(result, [0.4, 0.0, 0.0, -0.1])
+    assert len(calc.call_batch_sites([])) == 0
+
+    masks = np.zeros((len(knockout_sites), 5), dtype=bool)
+    for mask, sites in zip(masks, knockout_sites):
+        mask[sites] = True
+    assert np.allclose(result, calc.call_batch(masks))
+
+
+def test_CalcKnockoutEffectsAdditive_call_batch_sites_empty():
+    calc = CalcKnockoutEffectsAdditive(np.zeros(3))
+    assert np.array_equal(
+        calc.call_batch_sites([np.array([0, 2]), np.array([1])]), [0.0, 0.0]
+    )
+
+
+def test_CalcKnockoutEffectsAdditive_call_sites():
+    additive_array = np.array([0.1, -0.2, 0.0, 0.3, 0.0])
+    calc = CalcKnockoutEffectsAdditive(additive_array)
+    assert calc.call_sites(np.array([0, 3, 4])) == pytest.approx(0.4)
+    assert calc.call_sites(np.array([], dtype=int)) == 0.0
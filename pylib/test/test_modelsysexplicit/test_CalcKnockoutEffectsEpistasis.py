@@ -1,4 +1,5 @@
 import numpy as np
+from scipy import sparse as scipy_sparse
 
 from pylib.modelsys_explicit import CalcKnockoutEffectsEpistasis
 
@@ -63,3 +64,75 @@ def test_zero_epistasis_matrix():
     instance = CalcKnockoutEffectsEpistasis(matrix, 1)
     knockout = np.array([1, 1])
     assert instance(knockout) == 0.0
+
+
+def test_knockout_effect_call_batch():
+    matrix = np.array([[1, 1, 0, 2], [2, 0, 0, 0]])
+    instance = CalcKnockoutEffectsEpistasis(matrix, 2)
+    instance._effect_size = np.array([3.0, 1.0])
+    knockouts = np.array(
+        [
+            [1, 1, 0, 0],
+            [1, 1, 0, 1],
+            [0, 1, 0, 1],
+            [0, 0, 0, 0],
+            [1, 0, 1, 1],
+            [1, 1, 1, 1],
+        ],
+    )
+    result = instance.call_batch(knockouts)
+    assert np.array_equal(result, [3.0, 4.0, 0.0, 0.0, 1.0, 4.0])
+    assert np.array_equal(
+        result, [instance(knockout) for knockout in knockouts]
+    )
+
+
+def test_zero_epistasis_matrix_call_batch():
+    matrix = np.zeros((2, 2))
+    instance = CalcKnockoutEffectsEpistasis(matrix, 1)
+    knockouts = np.array([[1, 1], [0, 1]])
+    assert np.array_equal(instance.call_batch(knockouts), [0.0, 0.0])
+
+
+def test_set_incidence():
+    matrix = np.array([[1, 1, 0, 2], [2, 0, 0, 0]])
+    instance = CalcKnockoutEffectsEpistasis(matrix, 2)
+    assert np.array_equal(
+        instance._set_incidence.toarray(),
+        [[1, 1, 0, 0], [1, 0, 0, 1]],
+    )
+
+
+def test_sparse_epistasis_matrix():
+    matrix = np.array([[1, 1, 0, 2], [2, 0, 0, 0]])
+    incidence = scipy_sparse.csr_matrix(
+        [[1, 1, 0, 0], [0, 0, 0, 0], [1, 0, 0, 1]],  # empty set dropped
+    )
+    dense_instance = CalcKnockoutEffectsEpistasis(matrix)
+    sparse_instance = CalcKnockoutEffectsEpistasis(incidence)
+    assert sparse_instance._effect_thresh == dense_instance._effect_thresh
+    assert np.array_equal(
+        sparse_instance._set_incidence.toarray(),
+        dense_instance._set_incidence.toarray(),
+    )
+    knockouts = np.random.rand(20, 4) < 0.5
+    assert np.array_equal(
+        sparse_instance.call_batch(knockouts),
+        dense_instance.call_batch(knockouts),
+    )
+
+
+def test_knockout_effect_call_sites():
+    matrix = np.array([[1, 1, 0, 2], [2, 0, 0, 0]])
+    instance = CalcKnockoutEffectsEpistasis(matrix, 2)
+    instance._effect_size = np.array([3.0, 1.0])
+    for knockout in np.array(
+        [[1, 1, 0, 0], [1, 1, 0, 1], [0, 1, 0, 1], [0, 0, 0, 0]],
+        dtype=bool,
+    ):
+        assert instance.call_sites(np.flatnonzero(knockout)) == instance(
+            knockout
+        )
+
+    instance = CalcKnockoutEffectsEpistasis(np.zeros((2, 2)), 1)
+    assert instance.call_sites(np.array([0, 1])) == 0.0
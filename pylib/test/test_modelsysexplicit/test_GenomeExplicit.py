@@ -1,7 +1,14 @@
 import numpy as np
 import pytest
 
-from pylib.modelsys_explicit import GenomeExplicit
+from pylib.auxlib._KnockoutMask import KnockoutMask
+from pylib.modelsys_explicit import (
+    CalcKnockoutEffectsAdditive,
+    CalcKnockoutEffectsEpistasis,
+    GenomeExplicit,
+    create_additive_array,
+    create_epistasis_matrix_overlapping,
+)
 
 
 def test_GenomeExplicit_initialization():
@@ -76,3 +83,89 @@ def test_GenomeExplicit_test_artifact():
     knockout_array = np.array([1, 1, 0, 0], dtype=bool)
     result = genome.test_knockout(knockout_array)
     assert result == 0
+
+
+def test_GenomeExplicit_test_knockouts_matches_test_knockout():
+    num_sites = 100
+    genome = GenomeExplicit(
+        [
+            CalcKnockoutEffectsAdditive(create_additive_array(num_sites, 0.1)),
+            CalcKnockoutEffectsEpistasis(
+                create_epistasis_matrix_overlapping(num_sites, 10, 4),
+            ),
+            lambda knockout: knockout[0] * 0.5,  # no batch support
+        ],
+        [lambda effect: effect * 2],
+    )
+
+    knockouts = np.random.rand(50, num_sites) < 0.1
+    result = genome.test_knockouts(knockouts)
+    assert result.shape == (len(knockouts),)
+    for knockout, knockout_result in zip(knockouts, result):
+        assert np.isclose(genome.test_knockout(knockout), knockout_result)
+
+
+def test_GenomeExplicit_test_knockouts_artifact():
+    def effect_functor(knockout: np.array) -> float:
+        return 1
+
+    def artifact_functor(effect: np.array) -> float:
+        return 0.5
+
+    genome = GenomeExplicit([effect_functor], [artifact_functor])
+
+    knockouts = np.array([[1, 1, 0, 0], [0, 0, 0, 0]], dtype=bool)
+    result = genome.test_knockouts(knockouts)
+    assert np.array_equal(result, [0, 0])
+
+
+def test_GenomeExplicit_test_knockouts_empty():
+    genome = GenomeExplicit([lambda knockout: 1.0])
+
+    knockouts = np.zeros((0, 4), dtype=bool)
+    result = genome.test_knockouts(knockouts)
+    assert result.shape == (0,)
+
+
+def test_GenomeExplicit_test_knockouts_bad_shape():
+    genome = GenomeExplicit([lambda knockout: 1.0])
+
+    with pytest.raises(ValueError):
+        genome.test_knockouts(np.array([1, 1, 0, 0], dtype=bool))
+
+
+def test_GenomeExplicit_test_knockout_packed():
+    num_sites = 100
+    genome = GenomeExplicit(
+        [
+            CalcKnockoutEffectsAdditive(create_additive_array(num_sites, 0.1)),
+            CalcKnockoutEffectsEpistasis(
+                create_epistasis_matrix_overlapping(num_sites, 10, 4),
+            ),
+        ],
+    )
+    for knockout in np.random.rand(20, num_sites) < 0.1:
+        packed = KnockoutMask.from_array(knockout)
+        assert genome.test_knockout(packed) == genome.test_knockout(knockout)
+
+
+def test_GenomeExplicit_test_knockout_packed_without_unpacking(monkeypatch):
+    num_sites = 1000
+    genome = GenomeExplicit(
+        [
+            CalcKnockoutEffectsAdditive(create_additive_array(num_sites, 0.1)),
+            CalcKnockoutEffectsEpistasis(
+                create_epistasis_matrix_overlapping(num_sites, 10, 4),
+            ),
+        ],
+    )
+    knockouts = np.random.rand(20, num_sites) < 0.01
+    expected = [genome.test_knockout(knockout) for knockout in knockouts]
+
+    def fail_unpack(*args, **kwargs):
+        raise AssertionError("KnockoutMask was unpacked.")
+
+    monkeypatch.setattr(KnockoutMask, "__array__", fail_unpack)
+    for knockout, result in zip(knockouts, expected):
+        packed = KnockoutMask.from_array(knockout)
+        assert genome.test_knockout(packed) == result
@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+from pylib.modelsys_explicit import (
+    CalcKnockoutEffectsAdditive,
+    CalcKnockoutEffectsEpistasis,
+    GenomeExplicit,
+    IncrementalKnockoutEvaluator,
+    create_additive_array,
+    create_epistasis_matrix_overlapping,
+)
+
+
+def make_genome(num_sites: int) -> GenomeExplicit:
+    return GenomeExplicit(
+        [
+            CalcKnockoutEffectsAdditive(
+                create_additive_array(
+                    num_sites, 0.1, lambda x: np.random.rand(x) * 0.4
+                ),
+            ),
+            CalcKnockoutEffectsEpistasis(
+                create_epistasis_matrix_overlapping(num_sites, 10, 3),
+                effect_size=(0.5, 1.5),
+            ),
+            lambda knockout: knockout[:3].sum() * 0.3,  # no incremental
+        ],
+    )
+
+
+def test_IncrementalKnockoutEvaluator_test_extension():
+    num_sites = 50
+    genome = make_genome(num_sites)
+    base = np.random.rand(num_sites) < 0.3
+    evaluator = genome.make_incremental_evaluator(base)
+    assert isinstance(evaluator, IncrementalKnockoutEvaluator)
+    assert np.isclose(evaluator.test(), genome.test_knockout(base))
+
+    for site in np.flatnonzero(~base):
+        knockout = base.copy()
+        knockout[site] = True
+        assert np.isclose(
+            evaluator.test_extension(site), genome.test_knockout(knockout)
+        )
+    assert np.array_equal(evaluator.knockout, base)
+
+
+def test_IncrementalKnockoutEvaluator_commit_rollback():
+    num_sites = 50
+    genome = make_genome(num_sites)
+    evaluator = genome.make_incremental_evaluator(num_sites=num_sites)
+    expected = np.zeros(num_sites, dtype=bool)
+
+    for step, site in enumerate(np.random.permutation(num_sites)):
+        evaluator.extend(site)
+        if step % 3:
+            evaluator.commit()
+            expected[site] = True
+        else:
+            evaluator.rollback()
+        assert np.array_equal(evaluator.knockout, expected)
+        assert np.isclose(evaluator.test(), genome.test_knockout(expected))
+
+
+def test_IncrementalKnockoutEvaluator_already_knocked_out():
+    genome = make_genome(10)
+    evaluator = genome.make_incremental_evaluator(num_sites=10)
+    evaluator.extend(3)
+    with pytest.raises(ValueError):
+        evaluator.test_extension(3)
+    with pytest.raises(ValueError):
+        evaluator.extend(3)
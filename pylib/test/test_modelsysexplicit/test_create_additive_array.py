@@ -36,3 +36,10 @@ def test_edge_cases():
     assert len(create_additive_array(0, 0.5)) == 0
     assert len(create_additive_array(1, 0.5)) == 1
     assert len(create_additive_array(1, 1)) == 1
+
+
+def test_create_additive_array_rng():
+    result1 = create_additive_array(100, 0.1, rng=np.random.default_rng(1))
+    result2 = create_additive_array(100, 0.1, rng=np.random.default_rng(1))
+    assert np.array_equal(result1, result2)
+    assert np.count_nonzero(result1) == 10
@@ -42,3 +42,24 @@ def test_create_epistasis_matrix_empty():
     )
     assert isinstance(matrix, np.ndarray)
     assert matrix.sum() == 0
+
+
+def test_create_epistasis_matrix_disjoint_rng():
+    matrix1 = create_epistasis_matrix_disjoint(
+        20, 3, 4, rng=np.random.default_rng(1)
+    )
+    matrix2 = create_epistasis_matrix_disjoint(
+        20, 3, 4, rng=np.random.default_rng(1)
+    )
+    assert np.array_equal(matrix1, matrix2)
+
+
+def test_create_epistasis_matrix_disjoint_sparse():
+    dense = create_epistasis_matrix_disjoint(
+        20, 3, 4, rng=np.random.default_rng(1)
+    )
+    sparse = create_epistasis_matrix_disjoint(
+        20, 3, 4, rng=np.random.default_rng(1), sparse=True
+    )
+    assert sparse.shape == (3, 20)
+    assert np.array_equal((np.arange(1, 4) @ sparse.toarray())[None, :], dense)
@@ -43,3 +43,28 @@ def test_create_epistasis_matrix_empty():
     )
     assert isinstance(matrix, np.ndarray)
     assert matrix.sum() == 0
+
+
+def test_create_epistasis_matrix_overlapping_rng():
+    matrix1 = create_epistasis_matrix_overlapping(
+        10, 3, 4, rng=np.random.default_rng(1)
+    )
+    matrix2 = create_epistasis_matrix_overlapping(
+        10, 3, 4, rng=np.random.default_rng(1)
+    )
+    assert np.array_equal(matrix1, matrix2)
+
+
+def test_create_epistasis_matrix_overlapping_sparse():
+    dense = create_epistasis_matrix_overlapping(
+        20, 6, 4, rng=np.random.default_rng(1)
+    )
+    sparse = create_epistasis_matrix_overlapping(
+        20, 6, 4, rng=np.random.default_rng(1), sparse=True
+    )
+    assert sparse.shape == (6, 20)
+    assert np.array_equal(sparse.sum(axis=1).A.ravel(), [4] * 6)
+    for set_id, row in enumerate(sparse.toarray(), start=1):
+        assert np.array_equal(
+            np.flatnonzero(row), np.flatnonzero((dense == set_id).any(axis=0))
+        )
@@ -1,5 +1,6 @@
 import numpy as np
 import pandas as pd
+from scipy import sparse as scipy_sparse
 
 from pylib.modelsys_explicit import describe_epistasis_matrix
 
@@ -42,3 +43,14 @@ def test_describe_epistasis_matrix_empty():
     )
     print(result)
     pd.testing.assert_frame_equal(result, expected)
+
+
+def test_describe_epistasis_matrix_sparse():
+    epistasis_matrix = np.array([[1, 1, 0, 0], [2, 0, 2, 0]])
+    incidence = scipy_sparse.csr_matrix(
+        [[1, 1, 0, 0], [1, 0, 1, 0]],
+    )
+    pd.testing.assert_frame_equal(
+        describe_epistasis_matrix(incidence),
+        describe_epistasis_matrix(epistasis_matrix),
+    )